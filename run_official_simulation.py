@@ -9,14 +9,16 @@ a detailed statistics table with win rates.
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from cosmic.simulation.runner import Simulator
+from cosmic.simulation.result_cache import GameResultCache
 from cosmic.types import GameConfig, SimulationConfig
+from cosmic.utils.seeding import derive_seed
 from cosmic.aliens import AlienRegistry
 from cosmic.aliens.official_aliens import (
     is_official_alien,
@@ -68,7 +70,6 @@ class OfficialAlienStats:
 
 def get_official_powers() -> List[str]:
     """Get list of official alien power names that are registered."""
-    registered = set(AlienRegistry.get_names())
     official = []
 
     for alien in get_all_official_aliens():
@@ -82,25 +83,31 @@ def get_official_powers() -> List[str]:
         ]
 
         for name in names_to_check:
-            if name in registered:
-                official.append(name)
-                break
-            # Case-insensitive check
-            for reg_name in registered:
-                if reg_name.lower() == name.lower():
-                    official.append(reg_name)
+            # Registry lookup is case-insensitive; an exact match ends the search
+            power = AlienRegistry.get(name)
+            if power is not None:
+                official.append(power.name)
+                if power.name == name:
                     break
 
-    return list(set(official))
+    # Deduplicate in registry order; set order varies with the hash seed,
+    # which would change seeded lineups (and cache keys) between runs
+    return list(dict.fromkeys(official))
 
 
 def run_simulations(
     games_per_player_count: int = 5000,
     player_counts: List[int] = [2, 3, 4, 5, 6],
+    workers: int = 1,
+    seed: Optional[int] = None,
+    cache: Optional[GameResultCache] = None,
 ) -> Dict[str, OfficialAlienStats]:
     """
     Run simulations for official aliens across player counts.
 
+    With a seed, each player count's run is reproducible, and a cache
+    lets a rerun read previously played games from disk.
+
     Returns dict mapping alien name to OfficialAlienStats.
     """
     # Get official powers that are registered
@@ -137,15 +144,19 @@ def run_simulations(
 
         config = SimulationConfig(
             num_games=games_per_player_count,
-            game_config=GameConfig(num_players=player_count),
+            game_config=GameConfig(
+                num_players=player_count,
+                seed=None if seed is None else derive_seed(seed, player_count),
+            ),
             show_progress=False,
             catch_errors=True,
+            workers=workers,
         )
 
         # Set powers to test to only official ones
         config.powers_to_test = official_powers
 
-        simulator = Simulator(config=config)
+        simulator = Simulator(config=config, cache=cache)
         result = simulator.run()
 
         # Extract per-alien results
@@ -167,6 +178,8 @@ def run_simulations(
     total_time = time.time() - start_time
     print(f"\nTotal time: {total_time:.1f}s")
     print(f"Overall speed: {games_completed/total_time:.0f} games/s")
+    if cache is not None:
+        print(cache.summary())
 
     return alien_stats
 
@@ -299,6 +312,28 @@ def main():
         default=6,
         help="Maximum player count (default: 6)"
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Random seed for reproducibility"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Directory for the game result cache (reused across runs with the same --seed)"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=256,
+        help="Maximum size of the game result cache in MB (default: 256)"
+    )
 
     args = parser.parse_args()
 
@@ -308,10 +343,17 @@ def main():
     print("COSMIC ENCOUNTER OFFICIAL ALIEN SIMULATION")
     print("=" * 60)
 
+    cache = None
+    if args.cache_dir:
+        cache = GameResultCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
     # Run simulations
     stats = run_simulations(
         games_per_player_count=args.games_per_count,
         player_counts=player_counts,
+        workers=args.workers,
+        seed=args.seed,
+        cache=cache,
     )
 
     if not stats:
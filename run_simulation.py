@@ -64,6 +64,25 @@ def main():
         type=int,
         help="Random seed for reproducibility"
     )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel workers (default: 1)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["process", "thread"],
+        default="process",
+        help="Parallel backend; use thread on free-threaded Python builds (default: process)"
+    )
+    parser.add_argument(
+        "--aggregation",
+        choices=["merge", "shared_memory"],
+        default="merge",
+        help="How parallel workers report statistics: merge pickled per-chunk "
+             "results, or count into shared memory (default: merge)"
+    )
 
     args = parser.parse_args()
 
@@ -87,6 +106,9 @@ def main():
         game_config=game_config,
         show_progress=not args.quiet,
         progress_interval=max(1, args.num_games // 20),
+        workers=args.workers,
+        backend=args.backend,
+        aggregation=args.aggregation,
     )
 
     simulator = Simulator(config=sim_config)
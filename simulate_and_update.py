@@ -8,6 +8,19 @@ This script:
 3. Updates the cumulative statistics
 4. Regenerates the README table
 5. Saves the updated statistics
+
+With --ledger, every game is also stored in a per-game ledger tagged with
+fingerprints of the engine and of the aliens that played. After editing
+an alien, --refresh re-simulates only the games that alien took part in
+and rebuilds the cumulative statistics from the ledger. It refuses to run
+if the statistics hold games the ledger does not.
+
+With --queue, a batch is spread over any number of processes and hosts
+sharing a filesystem:
+
+    simulate_and_update.py --queue batch.db --queue-role create -n 10000000 --seed 1
+    simulate_and_update.py --queue batch.db --queue-role work     # on every host
+    simulate_and_update.py --queue batch.db --queue-role reduce   # once all units are done
 """
 
 import argparse
@@ -19,10 +32,13 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from cosmic.game import Game
 from cosmic.types import GameConfig
 from cosmic.aliens import AlienRegistry
 from cosmic.simulation.cumulative_stats import CumulativeStats
+from cosmic.simulation.result_cache import GameResultCache
+from cosmic.simulation.ledger import GameLedger
+from cosmic.simulation.runner import play_game, play_game_cached
+from cosmic.simulation.work_queue import WorkQueue, run_worker, DEFAULT_UNIT_SIZE
 
 
 STATS_FILE = "cumulative_stats.json"
@@ -39,11 +55,17 @@ def run_simulation_batch(
     min_players: int = 3,
     max_players: int = 6,
     show_progress: bool = True,
-    seed: int = None
+    seed: int = None,
+    cache: GameResultCache = None,
+    ledger: GameLedger = None
 ) -> int:
     """
     Run a batch of simulations and record to cumulative stats.
 
+    With a cache, games already played with the same config, lineup and
+    seed (e.g. a rerun with the same --seed) are read from disk. With a
+    ledger, every completed game is also appended to it.
+
     Returns number of games completed successfully.
     """
     rng = random.Random(seed)
@@ -59,35 +81,32 @@ def run_simulation_batch(
             num_players = rng.randint(min_players, max_players)
 
             # Create game
+            game_seed = rng.randint(0, 2**31)
             game_config = GameConfig(
                 num_players=num_players,
-                seed=rng.randint(0, 2**31),
+                seed=game_seed,
             )
-            game = Game(config=game_config)
 
             # Select random powers
             powers = rng.sample(all_powers, min(len(all_powers), num_players))
 
-            # Play game
-            game.setup(powers=powers)
-            winners = game.play()
+            # Play game (or read its outcome from the cache)
+            if cache is None:
+                record = play_game(game_config, powers)
+            else:
+                record = play_game_cached(cache, game_config, powers)
 
             # Record to cumulative stats
-            winner_names = [w.name for w in winners]
-            alien_map = {p.name: p.alien_name for p in game.players}
-            final_colonies = {
-                p.name: p.count_foreign_colonies(game.planets)
-                for p in game.players
-            }
-
             cumulative_stats.record_game(
-                alien_map=alien_map,
-                winner_names=winner_names,
-                final_colonies=final_colonies,
-                turn_count=game.current_turn,
+                alien_map=record.alien_map,
+                winner_names=record.winners,
+                final_colonies=record.final_colonies,
+                turn_count=record.turn_count,
                 num_players=num_players,
-                timed_out=game.current_turn >= game_config.max_turns,
+                timed_out=record.timed_out,
             )
+            if ledger is not None:
+                ledger.add(num_players, game_seed, powers, record)
 
             games_completed += 1
 
@@ -109,10 +128,96 @@ def run_simulation_batch(
         print(f"\nBatch complete: {games_completed} games in {elapsed:.1f}s")
         if errors > 0:
             print(f"  Errors: {errors}")
+        if cache is not None:
+            print(f"  {cache.summary()}")
 
     return games_completed
 
 
+def refresh_from_ledger(
+    cumulative_stats: CumulativeStats,
+    ledger: GameLedger,
+    show_progress: bool = True
+) -> CumulativeStats:
+    """
+    Re-simulate stale ledger games and apply their new outcomes to the stats.
+
+    Only games whose engine or alien fingerprints changed are replayed.
+    With nothing stale the stats are returned unchanged. Otherwise they
+    are rebuilt in ledger order, because ELO depends on the order games
+    are recorded in; that replays the existing games exactly, with the
+    stale ones' new outcomes in place.
+
+    Raises:
+        ValueError: If the stats hold games the ledger does not (games
+            recorded before the ledger existed), which a rebuild would drop
+    """
+    recorded = ledger.recorded_games()
+    if cumulative_stats.total_games != recorded:
+        raise ValueError(
+            f"Cumulative stats hold {cumulative_stats.total_games:,} games but the ledger "
+            f"records {recorded:,}; refreshing would drop the games missing from the "
+            f"ledger. Start both afresh with --reset to use --refresh."
+        )
+
+    start_time = time.time()
+    stale = ledger.refresh()
+    elapsed = time.time() - start_time
+
+    if show_progress:
+        print(f"  Re-simulated {len(stale)}/{len(ledger)} games in {elapsed:.1f}s")
+
+    if not stale:
+        return cumulative_stats
+    return ledger.to_cumulative_stats(simulation_runs=cumulative_stats.simulation_runs)
+
+
+def create_queue(args) -> int:
+    """Split a batch into work units in a shared queue file."""
+    queue = WorkQueue.create(
+        args.queue,
+        num_games=args.num_games,
+        master_seed=args.seed,
+        min_players=args.min_players,
+        max_players=args.max_players,
+        unit_size=args.unit_size,
+        lease_seconds=args.lease_seconds,
+    )
+    progress = queue.progress()
+    print(f"Created {args.queue}: {args.num_games:,} games in {progress['total']:,} units")
+    print(f"Master seed: {queue.master_seed}")
+    queue.close()
+    return 0
+
+
+def run_queue_worker(args, cache: GameResultCache = None) -> int:
+    """Play units from a shared queue file until it is finished."""
+    def play(game_config, powers):
+        if cache is None:
+            return play_game(game_config, powers)
+        return play_game_cached(cache, game_config, powers)
+
+    def report(unit, progress):
+        if not args.quiet:
+            print(
+                f"  Unit {unit.id} done (games {unit.first_index}-"
+                f"{unit.first_index + unit.num_games - 1}); "
+                f"{progress['done']}/{progress['total']} units complete"
+            )
+
+    start_time = time.time()
+    units = run_worker(
+        args.queue,
+        play=play,
+        lease_seconds=args.lease_seconds,
+        progress_callback=report,
+    )
+    print(f"\nWorker finished {units} units in {time.time() - start_time:.1f}s")
+    if cache is not None:
+        print(f"  {cache.summary()}")
+    return 0
+
+
 def update_readme(cumulative_stats: CumulativeStats, readme_path: str = README_FILE):
     """Update the README with the latest statistics table."""
     readme = Path(readme_path)
@@ -187,6 +292,51 @@ def main():
         type=int,
         help="Random seed for reproducibility"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Directory for the game result cache (reused across runs with the same --seed)"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=256,
+        help="Maximum size of the game result cache in MB (default: 256)"
+    )
+    parser.add_argument(
+        "--ledger",
+        type=str,
+        help="Per-game ledger file (JSON lines) enabling --refresh"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-simulate ledger games whose aliens or engine changed and "
+             "rebuild stats from the ledger (use -n 0 to only refresh)"
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        help="Shared work queue file (SQLite) for spreading a batch over many hosts"
+    )
+    parser.add_argument(
+        "--queue-role",
+        choices=["create", "work", "reduce"],
+        help="create: split -n games into units; work: play units; "
+             "reduce: record finished units into the cumulative stats"
+    )
+    parser.add_argument(
+        "--unit-size",
+        type=int,
+        default=DEFAULT_UNIT_SIZE,
+        help=f"Games per work unit (default: {DEFAULT_UNIT_SIZE})"
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=300.0,
+        help="Seconds before an unfinished unit is re-issued (default: 300)"
+    )
     parser.add_argument(
         "--no-update-readme",
         action="store_true",
@@ -200,6 +350,21 @@ def main():
 
     args = parser.parse_args()
 
+    if args.refresh and not args.ledger:
+        parser.error("--refresh requires --ledger")
+    if bool(args.queue) != bool(args.queue_role):
+        parser.error("--queue and --queue-role must be used together")
+
+    if args.queue_role == "create":
+        return create_queue(args)
+
+    cache = None
+    if args.cache_dir:
+        cache = GameResultCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
+    if args.queue_role == "work":
+        return run_queue_worker(args, cache)
+
     print("=" * 60)
     print("COSMIC ENCOUNTER SIMULATOR - Cumulative Statistics")
     print("=" * 60)
@@ -215,17 +380,51 @@ def main():
         else:
             print("\nStarting fresh statistics")
 
+    ledger = None
+    if args.ledger:
+        ledger = GameLedger() if args.reset else GameLedger.load(args.ledger)
+
+    # Record a finished work queue
+    if args.queue_role == "reduce":
+        queue = WorkQueue(args.queue)
+        try:
+            recorded = queue.reduce(cumulative_stats, ledger)
+        except ValueError as e:
+            print(f"\n{e}")
+            return 1
+        finally:
+            queue.close()
+        print(f"\nRecorded {recorded:,} games from {args.queue}")
+
+    # Refresh games made stale by code changes
+    if args.refresh:
+        print(f"\nRefreshing {len(ledger):,} ledger games...")
+        try:
+            cumulative_stats = refresh_from_ledger(
+                cumulative_stats, ledger, show_progress=not args.quiet
+            )
+        except ValueError as e:
+            print(f"  {e}")
+            return 1
+
     # Run simulation batch
-    print(f"\nRunning {args.num_games} games ({args.min_players}-{args.max_players} players)...")
+    if args.num_games > 0 and not args.queue:
+        print(f"\nRunning {args.num_games} games ({args.min_players}-{args.max_players} players)...")
+
+        run_simulation_batch(
+            cumulative_stats,
+            num_games=args.num_games,
+            min_players=args.min_players,
+            max_players=args.max_players,
+            show_progress=not args.quiet,
+            seed=args.seed,
+            cache=cache,
+            ledger=ledger,
+        )
 
-    games = run_simulation_batch(
-        cumulative_stats,
-        num_games=args.num_games,
-        min_players=args.min_players,
-        max_players=args.max_players,
-        show_progress=not args.quiet,
-        seed=args.seed,
-    )
+    if ledger is not None:
+        ledger.save(args.ledger)
+        print(f"\nSaved {len(ledger):,} games to ledger {args.ledger}")
 
     # Save updated stats
     cumulative_stats.save(STATS_FILE)
@@ -221,7 +221,7 @@ class AIStrategy(ABC):
         """
         # Default: play reinforcements if losing
         from ..cards.base import ReinforcementCard
-        reinforcements = [c for c in player.hand if isinstance(c, ReinforcementCard)]
+        reinforcements = player.get_cards_of_type(ReinforcementCard)
 
         if not reinforcements:
             return []
@@ -278,7 +278,7 @@ class AIStrategy(ABC):
         """
         from ..cards.base import KickerCard
 
-        kickers = [c for c in player.hand if isinstance(c, KickerCard)]
+        kickers = player.get_cards_of_type(KickerCard)
         if not kickers:
             return None
 
@@ -476,7 +476,7 @@ class AIStrategy(ABC):
         from ..cards.base import ArtifactCard
 
         # Get artifact cards in hand
-        artifacts = [c for c in player.hand if isinstance(c, ArtifactCard)]
+        artifacts = player.get_cards_of_type(ArtifactCard)
         if not artifacts:
             return None
 
@@ -514,7 +514,7 @@ class AIStrategy(ABC):
         from ..cards.base import FlareCard
 
         # Get flare cards in hand
-        flares = [c for c in player.hand if isinstance(c, FlareCard)]
+        flares = player.get_cards_of_type(FlareCard)
         if not flares:
             return None
 
@@ -584,3 +584,15 @@ class AIStrategy(ABC):
         ship_score = min(1.0, ships_in_play / 20.0)
 
         return (colony_score * 0.5) + (hand_score * 0.3) + (ship_score * 0.2)
+
+    def set_seed(self, seed: int) -> None:
+        """
+        Set random seed for reproducibility.
+
+        The game seeds each seat's AI from its own seed stream before play.
+        Strategies keep their randomness in a ``_rng`` attribute; strategies
+        without one are deterministic and ignore the seed.
+        """
+        rng = getattr(self, "_rng", None)
+        if rng is not None:
+            rng.seed(seed)
@@ -56,16 +56,14 @@ class BasicAI(AIStrategy):
         if is_offense:
             # Offense: Play highest attack card
             if attack_cards:
-                return max(attack_cards, key=lambda c: c.value)
+                return player.select_highest_attack()
             # Fallback to negotiate
             return any_encounter_card()
         else:
             # Defense: Play 3rd highest (save top 2 for offense)
             if attack_cards:
-                # Sort and get 3rd highest (or lowest if fewer than 3)
-                sorted_attacks = sorted(attack_cards, key=lambda c: c.value, reverse=True)
-                idx = min(2, len(sorted_attacks) - 1)  # 0-indexed, so 3rd = index 2
-                return sorted_attacks[idx]
+                # 3rd highest (or lowest if fewer than 3)
+                return player.select_nth_highest_attack(3)
             # Consider negotiate if we have weak hand or no attacks
             if negotiate_cards:
                 if not attack_cards or max(c.value for c in attack_cards) < 10:
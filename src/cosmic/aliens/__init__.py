@@ -3,11 +3,14 @@ Alien powers for Cosmic Encounter.
 """
 
 from .base import AlienPower
-from .registry import AlienRegistry, get_all_aliens, get_alien
+from .registry import AlienId, AlienRegistry, alien_id, alien_name, get_all_aliens, get_alien
 
 __all__ = [
+    "AlienId",
     "AlienPower",
     "AlienRegistry",
+    "alien_id",
+    "alien_name",
     "get_all_aliens",
     "get_alien",
 ]
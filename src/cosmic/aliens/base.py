@@ -2,12 +2,13 @@
 Base class for alien powers.
 """
 
+from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, TYPE_CHECKING, Callable
+from typing import Optional, List, Dict, Any, ClassVar, FrozenSet, Tuple, TYPE_CHECKING, Callable
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 
-from ..types import PowerTiming, PowerType, Side, PlayerRole, Expansion
+from ..types import PowerTiming, PowerType, PowerCapability, Side, PlayerRole, Expansion
 
 if TYPE_CHECKING:
     from ..game import Game
@@ -28,7 +29,12 @@ class AlienPower(ABC):
 
     Each alien power can hook into various game events and modify behavior.
     Powers should be immutable - store any state on the Player object.
+    A power that must keep per-game state on itself sets stateful = True
+    and gets its own copy in each game; all others are shared.
     """
+    # Whether the power keeps per-game state on itself (see for_game)
+    stateful: ClassVar[bool] = False
+
     name: str
     description: str
     timing: PowerTiming
@@ -51,6 +57,9 @@ class AlienPower(ABC):
     # Alternative win condition (if any)
     has_alternate_win: bool = False
 
+    # Rules the engine changes for this power (compiled per player at setup)
+    capabilities: PowerCapability = PowerCapability.NONE
+
     def can_use_as(self, role: PlayerRole) -> bool:
         """Check if power can be used in the given role."""
         return role in self.usable_as
@@ -64,6 +73,17 @@ class AlienPower(ABC):
         """
         return type(self)()
 
+    def for_game(self) -> "AlienPower":
+        """
+        The instance a game should seat: this one if the power is
+        stateless, so one instance serves every game, else a fresh copy.
+        """
+        return self.copy() if self.stateful else self
+
+    def state(self) -> Dict[str, Any]:
+        """A copy of the attributes the power holds, for comparison."""
+        return deepcopy(vars(self))
+
     def should_use(
         self,
         game: "Game",
@@ -345,3 +365,18 @@ class AlienPower(ABC):
 
     def __repr__(self) -> str:
         return f"AlienPower({self.name})"
+
+
+# Game event hooks: AlienPower methods whose base versions do nothing
+HOOK_NAMES: Tuple[str, ...] = tuple(
+    name for name in vars(AlienPower)
+    if name.startswith(("on_", "modify_")) or name == "check_alternate_win"
+)
+
+
+def overridden_hooks(alien_class: type) -> FrozenSet[str]:
+    """Names of the hooks an AlienPower subclass overrides."""
+    return frozenset(
+        name for name in HOOK_NAMES
+        if getattr(alien_class, name) is not getattr(AlienPower, name)
+    )
@@ -20,6 +20,7 @@ Sources:
 - Fantasy Flight Games official website
 """
 
+from functools import lru_cache
 from typing import Dict, List, Set, Optional
 
 from ..types import Expansion
@@ -162,6 +163,7 @@ REGISTERED_NAME_MAPPINGS = {
 REGISTERED_TO_OFFICIAL: Dict[str, str] = {v: k for k, v in ALIEN_NAME_MAPPINGS.items()}
 
 # Build a lookup set of all official alien names (normalized)
+@lru_cache(maxsize=4096)
 def _normalize_name(name: str) -> str:
     """Normalize alien name for comparison."""
     return name.replace(" ", "").replace("-", "").replace("(", "").replace(")", "").lower()
@@ -498,6 +500,12 @@ ALIEN_POWER_DESCRIPTIONS: Dict[str, str] = {
 }
 
 
+# Normalized name -> description (the first official name to normalize to it)
+_DESCRIPTIONS_BY_NORMALIZED_NAME: Dict[str, str] = {}
+for _name, _desc in ALIEN_POWER_DESCRIPTIONS.items():
+    _DESCRIPTIONS_BY_NORMALIZED_NAME.setdefault(_normalize_name(_name), _desc)
+
+
 def get_alien_description(name: str) -> Optional[str]:
     """Get the power description for an alien."""
     # Try direct lookup
@@ -505,11 +513,7 @@ def get_alien_description(name: str) -> Optional[str]:
         return ALIEN_POWER_DESCRIPTIONS[name]
 
     # Try normalized lookup
-    for official_name, desc in ALIEN_POWER_DESCRIPTIONS.items():
-        if _normalize_name(official_name) == _normalize_name(name):
-            return desc
-
-    return None
+    return _DESCRIPTIONS_BY_NORMALIZED_NAME.get(_normalize_name(name))
 
 
 def get_missing_official_aliens(registered_names: List[str]) -> List[str]:
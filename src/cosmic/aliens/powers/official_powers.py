@@ -17,7 +17,7 @@ from dataclasses import dataclass, field
 from typing import List, TYPE_CHECKING, Any, Dict
 
 from ..base import AlienPower, PowerCategory
-from ...types import PowerTiming, PowerType, PlayerRole, Expansion, Side
+from ...types import PowerTiming, PowerType, PowerCapability, PlayerRole, Expansion, Side
 from ..registry import AlienRegistry
 
 if TYPE_CHECKING:
@@ -63,6 +63,7 @@ class Antimatter(AlienPower):
     category: PowerCategory = field(default=PowerCategory.YELLOW, init=False)
     expansion: Expansion = field(default=Expansion.BASE, init=False)
     usable_as: List[PlayerRole] = field(default_factory=lambda: [PlayerRole.OFFENSE, PlayerRole.DEFENSE], init=False)
+    capabilities: PowerCapability = PowerCapability.REVERSES_OUTCOME
 
 
 @dataclass
@@ -292,6 +293,7 @@ class Hacker(AlienPower):
     category: PowerCategory = field(default=PowerCategory.YELLOW, init=False)
     expansion: Expansion = field(default=Expansion.BASE, init=False)
     usable_as: List[PlayerRole] = field(default_factory=lambda: [PlayerRole.OFFENSE, PlayerRole.DEFENSE], init=False)
+    capabilities: PowerCapability = PowerCapability.INTERCEPTS_COMPENSATION
 
 
 @dataclass
@@ -385,6 +387,7 @@ class Loser(AlienPower):
     category: PowerCategory = field(default=PowerCategory.YELLOW, init=False)
     expansion: Expansion = field(default=Expansion.BASE, init=False)
     usable_as: List[PlayerRole] = field(default_factory=lambda: [PlayerRole.OFFENSE, PlayerRole.DEFENSE], init=False)
+    capabilities: PowerCapability = PowerCapability.REVERSES_OUTCOME
 
 
 @dataclass
@@ -398,6 +401,7 @@ class Machine(AlienPower):
     category: PowerCategory = field(default=PowerCategory.GREEN, init=False)
     expansion: Expansion = field(default=Expansion.BASE, init=False)
     usable_as: List[PlayerRole] = field(default_factory=lambda: [PlayerRole.OFFENSE], init=False)
+    capabilities: PowerCapability = PowerCapability.EXTRA_ENCOUNTERS
 
 
 @dataclass
@@ -433,6 +437,7 @@ class Masochist(AlienPower):
     power_type: PowerType = field(default=PowerType.MANDATORY, init=False)
     category: PowerCategory = field(default=PowerCategory.GREEN, init=False)
     expansion: Expansion = field(default=Expansion.BASE, init=False)
+    capabilities: PowerCapability = PowerCapability.KEEPS_POWER
 
     def on_ships_to_warp(self, game: "Game", player: "Player", count: int, source: str) -> int:
         """Draw a card for each ship going to warp."""
@@ -550,6 +555,7 @@ class Pacifist(AlienPower):
     category: PowerCategory = field(default=PowerCategory.YELLOW, init=False)
     expansion: Expansion = field(default=Expansion.BASE, init=False)
     usable_as: List[PlayerRole] = field(default_factory=lambda: [PlayerRole.OFFENSE, PlayerRole.DEFENSE], init=False)
+    capabilities: PowerCapability = PowerCapability.WINS_WITH_NEGOTIATE
 
     def check_pacifist_win(self, game: "Game", player: "Player") -> bool:
         """Check if Pacifist wins by playing negotiate against attack."""
@@ -572,6 +578,7 @@ class Parasite(AlienPower):
     power_type: PowerType = field(default=PowerType.OPTIONAL, init=False)
     category: PowerCategory = field(default=PowerCategory.YELLOW, init=False)
     expansion: Expansion = field(default=Expansion.BASE, init=False)
+    capabilities: PowerCapability = PowerCapability.JOINS_UNINVITED
 
 
 @dataclass
@@ -825,6 +832,7 @@ class Void(AlienPower):
     power_type: PowerType = field(default=PowerType.MANDATORY, init=False)
     category: PowerCategory = field(default=PowerCategory.YELLOW, init=False)
     expansion: Expansion = field(default=Expansion.BASE, init=False)
+    capabilities: PowerCapability = PowerCapability.ERADICATES_ON_WIN
 
 
 @dataclass
@@ -1202,6 +1210,7 @@ class Symbiote(AlienPower):
     power_type: PowerType = field(default=PowerType.MANDATORY, init=False)
     category: PowerCategory = field(default=PowerCategory.YELLOW, init=False)
     expansion: Expansion = field(default=Expansion.COSMIC_INCURSION, init=False)
+    capabilities: PowerCapability = PowerCapability.DOUBLE_STARTING_SHIPS
 
 
 # =============================================================================
@@ -1280,6 +1289,7 @@ class Graviton(AlienPower):
     category: PowerCategory = field(default=PowerCategory.RED, init=False)
     expansion: Expansion = field(default=Expansion.COSMIC_CONFLICT, init=False)
     usable_as: List[PlayerRole] = field(default_factory=lambda: [PlayerRole.OFFENSE, PlayerRole.DEFENSE], init=False)
+    capabilities: PowerCapability = PowerCapability.DESTROYS_LOSERS
 
 
 @dataclass
@@ -3,31 +3,135 @@ Registry for alien powers with expansion filtering support.
 
 Supports filtering aliens by expansion to allow games with only
 specific expansion content enabled.
+
+The registry is copy-on-write: the alien mapping and the enabled expansion
+set are immutable objects that writers replace wholesale, so games running
+on other threads always read a consistent snapshot.
+
+Alien names are interned as dense integer AlienIds, so statistics tables
+can be indexed by ID and resolve names only when they report.
 """
 
-from typing import Dict, List, Optional, Set, Type
-from .base import AlienPower
+import random
+import threading
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Type
+from .base import AlienPower, overridden_hooks
+from .official_aliens import get_alien_expansion_enum
 from ..types import Expansion
 
+# One bit per expansion, for keying expansion selections
+EXPANSION_BITS: Mapping[Expansion, int] = MappingProxyType(
+    {expansion: 1 << i for i, expansion in enumerate(Expansion)}
+)
+
+
+def expansion_mask(expansions: Iterable[Expansion]) -> int:
+    """The bitmask of a set of expansions."""
+    mask = 0
+    for expansion in expansions:
+        mask |= EXPANSION_BITS[expansion]
+    return mask
+
+
+# Interned alien IDs, handed out in order of first sight; never reused
+AlienId = int
+ALIEN_NAMES: List[str] = []  # AlienId -> name
+_alien_ids: Dict[str, AlienId] = {}  # Name (exact) -> AlienId
+_id_lock = threading.Lock()
+
+
+def alien_id(name: str) -> AlienId:
+    """
+    The interned ID of an alien name, assigning the next ID if it is new.
+
+    Names are matched exactly, so any name (a retired alien in saved stats,
+    a test stand-in) has an ID; registration interns each alien's name.
+    """
+    aid = _alien_ids.get(name)
+    if aid is None:
+        with _id_lock:
+            aid = _alien_ids.get(name)
+            if aid is None:
+                aid = len(ALIEN_NAMES)
+                ALIEN_NAMES.append(name)
+                _alien_ids[name] = aid
+    return aid
+
+
+def alien_name(aid: AlienId) -> str:
+    """The name interned as an AlienId."""
+    return ALIEN_NAMES[aid]
+
 
 class AlienRegistry:
     """
     Registry for all available alien powers.
     Aliens are registered by name and can be retrieved for game setup.
     Supports filtering by expansion to enable/disable expansion content.
+
+    Registered instances of stateless powers are shared by every game;
+    stateful ones are prototypes that games copy.
     """
-    _aliens: Dict[str, AlienPower] = {}
-    _enabled_expansions: Set[Expansion] = set(Expansion)  # All enabled by default
+    _aliens: Mapping[str, AlienPower] = MappingProxyType({})  # Name (lowercase) -> alien
+    _by_name: Mapping[str, AlienPower] = MappingProxyType({})  # Name as registered -> alien
+    _hooks: Mapping[type, FrozenSet[str]] = MappingProxyType({})  # Alien class -> overridden hooks
+    # Alien name (lowercase) -> (alien, bit of its official expansion), published
+    # together so a reader never sees an alien without its bit
+    _expansion_aliens: Mapping[str, Tuple[AlienPower, int]] = MappingProxyType({})
+    _lineup_pools: Dict[int, Tuple[AlienPower, ...]] = {}  # Expansion mask -> aliens from those expansions
+    _enabled_expansions: FrozenSet[Expansion] = frozenset(Expansion)  # All enabled by default
+    _write_lock = threading.Lock()
 
     @classmethod
     def register(cls, alien: AlienPower) -> None:
-        """Register an alien power."""
-        cls._aliens[alien.name.lower()] = alien
+        """Register an alien power, intern its name and record which hooks its class overrides."""
+        alien_id(alien.name)
+        with cls._write_lock:
+            aliens = dict(cls._aliens)
+            old = aliens.get(alien.name.lower())
+            aliens[alien.name.lower()] = alien
+            by_name = dict(cls._by_name)
+            if old is not None:
+                del by_name[old.name]
+            by_name[alien.name] = alien
+            expansion_aliens = dict(cls._expansion_aliens)
+            expansion_aliens[alien.name.lower()] = (alien, EXPANSION_BITS[get_alien_expansion_enum(alien.name)])
+            cls._aliens = MappingProxyType(aliens)
+            cls._by_name = MappingProxyType(by_name)
+            cls._expansion_aliens = MappingProxyType(expansion_aliens)
+            cls._lineup_pools = {}
+            if type(alien) not in cls._hooks:
+                hooks = dict(cls._hooks)
+                hooks[type(alien)] = overridden_hooks(type(alien))
+                cls._hooks = MappingProxyType(hooks)
+
+    @classmethod
+    def get_hooks(cls, alien: AlienPower) -> FrozenSet[str]:
+        """
+        Hooks the alien's class overrides; the game calls no others.
+
+        Classes that were never registered are inspected on each call.
+        """
+        hooks = cls._hooks.get(type(alien))
+        return hooks if hooks is not None else overridden_hooks(type(alien))
 
     @classmethod
     def get(cls, name: str) -> Optional[AlienPower]:
         """Get an alien power by name (case-insensitive)."""
-        return cls._aliens.get(name.lower())
+        alien = cls._by_name.get(name)
+        return alien if alien is not None else cls._aliens.get(name.lower())
+
+    @classmethod
+    def get_by_id(cls, aid: AlienId) -> Optional[AlienPower]:
+        """Get a registered alien power by its AlienId."""
+        return cls._by_name.get(ALIEN_NAMES[aid]) if 0 <= aid < len(ALIEN_NAMES) else None
+
+    @classmethod
+    def id_of(cls, name: str) -> Optional[AlienId]:
+        """The AlienId of a registered alien, looked up by name (case-insensitive)."""
+        alien = cls.get(name)
+        return None if alien is None else _alien_ids[alien.name]
 
     @classmethod
     def get_all(cls) -> List[AlienPower]:
@@ -39,6 +143,25 @@ class AlienRegistry:
         """Get names of all registered alien powers."""
         return [a.name for a in cls._aliens.values()]
 
+    @classmethod
+    def lineup_pool(cls, expansions: Iterable[Expansion]) -> Tuple[AlienPower, ...]:
+        """
+        Registered aliens from the given expansions, in registration order.
+
+        An alien's expansion is the official one its name belongs to
+        (HOMEBREW if none). Pools are cached per expansion selection until
+        the next registration.
+        """
+        mask = expansion_mask(expansions)
+        # Read the cache before the aliens: a registration replaces the
+        # aliens first, so a pool built here is never stored in a newer cache
+        pools = cls._lineup_pools
+        pool = pools.get(mask)
+        if pool is None:
+            pool = tuple(a for a, bit in cls._expansion_aliens.values() if bit & mask)
+            pools[mask] = pool
+        return pool
+
     @classmethod
     def count(cls) -> int:
         """Number of registered aliens."""
@@ -47,7 +170,49 @@ class AlienRegistry:
     @classmethod
     def clear(cls) -> None:
         """Clear all registered aliens (for testing)."""
-        cls._aliens.clear()
+        with cls._write_lock:
+            cls._aliens = MappingProxyType({})
+            cls._by_name = MappingProxyType({})
+            cls._expansion_aliens = MappingProxyType({})
+            cls._lineup_pools = {}
+
+    @classmethod
+    def audit_state(cls, seed: int = 0, rounds: int = 1, players_per_game: int = 5) -> List[str]:
+        """
+        Play every registered alien and report stateless ones that changed.
+
+        A power not declared stateful is shared by all games, so it must not
+        write to itself during play. Each round seats every alien once
+        (players_per_game per game, in a shuffled order).
+
+        Only each power's instance attributes (vars, compared deeply) are
+        checked, so writes to class attributes, or to module-level and
+        other objects a power reaches without holding them, go unreported.
+
+        Returns:
+            Names of powers whose attributes differ after play, sorted
+        """
+        from ..game import Game
+        from ..types import GameConfig
+        from ..utils.seeding import derive_seed
+
+        aliens = [a for a in cls._aliens.values() if not a.stateful]
+        before = {a.name: a.state() for a in aliens}
+        names = [a.name for a in aliens]
+        for round_index in range(rounds):
+            order = list(names)
+            random.Random(derive_seed(seed, "audit", round_index)).shuffle(order)
+            for start in range(0, len(order), players_per_game):
+                lineup = order[start:start + players_per_game]
+                if len(lineup) < 3:
+                    lineup += order[:3 - len(lineup)]
+                game = Game(config=GameConfig(
+                    num_players=len(lineup),
+                    seed=derive_seed(seed, "audit", round_index, start)
+                ))
+                game.setup(powers=lineup)
+                game.play()
+        return sorted(a.name for a in aliens if a.state() != before[a.name])
 
     # =========================================================================
     # EXPANSION FILTERING
@@ -61,32 +226,34 @@ class AlienRegistry:
         Args:
             expansions: Set of Expansion enums to enable
         """
-        cls._enabled_expansions = set(expansions)
+        cls._enabled_expansions = frozenset(expansions)
 
     @classmethod
     def enable_expansion(cls, expansion: Expansion) -> None:
         """Enable a specific expansion."""
-        cls._enabled_expansions.add(expansion)
+        with cls._write_lock:
+            cls._enabled_expansions = cls._enabled_expansions | {expansion}
 
     @classmethod
     def disable_expansion(cls, expansion: Expansion) -> None:
         """Disable a specific expansion."""
-        cls._enabled_expansions.discard(expansion)
+        with cls._write_lock:
+            cls._enabled_expansions = cls._enabled_expansions - {expansion}
 
     @classmethod
     def enable_all_expansions(cls) -> None:
         """Enable all expansions."""
-        cls._enabled_expansions = set(Expansion)
+        cls._enabled_expansions = frozenset(Expansion)
 
     @classmethod
     def enable_base_game_only(cls) -> None:
         """Enable only the base game (no expansions)."""
-        cls._enabled_expansions = {Expansion.BASE}
+        cls._enabled_expansions = frozenset({Expansion.BASE})
 
     @classmethod
     def get_enabled_expansions(cls) -> Set[Expansion]:
         """Get currently enabled expansions."""
-        return cls._enabled_expansions.copy()
+        return set(cls._enabled_expansions)
 
     @classmethod
     def is_expansion_enabled(cls, expansion: Expansion) -> bool:
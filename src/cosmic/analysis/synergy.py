@@ -10,6 +10,8 @@ from collections import defaultdict
 import math
 import json
 
+from ..aliens import AlienId, alien_id
+
 if TYPE_CHECKING:
     from ..simulation.stats import Statistics
 
@@ -140,6 +142,9 @@ class SynergyAnalyzer:
         self.min_games = min_games
         self.synergy_matrix: Dict[Tuple[str, str], SynergyData] = {}
         self.counter_matrix: Dict[Tuple[str, str], CounterData] = {}
+        # The same entries by (AlienId, AlienId) in game order, for recording
+        self._synergy_pairs: Dict[Tuple[AlienId, AlienId], SynergyData] = {}
+        self._counter_pairs: Dict[Tuple[AlienId, AlienId], CounterData] = {}
 
     def record_game(
         self,
@@ -156,48 +161,54 @@ class SynergyAnalyzer:
             ally_pairs: Optional list of (player1_idx, player2_idx) ally pairs
         """
         n = len(powers)
+        ids = [alien_id(power) for power in powers]
+        winners = set(winner_indices)
 
         # Record counter matchups (who beat whom)
+        counters = self._counter_pairs
         for i in range(n):
             for j in range(i + 1, n):
-                key = tuple(sorted([powers[i], powers[j]]))
-                if key not in self.counter_matrix:
-                    self.counter_matrix[key] = CounterData(
-                        power1=key[0], power2=key[1]
-                    )
+                data = counters.get((ids[i], ids[j]))
+                if data is None:
+                    key = tuple(sorted([powers[i], powers[j]]))
+                    data = self.counter_matrix.get(key)
+                    if data is None:
+                        data = self.counter_matrix[key] = CounterData(
+                            power1=key[0], power2=key[1]
+                        )
+                    counters[ids[i], ids[j]] = data
 
-                data = self.counter_matrix[key]
                 data.games_against += 1
 
                 # Check who won
-                i_won = i in winner_indices
-                j_won = j in winner_indices
+                i_won = i in winners
+                j_won = j in winners
 
-                if i_won and not j_won:
-                    if powers[i] == key[0]:
-                        data.power1_wins += 1
-                    else:
-                        data.power2_wins += 1
-                elif j_won and not i_won:
-                    if powers[j] == key[0]:
+                if i_won != j_won:
+                    winner = powers[i] if i_won else powers[j]
+                    if winner == data.power1:
                         data.power1_wins += 1
                     else:
                         data.power2_wins += 1
 
         # Record synergy (shared wins)
         if ally_pairs:
+            synergies = self._synergy_pairs
             for i, j in ally_pairs:
-                key = tuple(sorted([powers[i], powers[j]]))
-                if key not in self.synergy_matrix:
-                    self.synergy_matrix[key] = SynergyData(
-                        power1=key[0], power2=key[1]
-                    )
+                data = synergies.get((ids[i], ids[j]))
+                if data is None:
+                    key = tuple(sorted([powers[i], powers[j]]))
+                    data = self.synergy_matrix.get(key)
+                    if data is None:
+                        data = self.synergy_matrix[key] = SynergyData(
+                            power1=key[0], power2=key[1]
+                        )
+                    synergies[ids[i], ids[j]] = data
 
-                data = self.synergy_matrix[key]
                 data.games_together += 1
 
                 # Check if both won (shared victory)
-                if i in winner_indices and j in winner_indices:
+                if i in winners and j in winners:
                     data.combined_wins += 1
 
     def analyze(self) -> SynergyReport:
@@ -0,0 +1,129 @@
+"""
+Incremental index of ship locations for Cosmic Encounter.
+
+Colony counts are read after every encounter and throughout the AIs, and
+scanning every planet each time dominated game time. The BoardIndex is
+updated by each planet's ShipCount as ships move, so colony counts and
+ship totals are O(1) and a player's planets are O(k) in the planets they
+occupy.
+"""
+
+from functools import partial
+from typing import Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .planet import Planet
+
+
+class BoardIndex:
+    """
+    Per-player ship locations, kept current by the planets' ShipCounts.
+
+    Lists of planets are returned in board order (the order of the planets
+    list), matching a scan of the board.
+    """
+
+    def __init__(self, planets: List["Planet"]):
+        self._ships: Dict[str, Dict[int, int]] = {}  # Player -> {planet position: ships}
+        self._foreign: Dict[str, int] = {}
+        self._home: Dict[str, int] = {}
+        self._total: Dict[str, int] = {}
+        self._observers: List[partial] = []  # Observer attached to the planet at each position
+        self.attach(planets)
+
+    def attach(self, planets: List["Planet"]) -> None:
+        """
+        Track a new list of planets in place of the current one.
+
+        Observers for positions whose owner is unchanged are reused, so
+        re-attaching an index to a new game's board allocates little.
+        """
+        self.planets = planets
+        for ships in self._ships.values():
+            ships.clear()
+        self._foreign.clear()
+        self._home.clear()
+        self._total.clear()
+
+        observers = self._observers
+        for position, planet in enumerate(planets):
+            owner = planet.owner.name
+            for player_name, count in planet.ships.counts.items():
+                self._update(position, owner, player_name, 0, count)
+            if position < len(observers) and observers[position].args[1] == owner:
+                observer = observers[position]
+            else:
+                observer = partial(self._update, position, owner)
+                if position < len(observers):
+                    observers[position] = observer
+                else:
+                    observers.append(observer)
+            planet.ships._observer = observer
+
+    def detach(self) -> None:
+        """Stop tracking the planets."""
+        for planet in self.planets:
+            planet.ships._observer = None
+
+    def _update(self, position: int, owner: str, player_name: str, old: int, new: int) -> None:
+        """Apply a ship count change on the planet at position."""
+        self._total[player_name] = self._total.get(player_name, 0) + new - old
+
+        ships = self._ships.get(player_name)
+        if ships is None:
+            ships = self._ships[player_name] = {}
+        if new > 0:
+            ships[position] = new
+        else:
+            ships.pop(position, None)
+
+        if (old > 0) != (new > 0):
+            colonies = self._home if player_name == owner else self._foreign
+            colonies[player_name] = colonies.get(player_name, 0) + (1 if new > 0 else -1)
+
+    def foreign_colony_count(self, player_name: str) -> int:
+        """Planets owned by others where the player has ships."""
+        return self._foreign.get(player_name, 0)
+
+    def home_colony_count(self, player_name: str) -> int:
+        """Home planets where the player still has ships."""
+        return self._home.get(player_name, 0)
+
+    def ships_in_play(self, player_name: str) -> int:
+        """Ships the player has on planets."""
+        return self._total.get(player_name, 0)
+
+    def planets_with_ships(self, player_name: str) -> List["Planet"]:
+        """Every planet (home or foreign) where the player has ships."""
+        ships = self._ships.get(player_name)
+        if not ships:
+            return []
+        planets = self.planets
+        return [planets[position] for position in sorted(ships)]
+
+    def foreign_colonies(self, player_name: str) -> List["Planet"]:
+        """Planets owned by others where the player has ships."""
+        return [p for p in self.planets_with_ships(player_name) if p.owner.name != player_name]
+
+    def verify(self) -> None:
+        """
+        Check the index against a full scan of the board.
+
+        Raises:
+            RuntimeError: If any count or location disagrees
+        """
+        expected = BoardIndex.__new__(BoardIndex)
+        expected.planets = self.planets
+        expected._ships, expected._foreign, expected._home, expected._total = {}, {}, {}, {}
+        for position, planet in enumerate(self.planets):
+            for player_name, count in planet.ships.counts.items():
+                expected._update(position, planet.owner.name, player_name, 0, count)
+
+        def nonzero(table: Dict) -> Dict:
+            return {k: v for k, v in table.items() if v}
+
+        for label in ("_ships", "_foreign", "_home", "_total"):
+            actual = nonzero(getattr(self, label))
+            wanted = nonzero(getattr(expected, label))
+            if actual != wanted:
+                raise RuntimeError(f"Board index out of sync ({label[1:]}): {actual} != {wanted}")
@@ -4,10 +4,12 @@ Card system for Cosmic Encounter.
 
 from .base import Card, EncounterCard, AttackCard, NegotiateCard, MorphCard
 from .base import ReinforcementCard, ArtifactCard, FlareCard, KickerCard
+from .catalogue import CARDS, card_id, intern_card
 from .cosmic_deck import CosmicDeck
 from .destiny_deck import DestinyDeck, DestinyCard
 from .rewards_deck import RewardsDeck
 from .flare_deck import FlareDeck, FLARE_EFFECTS
+from .flare_effects import WILD_EFFECTS, SUPER_EFFECTS, get_wild_effect, get_super_effect
 from .tech_deck import TechDeck, TechCard, TechCategory, PlayerTechState, TECH_EFFECTS
 from .hazard_deck import HazardDeck, HazardCard, HazardTiming, HazardSeverity, HAZARD_EFFECTS, apply_hazard_effect
 from .lux_system import LuxAction, LUX_COSTS, LuxToken, PlayerLuxState, LuxManager, LuxIncome
@@ -23,12 +25,19 @@ __all__ = [
     "ArtifactCard",
     "FlareCard",
     "KickerCard",
+    "CARDS",
+    "card_id",
+    "intern_card",
     "CosmicDeck",
     "DestinyDeck",
     "DestinyCard",
     "RewardsDeck",
     "FlareDeck",
     "FLARE_EFFECTS",
+    "WILD_EFFECTS",
+    "SUPER_EFFECTS",
+    "get_wild_effect",
+    "get_super_effect",
     "TechDeck",
     "TechCard",
     "TechCategory",
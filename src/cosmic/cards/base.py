@@ -3,7 +3,7 @@ Base card classes for Cosmic Encounter.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 from ..types import CardType, ArtifactType
@@ -160,6 +160,9 @@ class FlareCard(Card):
     super_effect: str = ""
     _from_rewards_deck: bool = False
     _card_type: CardType = field(default=CardType.FLARE, init=False)
+    # Effect functions (see flare_effects), resolved when FlareDeck creates the card
+    wild_handler: Optional[Callable[..., Any]] = field(default=None, repr=False, compare=False)
+    super_handler: Optional[Callable[..., Any]] = field(default=None, repr=False, compare=False)
 
     @property
     def card_type(self) -> CardType:
@@ -0,0 +1,88 @@
+"""
+Interned card catalogue for Cosmic Encounter.
+
+Cards are never modified once made, so each distinct card (an Attack 8, a
+Cosmic Zap, the Machine flare) exists once and is shared by every copy in
+every game. Decks hold catalogue IDs in arrays rather than card objects:
+building a deck is a buffer copy and shuffling permutes integers.
+"""
+
+import threading
+from array import array
+from dataclasses import fields
+from typing import Dict, Iterable, List, Tuple
+
+from .base import Card, FlareCard
+from .flare_effects import get_wild_effect, get_super_effect
+
+# Card ID -> card
+CARDS: List[Card] = []
+
+_card_ids: Dict[tuple, int] = {}  # Card definition -> card ID
+_object_ids: Dict[int, int] = {}  # id() of a catalogue card -> card ID (catalogue cards live forever)
+_key_fields: Dict[type, Tuple[str, ...]] = {}  # Card class -> fields that define a card
+_flares: Dict[str, FlareCard] = {}  # Alien name -> flare card
+_lock = threading.Lock()
+
+
+def _card_key(card: Card) -> tuple:
+    """A card's definition: its class and the fields its equality compares."""
+    cls = type(card)
+    names = _key_fields.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(card) if f.compare)
+        _key_fields[cls] = names
+    return (cls,) + tuple(getattr(card, name) for name in names)
+
+
+def card_id(card: Card) -> int:
+    """The catalogue ID of a card, adding its definition if it is new."""
+    cid = _object_ids.get(id(card))
+    if cid is not None:
+        return cid
+    key = _card_key(card)
+    cid = _card_ids.get(key)
+    if cid is None:
+        with _lock:
+            cid = _card_ids.get(key)
+            if cid is None:
+                cid = len(CARDS)
+                CARDS.append(card)
+                _card_ids[key] = cid
+                _object_ids[id(card)] = cid
+    return cid
+
+
+def intern_card(card: Card) -> Card:
+    """The catalogue's card equal to card."""
+    return CARDS[card_id(card)]
+
+
+def card_ids(cards: Iterable[Card]) -> array:
+    """Catalogue IDs of cards, in order, as an array."""
+    return array("H", map(card_id, cards))
+
+
+def cards_for(ids: Iterable[int]) -> List[Card]:
+    """The cards with the given catalogue IDs, in order."""
+    return list(map(CARDS.__getitem__, ids))
+
+
+def flare_card(alien_name: str, wild_effect: str, super_effect: str) -> FlareCard:
+    """
+    The flare card for an alien, built once with its effect handlers.
+
+    The effect texts are used only the first time an alien's flare is
+    requested.
+    """
+    flare = _flares.get(alien_name)
+    if flare is None:
+        flare = intern_card(FlareCard(
+            alien_name=alien_name,
+            wild_effect=wild_effect,
+            super_effect=super_effect,
+            wild_handler=get_wild_effect(alien_name),
+            super_handler=get_super_effect(alien_name)
+        ))
+        _flares[alien_name] = flare
+    return flare
@@ -38,6 +38,7 @@ class DestinyDeck:
     _rng: random.Random = field(default_factory=random.Random)
     _players: List["Player"] = field(default_factory=list)
     cards_per_player: int = 3
+    _spare_cards: List[DestinyCard] = field(default_factory=list, init=False, repr=False, compare=False)  # For initialize to reuse
 
     def initialize(self, players: List["Player"], include_special: bool = True) -> None:
         """Initialize the deck with cards for all players.
@@ -54,20 +55,48 @@ class DestinyDeck:
         # Add player color cards
         for player in players:
             for _ in range(self.cards_per_player):
-                self.draw_pile.append(DestinyCard(player=player))
+                self.draw_pile.append(self._new_card(player))
 
         # Add wild cards (2 per official rules)
         if include_special and players:
             # Wild cards point to a random player but are marked as wild
             for _ in range(2):
-                self.draw_pile.append(DestinyCard(
-                    player=players[0],  # Will be replaced when drawn
+                self.draw_pile.append(self._new_card(
+                    players[0],  # Will be replaced when drawn
                     is_special=True,
                     special_type="wild"
                 ))
 
         self.shuffle()
 
+    def _new_card(
+        self,
+        player: "Player",
+        is_special: bool = False,
+        special_type: Optional[str] = None
+    ) -> DestinyCard:
+        """A destiny card, reusing one gathered by reset if there is one."""
+        if not self._spare_cards:
+            return DestinyCard(player=player, is_special=is_special, special_type=special_type)
+        card = self._spare_cards.pop()
+        card.player = player
+        card.is_special = is_special
+        card.special_type = special_type
+        return card
+
+    def reset(self, seed: int) -> None:
+        """
+        Empty the deck and reseed it, as a new deck built with
+        random.Random(seed) would be. Its cards are kept for the next
+        initialize to reuse.
+        """
+        self._rng.seed(seed)
+        self._players = []
+        self._spare_cards.extend(self.draw_pile)
+        self._spare_cards.extend(self.discard_pile)
+        self.draw_pile.clear()
+        self.discard_pile.clear()
+
     def shuffle(self) -> None:
         """Shuffle the draw pile."""
         self._rng.shuffle(self.draw_pile)
@@ -11,6 +11,7 @@ from typing import List, Dict, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 from .base import Card, FlareCard
+from .catalogue import flare_card
 from ..aliens.registry import AlienRegistry
 
 if TYPE_CHECKING:
@@ -39,18 +40,18 @@ class FlareDeck:
         return flares
 
     def _create_flare_for_alien(self, alien_name: str) -> Optional[FlareCard]:
-        """Create a flare card for a specific alien."""
+        """Get the flare card for a specific alien (built once; see catalogue)."""
         # Get flare effects based on the alien
         effects = FLARE_EFFECTS.get(alien_name)
         if effects:
-            return FlareCard(
-                alien_name=alien_name,
+            return flare_card(
+                alien_name,
                 wild_effect=effects.get('wild', f"Wild: Gain a minor {alien_name} benefit."),
                 super_effect=effects.get('super', f"Super: Gain a major {alien_name} benefit.")
             )
         # Default flare for aliens without specific effects
-        return FlareCard(
-            alien_name=alien_name,
+        return flare_card(
+            alien_name,
             wild_effect=f"Wild: Once per encounter, gain +2 to your total.",
             super_effect=f"Super: Once per encounter, gain +4 to your total."
         )
@@ -0,0 +1,867 @@
+"""
+Flare Wild and Super effects, registered by alien.
+
+Each effect is a function effect(game, player, context) registered under
+its alien's name with @wild or @super_. FlareDeck resolves a flare's
+effects once when it creates the card, so playing a flare is a single
+call whatever the number of flares.
+"""
+
+from typing import Any, Callable, Dict, TYPE_CHECKING
+
+from .base import AttackCard, NegotiateCard
+
+if TYPE_CHECKING:
+    from ..game import Game
+    from ..player import Player
+
+FlareEffect = Callable[["Game", "Player", Dict[str, Any]], None]
+
+WILD_EFFECTS: Dict[str, FlareEffect] = {}
+SUPER_EFFECTS: Dict[str, FlareEffect] = {}
+
+
+def wild(alien_name: str) -> Callable[[FlareEffect], FlareEffect]:
+    """Register a function as the Wild effect of an alien's flare."""
+    def register(effect: FlareEffect) -> FlareEffect:
+        WILD_EFFECTS[alien_name] = effect
+        return effect
+    return register
+
+
+def super_(alien_name: str) -> Callable[[FlareEffect], FlareEffect]:
+    """Register a function as the Super effect of an alien's flare."""
+    def register(effect: FlareEffect) -> FlareEffect:
+        SUPER_EFFECTS[alien_name] = effect
+        return effect
+    return register
+
+
+def get_wild_effect(alien_name: str) -> FlareEffect:
+    """The Wild effect for an alien's flare (generic +2 if it has none)."""
+    return WILD_EFFECTS.get(alien_name, default_wild)
+
+
+def get_super_effect(alien_name: str) -> FlareEffect:
+    """The Super effect for an alien's flare (generic +4 if it has none)."""
+    return SUPER_EFFECTS.get(alien_name, default_super)
+
+
+# ========== WILD EFFECTS ==========
+
+
+@wild("Machine")
+def _machine_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Machine Wild: Take one extra encounter."""
+    game._flare_extra_encounter = True
+
+
+@wild("Zombie")
+def _zombie_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Zombie Wild: Return 2 ships from warp."""
+    ships = min(2, player.ships_in_warp)
+    if ships > 0:
+        player.retrieve_ships_from_warp(ships)
+        player.return_ships_to_colonies(ships, player.home_planets)
+
+
+@wild("Human")
+def _human_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Human Wild: Add +3 to total."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 3
+
+
+@wild("Warrior")
+def _warrior_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Warrior Wild: +1 per ship in warp."""
+    bonus = player.ships_in_warp
+    context["flare_bonus"] = context.get("flare_bonus", 0) + bonus
+
+
+@wild("Macron")
+def _macron_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Macron Wild: Ships count as 2 each."""
+    context["flare_ship_multiplier"] = 2
+
+
+@wild("Healer")
+def _healer_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Healer Wild: Return 3 ships from any warp."""
+    if player.ships_in_warp >= 3:
+        player.retrieve_ships_from_warp(3)
+        player.return_ships_to_colonies(3, player.home_planets)
+
+
+@wild("Trader")
+def _trader_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Trader Wild: Draw 2 cards."""
+    for _ in range(2):
+        card = game.cosmic_deck.draw()
+        player.add_card(card)
+
+
+@wild("Filch")
+def _filch_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Filch Wild: Steal a random card."""
+    opponents = [p for p in game.players if p != player and p.hand]
+    if opponents:
+        target = game._rng.choice(opponents)
+        if target.hand:
+            stolen = game._rng.choice(target.hand)
+            target.remove_card(stolen)
+            player.add_card(stolen)
+
+
+@wild("Shadow")
+def _shadow_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Shadow Wild: Add 2 ships from colonies."""
+    taken = player.get_ships_from_colonies(2, game.planets)
+    if taken > 0:
+        if player == game.offense:
+            game.offense_ships[player.name] = game.offense_ships.get(player.name, 0) + taken
+        elif player == game.defense:
+            game.defense_ships[player.name] = game.defense_ships.get(player.name, 0) + taken
+        context["flare_bonus"] = context.get("flare_bonus", 0)  # Ships add naturally
+
+
+@wild("Warpish")
+def _warpish_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Warpish Wild: Send 2 opponent ships to warp."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        ships_to_remove = min(2, sum(game.defense_ships.values()) if player == game.offense else sum(game.offense_ships.values()))
+        if player == game.offense and game.defense:
+            removed = min(ships_to_remove, game.defense_ships.get(game.defense.name, 0))
+            game.defense_ships[game.defense.name] = game.defense_ships.get(game.defense.name, 0) - removed
+            game.defense.ships_in_warp += removed
+        elif game.offense:
+            removed = min(ships_to_remove, game.offense_ships.get(game.offense.name, 0))
+            game.offense_ships[game.offense.name] = game.offense_ships.get(game.offense.name, 0) - removed
+            game.offense.ships_in_warp += removed
+
+
+@wild("Spiff")
+def _spiff_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Spiff Wild: Draw 1 from rewards deck."""
+    card = game.rewards_deck.draw()
+    if card:
+        player.add_card(card)
+
+
+@wild("Horde")
+def _horde_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Horde Wild: Return 1 ship from warp."""
+    if player.ships_in_warp >= 1:
+        player.retrieve_ships_from_warp(1)
+        player.return_ships_to_colonies(1, player.home_planets)
+
+
+@wild("Clone")
+def _clone_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Clone Wild: Copy card just played (give +2 bonus since we can't actually copy)."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 2
+
+
+@wild("Loser")
+def _loser_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Loser Wild: Win this encounter if you would lose."""
+    context["loser_flare_wild"] = True
+
+
+@wild("Pacifist")
+def _pacifist_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Pacifist Wild: Add +10 if playing negotiate."""
+    if player == game.offense and isinstance(game.offense_card, NegotiateCard):
+        context["flare_bonus"] = context.get("flare_bonus", 0) + 10
+    elif player == game.defense and isinstance(game.defense_card, NegotiateCard):
+        context["flare_bonus"] = context.get("flare_bonus", 0) + 10
+
+
+@wild("Assassin")
+def _assassin_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Assassin Wild: Eliminate 1 opponent ship."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        if player == game.offense:
+            removed = min(1, game.defense_ships.get(opponent.name, 0))
+            game.defense_ships[opponent.name] = game.defense_ships.get(opponent.name, 0) - removed
+            opponent.ships_in_warp += removed
+        else:
+            removed = min(1, game.offense_ships.get(opponent.name, 0))
+            game.offense_ships[opponent.name] = game.offense_ships.get(opponent.name, 0) - removed
+            opponent.ships_in_warp += removed
+
+
+@wild("Mutant")
+def _mutant_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Mutant Wild: Draw 2 cards, keep 1."""
+    cards = [game.cosmic_deck.draw() for _ in range(2)]
+    cards = [c for c in cards if c]
+    if cards:
+        # Keep the better card (higher attack or any non-attack)
+        best = max(cards, key=lambda c: c.value if hasattr(c, 'value') and c.value else 0)
+        player.add_card(best)
+        for c in cards:
+            if c != best:
+                game.cosmic_deck.discard(c)
+
+
+@wild("Fodder")
+def _fodder_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Fodder Wild: Sacrifice 1 ship for +2."""
+    if player == game.offense and game.offense_ships.get(player.name, 0) > 1:
+        game.offense_ships[player.name] -= 1
+        player.ships_in_warp += 1
+        context["flare_bonus"] = context.get("flare_bonus", 0) + 2
+    elif player == game.defense and game.defense_ships.get(player.name, 0) > 1:
+        game.defense_ships[player.name] -= 1
+        player.ships_in_warp += 1
+        context["flare_bonus"] = context.get("flare_bonus", 0) + 2
+
+
+@wild("Grudge")
+def _grudge_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Grudge Wild: +3 against attacker."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 3
+
+
+@wild("Chosen")
+def _chosen_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Chosen Wild: Add top card of deck to total."""
+    card = game.cosmic_deck.draw()
+    if card and hasattr(card, 'value') and card.value:
+        context["flare_bonus"] = context.get("flare_bonus", 0) + card.value
+    game.cosmic_deck.discard(card)
+
+
+@wild("Sorcerer")
+def _sorcerer_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Sorcerer Wild: Swap encounter cards with opponent after reveal."""
+    if game.offense_card and game.defense_card:
+        game.offense_card, game.defense_card = game.defense_card, game.offense_card
+        game._log("Sorcerer flare swaps encounter cards!")
+
+
+@wild("Silencer")
+def _silencer_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Silencer Wild: Cancel one alien power this encounter."""
+    # Zap the opponent's power
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent and game.zap_power(opponent):
+        game._log("Silencer flare cancels {}'s power!", opponent.name)
+
+
+@wild("Void")
+def _void_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Void Wild: Remove one opposing ship from the game (to the void)."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        if player == game.offense and game.defense_ships.get(opponent.name, 0) > 0:
+            game.defense_ships[opponent.name] -= 1
+            opponent.ships_in_void = getattr(opponent, 'ships_in_void', 0) + 1
+            game._log("Void flare removes one of {}'s ships to the void!", opponent.name)
+        elif player == game.defense and game.offense_ships.get(opponent.name, 0) > 0:
+            game.offense_ships[opponent.name] -= 1
+            opponent.ships_in_void = getattr(opponent, 'ships_in_void', 0) + 1
+            game._log("Void flare removes one of {}'s ships to the void!", opponent.name)
+
+
+@wild("Saboteur")
+def _saboteur_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Saboteur Wild: Reduce one attack card by 10."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        if player == game.offense and isinstance(game.defense_card, AttackCard):
+            reduction = min(10, game.defense_card.value)
+            context["saboteur_reduction_defense"] = reduction
+        elif player == game.defense and isinstance(game.offense_card, AttackCard):
+            reduction = min(10, game.offense_card.value)
+            context["saboteur_reduction_offense"] = reduction
+
+
+@wild("Kamikaze")
+def _kamikaze_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Kamikaze Wild: Sacrifice ships for +4 each."""
+    if player == game.offense:
+        ships_available = game.offense_ships.get(player.name, 0) - 1
+        sacrifice = min(ships_available, 2)
+        if sacrifice > 0:
+            game.offense_ships[player.name] -= sacrifice
+            player.ships_in_warp += sacrifice
+            context["flare_bonus"] = context.get("flare_bonus", 0) + (sacrifice * 4)
+    elif player == game.defense:
+        ships_available = game.defense_ships.get(player.name, 0) - 1
+        sacrifice = min(ships_available, 2)
+        if sacrifice > 0:
+            game.defense_ships[player.name] -= sacrifice
+            player.ships_in_warp += sacrifice
+            context["flare_bonus"] = context.get("flare_bonus", 0) + (sacrifice * 4)
+
+
+@wild("Dictator")
+def _dictator_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Dictator Wild: Choose which card one opponent must play."""
+    # In simulation, force opponent to use their weakest card
+    context["dictator_force_weak"] = True
+
+
+@wild("Anti-Matter")
+def _anti_matter_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Anti-Matter Wild: Reverse the outcome - lower total wins."""
+    context["anti_matter_reverse"] = True
+    game._log("Anti-Matter flare reverses combat - lower total wins!")
+
+
+@wild("Leviathan")
+def _leviathan_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Leviathan Wild: Add +10 but lose 2 ships to warp."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 10
+    if player == game.offense and game.offense_ships.get(player.name, 0) > 2:
+        loss = min(2, game.offense_ships[player.name] - 1)
+        game.offense_ships[player.name] -= loss
+        player.ships_in_warp += loss
+    elif player == game.defense and game.defense_ships.get(player.name, 0) > 2:
+        loss = min(2, game.defense_ships[player.name] - 1)
+        game.defense_ships[player.name] -= loss
+        player.ships_in_warp += loss
+
+
+@wild("Warhawk")
+def _warhawk_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Warhawk Wild: Add +5 when attacking."""
+    if player == game.offense:
+        context["flare_bonus"] = context.get("flare_bonus", 0) + 5
+
+
+@wild("Trickster")
+def _trickster_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Trickster Wild: Play a negotiate as a 20 attack."""
+    if player == game.offense and isinstance(game.offense_card, NegotiateCard):
+        context["trickster_negotiate_value"] = 20
+    elif player == game.defense and isinstance(game.defense_card, NegotiateCard):
+        context["trickster_negotiate_value"] = 20
+
+
+@wild("Amoeba")
+def _amoeba_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Amoeba Wild: Add 2 ships to the encounter from warp."""
+    ships = min(2, player.ships_in_warp)
+    if ships > 0:
+        player.retrieve_ships_from_warp(ships)
+        if player == game.offense:
+            game.offense_ships[player.name] = game.offense_ships.get(player.name, 0) + ships
+        elif player == game.defense:
+            game.defense_ships[player.name] = game.defense_ships.get(player.name, 0) + ships
+
+
+@wild("Changeling")
+def _changeling_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Changeling Wild: Copy one alien power for this encounter."""
+    # Copy the opponent's power
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent and opponent.alien:
+        context["changeling_copied_power"] = opponent.alien.name
+        game._log("Changeling copies {}'s power!", opponent.alien.name)
+
+
+@wild("Nightmare")
+def _nightmare_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Nightmare Wild: Opponent must discard 2 cards."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        discards = min(2, len(opponent.hand))
+        for _ in range(discards):
+            if opponent.hand:
+                card = game._rng.choice(opponent.hand)
+                opponent.remove_card(card)
+                game.cosmic_deck.discard(card)
+
+
+@wild("Barbarian")
+def _barbarian_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Barbarian Wild: Pillage 1 card from loser."""
+    context["barbarian_pillage"] = 1
+
+
+@wild("Bully")
+def _bully_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Bully Wild: +4 against players with fewer colonies."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        my_colonies = player.count_foreign_colonies(game.planets)
+        opp_colonies = opponent.count_foreign_colonies(game.planets)
+        if opp_colonies < my_colonies:
+            context["flare_bonus"] = context.get("flare_bonus", 0) + 4
+
+
+@wild("Calculator")
+def _calculator_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Calculator Wild: Increase card value by the number of cards in hand."""
+    bonus = len(player.hand)
+    context["flare_bonus"] = context.get("flare_bonus", 0) + bonus
+
+
+@wild("Gambler")
+def _gambler_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Gambler Wild: Flip a coin. If heads, double card value."""
+    if game._rng.random() < 0.5:  # Heads
+        context["gambler_double"] = True
+        game._log("Gambler flare: Heads! Card value doubled!")
+    else:
+        game._log("Gambler flare: Tails! No effect.")
+
+
+def default_wild(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Default: +2 to total (generic Wild effect)."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 2
+
+
+# ========== SUPER EFFECTS ==========
+
+
+@super_("Machine")
+def _machine_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Machine Super: Take two extra encounters."""
+    game._flare_extra_encounter = True
+    game._flare_extra_encounter_count = 2
+
+
+@super_("Zombie")
+def _zombie_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Zombie Super: Return all ships from warp."""
+    ships = player.ships_in_warp
+    if ships > 0:
+        player.retrieve_ships_from_warp(ships)
+        player.return_ships_to_colonies(ships, player.home_planets)
+
+
+@super_("Human")
+def _human_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Human Super: Add +6 to total."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 6
+
+
+@super_("Warrior")
+def _warrior_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Warrior Super: +2 per ship in warp."""
+    bonus = player.ships_in_warp * 2
+    context["flare_bonus"] = context.get("flare_bonus", 0) + bonus
+
+
+@super_("Macron")
+def _macron_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Macron Super: Ships count as 5 each."""
+    context["flare_ship_multiplier"] = 5
+
+
+@super_("Healer")
+def _healer_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Healer Super: Return all ships from warp to colonies."""
+    for p in game.players:
+        ships = p.ships_in_warp
+        if ships > 0:
+            p.retrieve_ships_from_warp(ships)
+            p.return_ships_to_colonies(ships, p.home_planets)
+
+
+@super_("Trader")
+def _trader_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Trader Super: Trade hands with any player."""
+    opponents = [p for p in game.players if p != player]
+    if opponents:
+        # Trade with player who has most cards
+        target = max(opponents, key=lambda p: len(p.hand))
+        player.hand, target.hand = target.hand, player.hand
+
+
+@super_("Filch")
+def _filch_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Filch Super: Steal 2 cards."""
+    opponents = [p for p in game.players if p != player and p.hand]
+    if opponents:
+        target = game._rng.choice(opponents)
+        for _ in range(min(2, len(target.hand))):
+            if target.hand:
+                stolen = game._rng.choice(target.hand)
+                target.remove_card(stolen)
+                player.add_card(stolen)
+
+
+@super_("Virus")
+def _virus_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Virus Super: Triple ship count when adding."""
+    context["flare_ship_multiplier"] = 3
+
+
+@super_("Oracle")
+def _oracle_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Oracle Super: Look at and force different card."""
+    # Effect handled specially during planning
+    context["oracle_super"] = True
+
+
+@super_("Parasite")
+def _parasite_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Parasite Super: Join both sides."""
+    context["parasite_both_sides"] = True
+
+
+@super_("Shadow")
+def _shadow_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Shadow Super: Add 4 ships from colonies."""
+    taken = player.get_ships_from_colonies(4, game.planets)
+    if taken > 0:
+        if player == game.offense:
+            game.offense_ships[player.name] = game.offense_ships.get(player.name, 0) + taken
+        elif player == game.defense:
+            game.defense_ships[player.name] = game.defense_ships.get(player.name, 0) + taken
+
+
+@super_("Warpish")
+def _warpish_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Warpish Super: Send 4 opponent ships to warp."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        if player == game.offense and game.defense:
+            removed = min(4, game.defense_ships.get(game.defense.name, 0))
+            game.defense_ships[game.defense.name] = game.defense_ships.get(game.defense.name, 0) - removed
+            game.defense.ships_in_warp += removed
+        elif game.offense:
+            removed = min(4, game.offense_ships.get(game.offense.name, 0))
+            game.offense_ships[game.offense.name] = game.offense_ships.get(game.offense.name, 0) - removed
+            game.offense.ships_in_warp += removed
+
+
+@super_("Spiff")
+def _spiff_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Spiff Super: Draw 2 from rewards deck."""
+    for _ in range(2):
+        card = game.rewards_deck.draw()
+        if card:
+            player.add_card(card)
+
+
+@super_("Horde")
+def _horde_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Horde Super: Return 2 ships from warp."""
+    ships = min(2, player.ships_in_warp)
+    if ships > 0:
+        player.retrieve_ships_from_warp(ships)
+        player.return_ships_to_colonies(ships, player.home_planets)
+
+
+@super_("Clone")
+def _clone_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Clone Super: Play same card again (give +4 bonus as approximation)."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 4
+
+
+@super_("Loser")
+def _loser_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Loser Super: Automatically lose and win."""
+    context["loser_flare_super"] = True
+
+
+@super_("Pacifist")
+def _pacifist_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Pacifist Super: Extra colony on negotiate win."""
+    context["pacifist_extra_colony"] = True
+    if player == game.offense and isinstance(game.offense_card, NegotiateCard):
+        context["flare_bonus"] = context.get("flare_bonus", 0) + 10
+    elif player == game.defense and isinstance(game.defense_card, NegotiateCard):
+        context["flare_bonus"] = context.get("flare_bonus", 0) + 10
+
+
+@super_("Assassin")
+def _assassin_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Assassin Super: Eliminate 3 opponent ships."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        if player == game.offense:
+            removed = min(3, game.defense_ships.get(opponent.name, 0))
+            game.defense_ships[opponent.name] = game.defense_ships.get(opponent.name, 0) - removed
+            opponent.ships_in_warp += removed
+        else:
+            removed = min(3, game.offense_ships.get(opponent.name, 0))
+            game.offense_ships[opponent.name] = game.offense_ships.get(opponent.name, 0) - removed
+            opponent.ships_in_warp += removed
+
+
+@super_("Mutant")
+def _mutant_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Mutant Super: Draw 4 cards, keep 2."""
+    cards = [game.cosmic_deck.draw() for _ in range(4)]
+    cards = [c for c in cards if c]
+    if cards:
+        # Sort by value and keep best 2
+        cards.sort(key=lambda c: c.value if hasattr(c, 'value') and c.value else 0, reverse=True)
+        for i, c in enumerate(cards):
+            if i < 2:
+                player.add_card(c)
+            else:
+                game.cosmic_deck.discard(c)
+
+
+@super_("Fodder")
+def _fodder_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Fodder Super: Sacrifice any ships for +3 each."""
+    if player == game.offense:
+        ships_available = game.offense_ships.get(player.name, 0) - 1
+        sacrifice = min(ships_available, 2)  # Sacrifice up to 2
+        if sacrifice > 0:
+            game.offense_ships[player.name] -= sacrifice
+            player.ships_in_warp += sacrifice
+            context["flare_bonus"] = context.get("flare_bonus", 0) + (sacrifice * 3)
+    elif player == game.defense:
+        ships_available = game.defense_ships.get(player.name, 0) - 1
+        sacrifice = min(ships_available, 2)
+        if sacrifice > 0:
+            game.defense_ships[player.name] -= sacrifice
+            player.ships_in_warp += sacrifice
+            context["flare_bonus"] = context.get("flare_bonus", 0) + (sacrifice * 3)
+
+
+@super_("Grudge")
+def _grudge_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Grudge Super: +6 against attacker."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 6
+
+
+@super_("Chosen")
+def _chosen_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Chosen Super: Add top 2 cards of deck to total."""
+    total_bonus = 0
+    for _ in range(2):
+        card = game.cosmic_deck.draw()
+        if card and hasattr(card, 'value') and card.value:
+            total_bonus += card.value
+        if card:
+            game.cosmic_deck.discard(card)
+    context["flare_bonus"] = context.get("flare_bonus", 0) + total_bonus
+
+
+@super_("Tripler")
+def _tripler_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Tripler Super: Triple attack card value."""
+    context["tripler_super"] = True  # Handled in combat resolution
+
+
+@super_("Chronos")
+def _chronos_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Chronos Super: Take two additional turns."""
+    context["chronos_extra_turns"] = 2
+
+
+@super_("Diplomat")
+def _diplomat_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Diplomat Super: Force deal success with 2 colonies."""
+    context["diplomat_force_deal"] = True
+
+
+@super_("Sorcerer")
+def _sorcerer_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Sorcerer Super: Swap hands with any player."""
+    opponents = [p for p in game.players if p != player]
+    if opponents:
+        # Swap with player who has the best hand
+        target = max(opponents, key=lambda p: len(p.hand))
+        player.hand, target.hand = target.hand, player.hand
+        game._log("Sorcerer Super swaps hands with {}!", target.name)
+
+
+@super_("Silencer")
+def _silencer_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Silencer Super: Cancel all alien powers this encounter."""
+    for p in game.players:
+        if p != player:
+            game.zap_power(p)
+    game._log("Silencer Super cancels ALL alien powers!")
+
+
+@super_("Void")
+def _void_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Void Super: Remove all ships from one planet to the void."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        if player == game.offense:
+            ships = game.defense_ships.get(opponent.name, 0)
+            game.defense_ships[opponent.name] = 0
+            opponent.ships_in_void = getattr(opponent, 'ships_in_void', 0) + ships
+        else:
+            ships = game.offense_ships.get(opponent.name, 0)
+            game.offense_ships[opponent.name] = 0
+            opponent.ships_in_void = getattr(opponent, 'ships_in_void', 0) + ships
+        if ships > 0:
+            game._log("Void Super removes {} ships to the void!", ships)
+
+
+@super_("Saboteur")
+def _saboteur_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Saboteur Super: Reduce opponent's card to 0."""
+    if player == game.offense:
+        context["saboteur_zero_defense"] = True
+    else:
+        context["saboteur_zero_offense"] = True
+    game._log("Saboteur Super reduces opponent's card to 0!")
+
+
+@super_("Kamikaze")
+def _kamikaze_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Kamikaze Super: Sacrifice all ships for instant win."""
+    context["kamikaze_instant_win"] = True
+    # Sacrifice all ships
+    if player == game.offense:
+        ships = game.offense_ships.get(player.name, 0)
+        game.offense_ships[player.name] = 0
+        player.ships_in_warp += ships
+    elif player == game.defense:
+        ships = game.defense_ships.get(player.name, 0)
+        game.defense_ships[player.name] = 0
+        player.ships_in_warp += ships
+    game._log("Kamikaze Super: All ships sacrificed for instant win!")
+
+
+@super_("Dictator")
+def _dictator_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Dictator Super: Choose the encounter cards for both main players."""
+    context["dictator_control_both"] = True
+
+
+@super_("Anti-Matter")
+def _anti_matter_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Anti-Matter Super: Your 0 attack cards count as 40."""
+    if player == game.offense and isinstance(game.offense_card, AttackCard):
+        if game.offense_card.value == 0:
+            context["anti_matter_zero_boost"] = 40
+    elif player == game.defense and isinstance(game.defense_card, AttackCard):
+        if game.defense_card.value == 0:
+            context["anti_matter_zero_boost"] = 40
+
+
+@super_("Leviathan")
+def _leviathan_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Leviathan Super: Add +20, no ship loss."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 20
+
+
+@super_("Warhawk")
+def _warhawk_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Warhawk Super: Add +10 when attacking."""
+    if player == game.offense:
+        context["flare_bonus"] = context.get("flare_bonus", 0) + 10
+
+
+@super_("Trickster")
+def _trickster_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Trickster Super: Negotiate counts as 30 attack."""
+    if player == game.offense and isinstance(game.offense_card, NegotiateCard):
+        context["trickster_negotiate_value"] = 30
+    elif player == game.defense and isinstance(game.defense_card, NegotiateCard):
+        context["trickster_negotiate_value"] = 30
+
+
+@super_("Amoeba")
+def _amoeba_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Amoeba Super: Add 4 ships from anywhere to encounter."""
+    # First try warp, then colonies
+    ships_needed = 4
+    from_warp = min(ships_needed, player.ships_in_warp)
+    if from_warp > 0:
+        player.retrieve_ships_from_warp(from_warp)
+    remaining = ships_needed - from_warp
+    if remaining > 0:
+        from_colonies = player.get_ships_from_colonies(remaining, game.planets)
+    else:
+        from_colonies = 0
+    total_added = from_warp + from_colonies
+    if total_added > 0:
+        if player == game.offense:
+            game.offense_ships[player.name] = game.offense_ships.get(player.name, 0) + total_added
+        elif player == game.defense:
+            game.defense_ships[player.name] = game.defense_ships.get(player.name, 0) + total_added
+
+
+@super_("Changeling")
+def _changeling_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Changeling Super: Copy two alien powers for this encounter."""
+    other_aliens = [p.alien.name for p in game.players if p != player and p.alien]
+    if len(other_aliens) >= 2:
+        context["changeling_copied_powers"] = other_aliens[:2]
+    elif other_aliens:
+        context["changeling_copied_powers"] = other_aliens
+
+
+@super_("Nightmare")
+def _nightmare_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Nightmare Super: Opponent discards half their hand."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        discards = len(opponent.hand) // 2
+        for _ in range(discards):
+            if opponent.hand:
+                card = game._rng.choice(opponent.hand)
+                opponent.remove_card(card)
+                game.cosmic_deck.discard(card)
+
+
+@super_("Barbarian")
+def _barbarian_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Barbarian Super: Pillage 3 cards from loser."""
+    context["barbarian_pillage"] = 3
+
+
+@super_("Bully")
+def _bully_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Bully Super: +8 against players with fewer colonies."""
+    opponent = game.defense if player == game.offense else game.offense
+    if opponent:
+        my_colonies = player.count_foreign_colonies(game.planets)
+        opp_colonies = opponent.count_foreign_colonies(game.planets)
+        if opp_colonies < my_colonies:
+            context["flare_bonus"] = context.get("flare_bonus", 0) + 8
+
+
+@super_("Calculator")
+def _calculator_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Calculator Super: Double card value based on cards in hand."""
+    bonus = len(player.hand) * 2
+    context["flare_bonus"] = context.get("flare_bonus", 0) + bonus
+
+
+@super_("Gambler")
+def _gambler_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Gambler Super: Triple card value on heads, normal on tails (choose the result)."""
+    context["gambler_triple"] = True
+    game._log("Gambler Super: Guaranteed triple!")
+
+
+@super_("Magician")
+def _magician_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Magician Super: Take best cards from all hands."""
+    for p in game.players:
+        if p != player and p.hand:
+            attack_cards = [c for c in p.hand if hasattr(c, 'value') and c.value]
+            if attack_cards:
+                best = max(attack_cards, key=lambda c: c.value)
+                p.remove_card(best)
+                player.add_card(best)
+
+
+@super_("Negator")
+def _negator_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Negator Super: Cancel all alien powers this encounter."""
+    for p in game.players:
+        game.zap_power(p)
+    game._log("Negator Super cancels ALL alien powers!")
+
+
+@super_("Anarchist")
+def _anarchist_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Anarchist Super: You make the rules this encounter (+10 bonus as approximation)."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 10
+    context["anarchist_super"] = True
+
+
+def default_super(game: "Game", player: "Player", context: Dict[str, Any]) -> None:
+    """Default: +4 to total (generic Super effect)."""
+    context["flare_bonus"] = context.get("flare_bonus", 0) + 4
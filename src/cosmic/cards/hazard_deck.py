@@ -215,6 +215,8 @@ class HazardDeck:
     # Track current hazard for the encounter
     current_hazard: Optional[HazardCard] = None
 
+    _cards: List[HazardCard] = field(default_factory=list, init=False, repr=False, compare=False)  # Every hazard in build order
+
     def __post_init__(self):
         if not self.draw_pile:
             self._initialize_deck()
@@ -231,6 +233,25 @@ class HazardDeck:
                 affects_all=data.get("affects_all", False)
             )
             self.draw_pile.append(hazard)
+        self._cards = list(self.draw_pile)
+
+    def reset(self, seed: int) -> None:
+        """
+        Gather every hazard back into a freshly shuffled, enabled deck.
+
+        The deck ends up as a new one built with random.Random(seed) would
+        be, reusing its cards and RNG.
+        """
+        self._rng.seed(seed)
+        self.enabled = True
+        self.current_hazard = None
+        self.discard_pile.clear()
+        if self._cards:
+            self.draw_pile[:] = self._cards
+        else:
+            self.draw_pile.clear()
+            self._initialize_deck()
+        self.shuffle()
 
     def shuffle(self) -> None:
         """Shuffle the hazard deck."""
@@ -317,7 +338,7 @@ def apply_hazard_effect(game: "Game", hazard: HazardCard) -> bool:
     elif effect_type == "meteor_damage":
         # Each player loses 1 ship from largest colony
         for player in game.players:
-            colonies = [p for p in game.planets if p.has_colony(player.name)]
+            colonies = player.get_colonies(game.planets)
             if colonies:
                 largest = max(colonies, key=lambda p: p.get_ships(player.name))
                 ships = largest.get_ships(player.name)
@@ -349,8 +370,7 @@ def apply_hazard_effect(game: "Game", hazard: HazardCard) -> bool:
     elif effect_type == "disable_all_powers":
         # All powers zapped this encounter
         for player in game.players:
-            if player not in game.zapped_powers:
-                game.zapped_powers.append(player)
+            game.zap_power(player)
         return True
 
     elif effect_type == "lose_half_hand":
@@ -3,6 +3,7 @@ The Rewards Deck - drawn as rewards for defensive allies.
 """
 
 import random
+from array import array
 from typing import List
 from dataclasses import dataclass, field
 
@@ -10,83 +11,117 @@ from .base import (
     Card, AttackCard, NegotiateCard,
     ReinforcementCard, ArtifactCard, KickerCard
 )
+from .catalogue import CARDS, card_id, card_ids, cards_for
 from ..types import ArtifactType
 
 
+def _rewards_cards() -> List[Card]:
+    """The rewards deck, in build order."""
+    cards: List[Card] = []
+
+    # Attack cards - generally higher values, includes negative
+    attack_values = [-7, -1, 10, 12, 14, 16, 18, 20, 23]
+    for value in attack_values:
+        cards.append(AttackCard(value=value, _from_rewards_deck=True))
+
+    # Negotiate cards (can be special negotiates in expansions)
+    for _ in range(4):
+        cards.append(NegotiateCard(_from_rewards_deck=True))
+
+    # Reinforcement cards - higher values
+    reinforcement_values = [4, 4, 6, 6]
+    for value in reinforcement_values:
+        cards.append(ReinforcementCard(value=value, _from_rewards_deck=True))
+
+    # Kicker cards
+    kicker_values = [-1, 0, 1, 2, 2, 3, 4]
+    for value in kicker_values:
+        cards.append(KickerCard(value=value, _from_rewards_deck=True))
+
+    # Artifacts (powerful ones)
+    reward_artifacts = [
+        ArtifactType.COSMIC_ZAP,
+        ArtifactType.CARD_ZAP,
+        ArtifactType.OMNI_ZAP,
+        ArtifactType.SOLAR_WIND,
+        ArtifactType.REBIRTH,
+        ArtifactType.SHIP_ZAP,
+        ArtifactType.HAND_ZAP,
+        ArtifactType.SPACE_JUNK,
+        ArtifactType.VICTORY_BOON,
+    ]
+    for artifact_type in reward_artifacts:
+        cards.append(ArtifactCard(
+            artifact_type=artifact_type,
+            _from_rewards_deck=True
+        ))
+
+    return cards
+
+
+# Card IDs of the rewards deck
+REWARDS_DECK = card_ids(_rewards_cards())
+
+
 @dataclass
 class RewardsDeck:
     """
     The rewards deck contains special cards for defensive ally rewards.
     Generally has stronger cards than the cosmic deck.
+
+    Like the CosmicDeck, the piles hold catalogue card IDs.
     """
-    draw_pile: List[Card] = field(default_factory=list)
-    discard_pile: List[Card] = field(default_factory=list)
+    draw_ids: array = field(default_factory=lambda: array("H"))
+    discard_ids: array = field(default_factory=lambda: array("H"))
     _rng: random.Random = field(default_factory=random.Random)
 
     def __post_init__(self):
-        if not self.draw_pile:
+        if not self.draw_ids:
             self._initialize_deck()
             self.shuffle()
 
     def _initialize_deck(self) -> None:
         """Create the rewards deck."""
-        cards: List[Card] = []
-
-        # Attack cards - generally higher values, includes negative
-        attack_values = [-7, -1, 10, 12, 14, 16, 18, 20, 23]
-        for value in attack_values:
-            cards.append(AttackCard(value=value, _from_rewards_deck=True))
-
-        # Negotiate cards (can be special negotiates in expansions)
-        for _ in range(4):
-            cards.append(NegotiateCard(_from_rewards_deck=True))
-
-        # Reinforcement cards - higher values
-        reinforcement_values = [4, 4, 6, 6]
-        for value in reinforcement_values:
-            cards.append(ReinforcementCard(value=value, _from_rewards_deck=True))
-
-        # Kicker cards
-        kicker_values = [-1, 0, 1, 2, 2, 3, 4]
-        for value in kicker_values:
-            cards.append(KickerCard(value=value, _from_rewards_deck=True))
-
-        # Artifacts (powerful ones)
-        reward_artifacts = [
-            ArtifactType.COSMIC_ZAP,
-            ArtifactType.CARD_ZAP,
-            ArtifactType.OMNI_ZAP,
-            ArtifactType.SOLAR_WIND,
-            ArtifactType.REBIRTH,
-            ArtifactType.SHIP_ZAP,
-            ArtifactType.HAND_ZAP,
-            ArtifactType.SPACE_JUNK,
-            ArtifactType.VICTORY_BOON,
-        ]
-        for artifact_type in reward_artifacts:
-            cards.append(ArtifactCard(
-                artifact_type=artifact_type,
-                _from_rewards_deck=True
-            ))
-
-        self.draw_pile = cards
+        self.draw_ids[:] = REWARDS_DECK
+
+    @property
+    def draw_pile(self) -> List[Card]:
+        """The cards in the draw pile, bottom to top (a copy)."""
+        return cards_for(self.draw_ids)
+
+    @property
+    def discard_pile(self) -> List[Card]:
+        """The cards in the discard pile, oldest first (a copy)."""
+        return cards_for(self.discard_ids)
+
+    def reset(self, seed: int) -> None:
+        """
+        Gather the standard cards back into a freshly shuffled draw pile.
+
+        The deck ends up as a new one built with random.Random(seed) would
+        be, reusing its buffers and RNG.
+        """
+        self._rng.seed(seed)
+        del self.discard_ids[:]
+        self._initialize_deck()
+        self.shuffle()
 
     def shuffle(self) -> None:
         """Shuffle the draw pile."""
-        self._rng.shuffle(self.draw_pile)
+        self._rng.shuffle(self.draw_ids)
 
     def draw(self) -> Card:
         """Draw a card from the deck, reshuffling discard if needed."""
-        if not self.draw_pile:
+        if not self.draw_ids:
             self._reshuffle_discard()
 
-        if not self.draw_pile:
+        if not self.draw_ids:
             # If deck is completely empty, regenerate it
             # This can happen if all cards are in player hands
             self._initialize_deck()
             self.shuffle()
 
-        return self.draw_pile.pop()
+        return CARDS[self.draw_ids.pop()]
 
     def draw_multiple(self, count: int) -> List[Card]:
         """Draw multiple cards."""
@@ -94,23 +129,24 @@ class RewardsDeck:
 
     def discard(self, card: Card) -> None:
         """Add a card to the discard pile."""
-        self.discard_pile.append(card)
+        self.discard_ids.append(card_id(card))
 
     def discard_multiple(self, cards: List[Card]) -> None:
         """Discard multiple cards."""
-        self.discard_pile.extend(cards)
+        self.discard_ids.extend(map(card_id, cards))
 
     def _reshuffle_discard(self) -> None:
         """Shuffle the discard pile back into the draw pile."""
-        if not self.discard_pile:
+        if not self.discard_ids:
             return
-        self.draw_pile = self.discard_pile
-        self.discard_pile = []
+        # The discard pile becomes the draw pile; swap buffers rather than copy
+        self.draw_ids, self.discard_ids = self.discard_ids, self.draw_ids
+        del self.discard_ids[:]
         self.shuffle()
 
     def cards_remaining(self) -> int:
         """Number of cards in draw pile."""
-        return len(self.draw_pile)
+        return len(self.draw_ids)
 
     def set_rng(self, rng: random.Random) -> None:
         """Set the random number generator for reproducibility."""
@@ -218,6 +218,7 @@ class TechDeck:
     """
     draw_pile: List[TechCard] = field(default_factory=list)
     _rng: random.Random = field(default_factory=random.Random)
+    _cards: List[TechCard] = field(default_factory=list, init=False, repr=False, compare=False)  # Every tech in build order
 
     def __post_init__(self):
         if not self.draw_pile:
@@ -234,6 +235,24 @@ class TechDeck:
                 category=data["category"]
             )
             self.draw_pile.append(tech)
+        self._cards = list(self.draw_pile)
+
+    def reset(self, seed: int) -> None:
+        """
+        Return every tech, unresearched, to a freshly shuffled deck.
+
+        The deck ends up as a new one built with random.Random(seed) would
+        be, reusing its cards and RNG.
+        """
+        self._rng.seed(seed)
+        if self._cards:
+            for tech in self._cards:
+                tech.reset()
+            self.draw_pile[:] = self._cards
+        else:
+            self.draw_pile.clear()
+            self._initialize_deck()
+        self.shuffle()
 
     def shuffle(self) -> None:
         """Shuffle the tech deck."""
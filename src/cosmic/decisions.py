@@ -0,0 +1,189 @@
+"""
+Decision requests for the stepped game engine.
+
+Game.steps() plays a game as a generator that yields a Decision whenever
+the encounter flow needs a player's choice, and resumes with the answer
+sent back. An outside driver can hold many games at once, answer their
+pending decisions together (one batched policy evaluation, or remote
+agents), and never needs a thread per game.
+
+Each Decision records the arguments of the AIStrategy method it stands
+for; ask() answers it the way an AIStrategy would. Game.play() answers
+every decision with the player's own AI, so stepping a game with ask()
+reproduces play() exactly.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .player import Player
+    from .ai.base import AIStrategy
+
+
+@dataclass(slots=True)
+class Decision(ABC):
+    """A choice the engine needs from a player."""
+    player: "Player"
+
+    @abstractmethod
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        """The answer ai gives to this decision."""
+        pass
+
+
+@dataclass(slots=True)
+class SelectAttackPlanet(Decision):
+    """Offense aims the gate at a planet in the defense's system. Answer: Planet."""
+    defense: "Player"
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.select_attack_planet(game, self.player, self.defense)
+
+
+@dataclass(slots=True)
+class SelectShips(Decision):
+    """Offense commits ships to the gate. Answer: ship count."""
+    max_ships: int
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.select_ships_for_encounter(game, self.player, self.max_ships)
+
+
+@dataclass(slots=True)
+class InviteAllies(Decision):
+    """A main player invites allies. Answer: list of players."""
+    potential_allies: List["Player"]
+    as_offense: bool
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.decide_alliance_invitation(game, self.player, self.potential_allies, self.as_offense)
+
+
+@dataclass(slots=True)
+class RespondToAlliance(Decision):
+    """An invited player picks a side. Answer: Side, or None to decline."""
+    offense: "Player"
+    defense: "Player"
+    invited_by_offense: bool
+    invited_by_defense: bool
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.decide_alliance_response(
+            game, self.player, self.offense, self.defense,
+            self.invited_by_offense, self.invited_by_defense
+        )
+
+
+@dataclass(slots=True)
+class SelectAllyShips(Decision):
+    """An ally commits ships. Answer: ship count."""
+    max_ships: int
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.select_ally_ships(game, self.player, self.max_ships)
+
+
+@dataclass(slots=True)
+class SelectEncounterCard(Decision):
+    """A main player picks an encounter card from hand. Answer: card."""
+    is_offense: bool
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.select_encounter_card(game, self.player, self.is_offense)
+
+
+@dataclass(slots=True)
+class SelectKicker(Decision):
+    """A main player who played an attack may add a kicker. Answer: card or None."""
+    is_offense: bool
+    attack_value: int
+    opponent_total: int
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.select_kicker_card(
+            game, self.player, self.is_offense, self.attack_value, self.opponent_total
+        )
+
+
+@dataclass(slots=True)
+class SelectReinforcements(Decision):
+    """A main player or ally may play reinforcements. Answer: list of cards."""
+    is_offense: bool
+    current_total: int
+    opponent_total: int
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.select_reinforcement_cards(
+            game, self.player, self.is_offense, self.current_total, self.opponent_total
+        )
+
+
+@dataclass(slots=True)
+class NegotiateDeal(Decision):
+    """A main player proposes deal terms. Answer: deal dict, or None."""
+    opponent: "Player"
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.negotiate_deal(game, self.player, self.opponent)
+
+
+@dataclass(slots=True)
+class ChooseAllyReward(Decision):
+    """A winning defensive ally picks a reward. Answer: "cards" or "ships"."""
+    ships_committed: int
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.choose_ally_reward(game, self.player, self.ships_committed)
+
+
+@dataclass(slots=True)
+class TakeSecondEncounter(Decision):
+    """Offense may take a second encounter. Answer: bool."""
+
+    def ask(self, game: "Game", ai: "AIStrategy") -> Any:
+        return ai.want_second_encounter(game, self.player)
+
+
+Policy = Callable[[Sequence[Tuple["Game", Decision]]], Sequence[Any]]
+
+
+def drive(games: Iterable["Game"], policy: Policy) -> List[List["Player"]]:
+    """
+    Play set-up games to completion together, answering decisions in batches.
+
+    Each round gathers the pending decision of every unfinished game and
+    passes them to policy in one call; policy returns the answers in the
+    same order.
+
+    Returns:
+        Each game's winners, in the order the games were given
+    """
+    games = list(games)
+    winners: List[Optional[List["Player"]]] = [None] * len(games)
+    steppers: Dict[int, Any] = {}
+    pending: Dict[int, Decision] = {}
+
+    def advance(index: int, answer: Any = None, first: bool = False) -> None:
+        try:
+            stepper = steppers[index]
+            pending[index] = next(stepper) if first else stepper.send(answer)
+        except StopIteration as stop:
+            winners[index] = stop.value
+            pending.pop(index, None)
+
+    for index, game in enumerate(games):
+        steppers[index] = game.steps()
+        advance(index, first=True)
+
+    while pending:
+        batch = list(pending.items())
+        answers = policy([(games[index], decision) for index, decision in batch])
+        if len(answers) != len(batch):
+            raise ValueError(f"Policy answered {len(answers)} of {len(batch)} decisions")
+        for (index, _), answer in zip(batch, answers):
+            advance(index, answer)
+
+    return winners
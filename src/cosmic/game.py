@@ -2,32 +2,117 @@
 Main Game class for Cosmic Encounter simulator.
 """
 
+import copy
+import os
 import random
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass, replace
+from typing import List, Optional, Dict, Any, Generator, Tuple
 
 from .types import GamePhase, GameConfig, Side, PlayerRole, Color, ShipCount, DealType, StationType, Expansion, EXPANSION_FEATURES
+from .types import PowerCapability, PowerTiming
 from .player import Player
 from .planet import Planet
+from .board_index import BoardIndex
+from .ship_matrix import ShipMatrix
+from .snapshot import GameSnapshot
 from .cards import CosmicDeck, DestinyDeck, RewardsDeck, FlareDeck
 from .cards.base import Card, EncounterCard, AttackCard, NegotiateCard, MorphCard, ReinforcementCard, ArtifactCard, KickerCard, FlareCard
 from .cards.tech_deck import TechDeck, TechCard, TECH_EFFECTS
 from .cards.hazard_deck import HazardDeck, HazardCard, apply_hazard_effect, HazardTiming
+from .cards.flare_effects import get_wild_effect, get_super_effect
 from .types import ArtifactType
 from .aliens import AlienRegistry, AlienPower
-from .aliens.official_aliens import get_alien_expansion_enum
+from .aliens.base import HOOK_NAMES
 from .ai.basic_ai import BasicAI
+from .ai.base import AIStrategy
+from .decisions import (
+    Decision, SelectAttackPlanet, SelectShips, InviteAllies, RespondToAlliance,
+    SelectAllyShips, SelectEncounterCard, SelectKicker, SelectReinforcements,
+    NegotiateDeal, ChooseAllyReward, TakeSecondEncounter,
+)
+from .utils.seeding import derive_seed, new_master_seed
+
+# Power timings usable in each game phase (CONSTANT and ANY are usable in all)
+_PHASE_TIMINGS: Dict[GamePhase, frozenset] = {
+    phase: frozenset(timings) | {PowerTiming.CONSTANT, PowerTiming.ANY}
+    for phase, timings in {
+        GamePhase.START_TURN: [PowerTiming.START_TURN, PowerTiming.START_ENCOUNTER],
+        GamePhase.REGROUP: [PowerTiming.REGROUP],
+        GamePhase.DESTINY: [PowerTiming.DESTINY],
+        GamePhase.LAUNCH: [PowerTiming.LAUNCH],
+        GamePhase.ALLIANCE: [PowerTiming.ALLIANCE],
+        GamePhase.PLANNING: [PowerTiming.PLANNING],
+        GamePhase.REVEAL: [PowerTiming.REVEAL],
+        GamePhase.RESOLUTION: [
+            PowerTiming.RESOLUTION,
+            PowerTiming.WIN_ENCOUNTER,
+            PowerTiming.LOSE_ENCOUNTER,
+            PowerTiming.SHIPS_TO_WARP,
+        ],
+    }.items()
+}
+
+# AlienPower hook behind each apply_power_modifications type
+_MODIFICATION_HOOKS = {
+    'attack': "modify_attack_value",
+    'ships': "modify_ship_count",
+    'total': "modify_total",
+}
+
+
+# Game fields Game.reset carries over to the next game rather than defaulting
+_RESET_KEEP = (
+    "config", "_rng", "cosmic_deck", "destiny_deck", "rewards_deck",
+    "verbose", "headless", "verify_board", "compact_board",
+    "_spare_players", "_spare_planets", "_spare_decks",
+)
+
+
+def _reset_fields(obj: Any, keep: Tuple[str, ...] = ()) -> None:
+    """
+    Return a dataclass instance's defaulted fields to their defaults in place.
+
+    Lists and dicts are emptied rather than replaced so their storage is
+    reused. Fields without a default and those named in keep are left
+    alone, and attributes set outside the dataclass fields (counters some
+    powers attach at runtime) are removed.
+    """
+    names, defaults = _field_defaults(type(obj))
+    for name, default, factory in defaults:
+        if name in keep:
+            continue
+        if factory is None:
+            setattr(obj, name, default)
+        else:
+            value = getattr(obj, name)
+            if isinstance(value, (list, dict)):
+                value.clear()
+            elif type(value) is factory and is_dataclass(value):
+                _reset_fields(value)  # Owned state such as a player's tech_state
+            else:
+                setattr(obj, name, factory())
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is not None and len(attrs) > len(names):
+        for name in [name for name in attrs if name not in names]:
+            delattr(obj, name)
+
 
-# Lazy singleton for default AI strategy (avoids creating new instance each time)
-_default_ai: Optional[BasicAI] = None
+_field_defaults_cache: Dict[type, Tuple[frozenset, Tuple[Tuple[str, Any, Any], ...]]] = {}
 
 
-def get_default_ai() -> BasicAI:
-    """Get or create the default AI strategy singleton."""
-    global _default_ai
-    if _default_ai is None:
-        _default_ai = BasicAI()
-    return _default_ai
+def _field_defaults(cls: type) -> Tuple[frozenset, Tuple[Tuple[str, Any, Any], ...]]:
+    """A dataclass's field names, and (name, default, factory) for each defaulted field."""
+    cached = _field_defaults_cache.get(cls)
+    if cached is None:
+        defaults = []
+        for f in fields(cls):
+            if f.default is not MISSING:
+                defaults.append((f.name, f.default, None))
+            elif f.default_factory is not MISSING:
+                defaults.append((f.name, None, f.default_factory))
+        cached = (frozenset(f.name for f in fields(cls)), tuple(defaults))
+        _field_defaults_cache[cls] = cached
+    return cached
 
 
 @dataclass
@@ -105,6 +190,8 @@ class Game:
     config: GameConfig = field(default_factory=GameConfig)
     players: List[Player] = field(default_factory=list)
     planets: List[Planet] = field(default_factory=list)
+    board: Optional[BoardIndex] = field(default=None, init=False, repr=False)  # Ship locations, set with planets
+    ship_matrix: Optional[ShipMatrix] = field(default=None, init=False, repr=False)  # Set when compact_board
 
     # Decks
     cosmic_deck: CosmicDeck = field(default_factory=CosmicDeck)
@@ -161,14 +248,35 @@ class Game:
     winners: List[Player] = field(default_factory=list)
 
     # Internal
+    seed: Optional[int] = field(default=None, init=False)  # Resolved game seed (config.seed or fresh entropy)
     _rng: random.Random = field(default_factory=random.Random)
+    _fallback_ai: Optional[AIStrategy] = field(default=None, init=False)  # For players without an AI
     _turn_order: List[Player] = field(default_factory=list)
     _player_index: int = 0
     _player_by_name: Dict[str, Player] = field(default_factory=dict)  # O(1) player lookup cache
+    _hook_subscribers: Dict[str, List[Player]] = field(default_factory=dict, init=False, repr=False)  # Hook -> players whose alien overrides it
+    _capabilities: Dict[str, int] = field(default_factory=dict, init=False, repr=False)  # Player name -> primary alien's PowerCapability bits
+
+    # Power eligibility tables (see _build_power_table). Bits 2*seat and 2*seat+1
+    # are a player's primary and secondary power; zap bits are 1 << seat.
+    _seats: Dict[int, int] = field(default_factory=dict, init=False, repr=False)  # id(player) -> seat
+    _seat_powers: List[Tuple[AlienPower, ...]] = field(default_factory=list, init=False, repr=False)
+    _phase_powers: Dict[GamePhase, int] = field(default_factory=dict, init=False, repr=False)  # Timing-eligible power bits
+    _zap_bits: int = field(default=0, init=False, repr=False)  # Seats in zapped_powers (written only by zap_power)
+
+    # Objects from the previous game for setup to reuse (see reset)
+    _spare_players: List[Player] = field(default_factory=list, init=False, repr=False)
+    _spare_planets: List[Planet] = field(default_factory=list, init=False, repr=False)
+    _spare_decks: Dict[type, Any] = field(default_factory=dict, init=False, repr=False)  # Expansion deck type -> deck
+    _spare_board: Optional[BoardIndex] = field(default=None, init=False, repr=False)
 
     # Logging/debugging
     log: List[str] = field(default_factory=list)
     verbose: bool = False
+    headless: bool = False  # Skip event logging entirely (bulk simulation)
+    # Check the board index against a full scan after every encounter
+    verify_board: bool = field(default_factory=lambda: os.environ.get("COSMIC_VERIFY_BOARD") == "1")
+    compact_board: bool = False  # Store planet ships in one ShipMatrix instead of per-planet dicts
 
     # Selected expansions for this game (set during setup)
     selected_expansions: List[Expansion] = field(default_factory=list)
@@ -229,35 +337,111 @@ class Game:
 
         # Initialize decks for enabled features
         if self.config.use_tech and self.tech_deck is None:
-            self.tech_deck = TechDeck()
-            self.tech_deck.set_rng(self._rng)
+            self.tech_deck = self._expansion_deck(TechDeck, "tech_deck")
 
         if self.config.use_hazards and self.hazard_deck is None:
-            self.hazard_deck = HazardDeck()
-            self.hazard_deck.set_rng(self._rng)
-
-    def _filter_aliens_by_expansion(self, aliens: List[AlienPower]) -> List[AlienPower]:
-        """Filter aliens to only those from selected expansions."""
-        return [
-            alien for alien in aliens
-            if get_alien_expansion_enum(alien.name) in self.selected_expansions
-        ]
+            self.hazard_deck = self._expansion_deck(HazardDeck, "hazard_deck")
 
     def __post_init__(self):
-        if self.config.seed is not None:
-            self._rng.seed(self.config.seed)
-            self.cosmic_deck.set_rng(self._rng)
-            self.destiny_deck.set_rng(self._rng)
-            self.rewards_deck.set_rng(self._rng)
+        # Setup enables expansion flags on the config, so work on a private
+        # copy rather than mutating one the caller may share between games
+        self.config = replace(self.config)
+        self._seed_game()
+
+    def _seed_game(self) -> None:
+        """Seed the game from self.config and deal its decks from the seed."""
+        # Every source of randomness in the game is a named child stream of
+        # the game seed, so a game is a pure function of (config, lineup, seed).
+        self.seed = self.config.seed if self.config.seed is not None else new_master_seed()
+        self._rng.seed(derive_seed(self.seed, "game"))
+
+        # Reset the standard decks so their initial shuffle uses their stream
+        self.cosmic_deck.reset(derive_seed(self.seed, "cosmic_deck"))
+        self.destiny_deck.reset(derive_seed(self.seed, "destiny_deck"))
+        self.rewards_deck.reset(derive_seed(self.seed, "rewards_deck"))
 
         # Initialize optional expansion decks
         if self.config.use_tech:
-            self.tech_deck = TechDeck()
-            self.tech_deck.set_rng(self._rng)
+            self.tech_deck = self._expansion_deck(TechDeck, "tech_deck")
 
         if self.config.use_hazards:
-            self.hazard_deck = HazardDeck()
-            self.hazard_deck.set_rng(self._rng)
+            self.hazard_deck = self._expansion_deck(HazardDeck, "hazard_deck")
+
+    def _expansion_deck(self, deck_type: type, stream: str) -> Any:
+        """A new deck_type shuffled with the named stream, reusing the previous game's if possible."""
+        deck = self._spare_decks.pop(deck_type, None)
+        if deck is None:
+            return deck_type(_rng=self._rng_stream(stream))
+        deck.reset(derive_seed(self.seed, stream))
+        return deck
+
+    def reset(
+        self,
+        config: GameConfig,
+        seed: Optional[int] = None,
+        powers: Optional[List[str]] = None,
+        player_names: Optional[List[str]] = None
+    ) -> None:
+        """
+        Start a new game in this object, reusing its structures.
+
+        Equivalent to Game(config=config) followed by setup(player_names,
+        powers), keeping this game's logging and board settings. The decks'
+        cards and RNGs, the players (with their hands and AIs), the planets
+        and the tracking lists and dicts are reused rather than rebuilt, so
+        anything read from the previous game is invalid afterwards.
+
+        Args:
+            config: Configuration for the new game
+            seed: Game seed, overriding config.seed
+            powers: Alien power names to assign (default: random)
+            player_names: Names for players (default: Player 1, Player 2, etc.)
+        """
+        board = self.board
+        if board is not None:
+            board.detach()
+        spare_players = self.players[::-1]
+        spare_planets = self.planets[::-1] if self.ship_matrix is None else []
+        spare_decks = [deck for deck in (self.tech_deck, self.hazard_deck) if deck is not None]
+
+        _reset_fields(self, keep=_RESET_KEEP)
+        self._spare_players.extend(spare_players)
+        self._spare_planets.extend(spare_planets)
+        for deck in spare_decks:
+            self._spare_decks[type(deck)] = deck
+        self._spare_board = board
+
+        self.config = replace(config) if seed is None else replace(config, seed=seed)
+        self._seed_game()
+        self.setup(player_names=player_names, powers=powers)
+
+    def _rng_stream(self, *path) -> random.Random:
+        """Create an independent RNG for a named child stream of the game seed."""
+        return random.Random(derive_seed(self.seed, *path))
+
+    def _seed_ais(self) -> None:
+        """Seed each seat's AI from its own stream of the game seed."""
+        for i, player in enumerate(self.players):
+            if player.ai_strategy is not None:
+                player.ai_strategy.set_seed(derive_seed(self.seed, "ai", i))
+
+    def _ai_for(self, player: Player) -> AIStrategy:
+        """Get the AI deciding for a player, falling back to a game-owned BasicAI."""
+        if player.ai_strategy is not None:
+            return player.ai_strategy
+        if self._fallback_ai is None:
+            self._fallback_ai = BasicAI()
+            self._fallback_ai.set_seed(derive_seed(self.seed, "ai", "fallback"))
+        return self._fallback_ai
+
+    def _run_steps(self, steps: Generator[Decision, Any, Any]) -> Any:
+        """Run a step generator to completion, answering each decision with the player's AI."""
+        try:
+            decision = next(steps)
+            while True:
+                decision = steps.send(decision.ask(self, self._ai_for(decision.player)))
+        except StopIteration as stop:
+            return stop.value
 
     def setup(
         self,
@@ -298,10 +482,8 @@ class Game:
 
         # Get alien powers
         if powers is None:
-            all_aliens = AlienRegistry.get_all()
-
-            # Filter aliens by selected expansions
-            all_aliens = self._filter_aliens_by_expansion(all_aliens)
+            # Aliens from the selected expansions (cached per selection)
+            all_aliens = AlienRegistry.lineup_pool(self.selected_expansions)
 
             # Check for required aliens from config
             if self.config.required_aliens:
@@ -335,31 +517,35 @@ class Game:
                     # Default to no power
                     selected_powers.append(None)
 
-        # Create players
-        default_ai = get_default_ai()
+        # Create players, each seat with its own AI seeded from the game seed
         self.players = []
         for i in range(num_players):
-            # Copy alien to avoid state pollution between games (faster than deepcopy)
-            alien_copy = None
+            # Stateless powers are shared; stateful ones are copied per game
+            alien = None
             if i < len(selected_powers) and selected_powers[i] is not None:
-                alien_copy = selected_powers[i].copy()
+                alien = selected_powers[i].for_game()
 
-            player = Player(
-                name=player_names[i],
-                color=colors[i],
-                alien=alien_copy,
-                ai_strategy=default_ai
-            )
+            player = self._seat_player(player_names[i], colors[i], alien)
             # Assign secondary power for dual power variant
             if self.config.dual_powers:
                 secondary_idx = num_players + i
                 if secondary_idx < len(selected_powers) and selected_powers[secondary_idx] is not None:
-                    player.secondary_alien = selected_powers[secondary_idx].copy()
+                    player.secondary_alien = selected_powers[secondary_idx].for_game()
             self.players.append(player)
 
+        self._seed_ais()
+
         # Build player lookup cache for O(1) access
         self._player_by_name = {player.name: player for player in self.players}
 
+        # Only call alien hooks that the lineup's powers actually override
+        self._build_hook_subscribers()
+        self._build_power_table()
+        self._capabilities = {
+            player.name: int(player.alien.capabilities) if player.alien else 0
+            for player in self.players
+        }
+
         # Randomize turn order
         self._turn_order = list(self.players)
         self._rng.shuffle(self._turn_order)
@@ -372,8 +558,7 @@ class Game:
         self.destiny_deck.initialize(self.players)
 
         # Add flare cards to cosmic deck (one for each alien in the game)
-        flare_deck = FlareDeck()
-        flare_deck.set_rng(self._rng)
+        flare_deck = FlareDeck(_rng=self._rng_stream("flare_deck"))
         alien_names = [p.alien.name for p in self.players if p.alien]
         # Add secondary alien flares for dual power games
         if self.config.dual_powers:
@@ -403,7 +588,7 @@ class Game:
             if player.secondary_alien and self.config.dual_powers:
                 player.secondary_alien.on_game_start(self, player)
 
-        self._log(f"Game started with {num_players} players")
+        self._log("Game started with {} players", num_players)
         if self.config.two_player_mode:
             self._log("2-player variant enabled")
         if self.config.dual_powers:
@@ -415,30 +600,75 @@ class Game:
         if self.config.use_space_stations:
             self._log("Space stations enabled")
 
+    def _seat_player(self, name: str, color: Color, alien: Optional[AlienPower]) -> Player:
+        """A new player with a BasicAI, reusing one left over from the previous game if possible."""
+        if not self._spare_players:
+            return Player(name=name, color=color, alien=alien, ai_strategy=BasicAI())
+        player = self._spare_players.pop()
+        if type(player.ai_strategy) is BasicAI:
+            _reset_fields(player.ai_strategy, keep=("_rng",))  # Reseeded by _seed_ais
+        else:
+            player.ai_strategy = BasicAI()
+        _reset_fields(player, keep=("ai_strategy",))
+        player.name = name
+        player.color = color
+        player.alien = alien
+        player.__post_init__()
+        return player
+
     def _create_planets(self) -> None:
         """Create home planets for all players."""
         self.planets = []
         planet_id = 0
+        if self.compact_board:
+            self.ship_matrix = ShipMatrix(
+                [player.name for player in self.players],
+                len(self.players) * self.config.starting_planets
+            )
 
         for player in self.players:
-            home_planets = []
+            home_planets = player.home_planets
+            home_planets.clear()
             ships_per_planet = self.config.starting_ships_per_planet
 
             # Check for Symbiote (double ships)
-            if player.alien and player.alien.name == "Symbiote":
+            if self.has_capability(player, PowerCapability.DOUBLE_STARTING_SHIPS):
                 ships_per_planet = ships_per_planet * 2
 
             for _ in range(self.config.starting_planets):
-                planet = Planet(
-                    owner=player,
-                    ships=ShipCount(counts={player.name: ships_per_planet}),
-                    planet_id=planet_id
-                )
+                if self.ship_matrix is not None:
+                    ships = self.ship_matrix.view(planet_id)
+                    ships.set(player.name, ships_per_planet)
+                    planet = Planet(owner=player, ships=ships, planet_id=planet_id)
+                elif self._spare_planets:
+                    planet = self._reuse_planet(player, planet_id)
+                    planet.ships.counts[player.name] = ships_per_planet
+                else:
+                    ships = ShipCount(counts={player.name: ships_per_planet})
+                    planet = Planet(owner=player, ships=ships, planet_id=planet_id)
                 self.planets.append(planet)
                 home_planets.append(planet)
                 planet_id += 1
 
-            player.home_planets = home_planets
+        if self._spare_board is not None:
+            self.board, self._spare_board = self._spare_board, None
+            self.board.attach(self.planets)
+        else:
+            self.board = BoardIndex(self.planets)
+        for player in self.players:
+            player._board = self.board
+
+    def _reuse_planet(self, owner: Player, planet_id: int) -> Planet:
+        """An empty planet left over from the previous game, given a new owner."""
+        planet = self._spare_planets.pop()
+        if type(planet.ships) is ShipCount:
+            _reset_fields(planet.ships)
+        else:
+            planet.ships = ShipCount()
+        _reset_fields(planet, keep=("ships",))
+        planet.owner = owner
+        planet.planet_id = planet_id
+        return planet
 
     def _deal_starting_hand(self, player: Player) -> None:
         """Deal starting hand to a player."""
@@ -472,7 +702,7 @@ class Game:
                 # For now, pick the first one (AI can be enhanced later)
                 chosen = tech_cards[0]
                 player.tech_state.start_research(chosen)
-                self._log(f"{player.name} begins researching {chosen.name}")
+                self._log("{} begins researching {}", player.name, chosen.name)
 
     def _apply_tech_research_progress(self, player: Player) -> None:
         """
@@ -484,7 +714,7 @@ class Game:
 
         completed = player.tech_state.add_research_progress(1)
         if completed:
-            self._log(f"{player.name} completes research on {completed.name}!")
+            self._log("{} completes research on {}!", player.name, completed.name)
 
             # Draw a new tech to research if available
             if self.tech_deck and self.tech_deck.cards_remaining() > 0:
@@ -493,7 +723,7 @@ class Game:
                     player.tech_state.available_techs.append(new_tech)
                     # Start researching the new one
                     player.tech_state.start_research(new_tech)
-                    self._log(f"{player.name} begins researching {new_tech.name}")
+                    self._log("{} begins researching {}", player.name, new_tech.name)
 
     def _get_tech_combat_bonus(self, player: Player, is_offense: bool, ship_count: int) -> int:
         """Get combat bonus from completed technologies."""
@@ -515,7 +745,7 @@ class Game:
         for player in self.players:
             player.available_stations = list(station_types)
             player.space_stations = []
-            self._log(f"{player.name} receives 3 space station markers")
+            self._log("{} receives 3 space station markers", player.name)
 
     def _offer_station_placement(self, player: Player, planet: Planet) -> None:
         """
@@ -535,11 +765,11 @@ class Game:
             if StationType.STATION_ALPHA in player.available_stations:
                 station = player.place_station(StationType.STATION_ALPHA, planet.planet_id)
                 if station:
-                    self._log(f"{player.name} places Alpha Station on planet {planet.planet_id}")
+                    self._log("{} places Alpha Station on planet {}", player.name, planet.planet_id)
             elif StationType.STATION_DELTA in player.available_stations:
                 station = player.place_station(StationType.STATION_DELTA, planet.planet_id)
                 if station:
-                    self._log(f"{player.name} places Delta Station on planet {planet.planet_id}")
+                    self._log("{} places Delta Station on planet {}", player.name, planet.planet_id)
 
     def _get_station_defense_bonus(self, player: Player, planet_id: int) -> int:
         """Get defense bonus from space stations."""
@@ -551,16 +781,57 @@ class Game:
         """Get player by name. Uses cached lookup for O(1) performance."""
         return self._player_by_name.get(name)
 
+    def _build_hook_subscribers(self) -> None:
+        """Map each alien hook to the players (in seat order) whose primary alien overrides it."""
+        self._hook_subscribers = {hook: [] for hook in HOOK_NAMES}
+        for player in self.players:
+            if player.alien:
+                for hook in AlienRegistry.get_hooks(player.alien):
+                    self._hook_subscribers[hook].append(player)
+
+    def _build_power_table(self) -> None:
+        """Precompute each seat's powers and which of them each phase's timing allows."""
+        self._seats = {id(player): seat for seat, player in enumerate(self.players)}
+        self._seat_powers = []
+        self._phase_powers = {phase: 0 for phase in GamePhase}
+        for seat, player in enumerate(self.players):
+            powers = []
+            if player.alien:
+                powers.append(player.alien)
+            if self.config.dual_powers and player.secondary_alien:
+                powers.append(player.secondary_alien)
+            self._seat_powers.append(tuple(powers))
+
+            for bit, alien in ((2 * seat, player.alien), (2 * seat + 1, player.secondary_alien)):
+                if alien is None:
+                    continue
+                for phase, timings in _PHASE_TIMINGS.items():
+                    if alien.timing in timings:
+                        self._phase_powers[phase] |= 1 << bit
+
+    def has_capability(self, player: Optional[Player], capability: PowerCapability) -> bool:
+        """Check whether a player's primary alien declares a capability (power may be inactive)."""
+        return player is not None and bool(self._capabilities.get(player.name, 0) & capability)
+
     def get_home_planets(self, player: Player) -> List[Planet]:
         """Get home planets for a player. Uses player's cached home_planets list."""
         return player.home_planets
 
     def get_foreign_colonies(self, player: Player) -> List[Planet]:
         """Get foreign colonies for a player."""
-        return [p for p in self.planets if p.is_foreign_colony(player)]
+        return player.get_foreign_colonies(self.planets)
 
-    def _log(self, message: str) -> None:
-        """Log a game event."""
+    def _log(self, message: str, *args: Any) -> None:
+        """
+        Log a game event.
+
+        Args are formatted into message with str.format only when the event
+        is kept, so headless games skip both formatting and storage.
+        """
+        if self.headless and not self.verbose:
+            return
+        if args:
+            message = message.format(*args)
         self.log.append(message)
         if self.verbose:
             print(message)
@@ -630,6 +901,102 @@ class Game:
             }
         return stats
 
+    # ========== Snapshots ==========
+
+    def snapshot(self) -> GameSnapshot:
+        """
+        Capture the game's state, to rewind to with restore() or branch from with fork().
+
+        Covers the board, hands, decks, warp, the encounter in progress,
+        every counter and flag, and the state of every random stream (the
+        game's, the decks' and the AIs'), packed into arrays and tuples
+        (see snapshot.py). Cards, powers and the config are shared with
+        the game rather than copied.
+
+        Take snapshots between encounters, or between decisions when
+        driving steps() (the suspended generator is not captured). A
+        snapshot is invalid once the game is reset.
+        """
+        return GameSnapshot.capture(self)
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """
+        Put the game back in the state of one of its snapshots.
+
+        Objects keep their identity: players, planets and decks read from
+        the game before restoring are the game's again afterwards. A
+        snapshot can be restored any number of times.
+        """
+        if snapshot.game is not self:
+            raise ValueError("Snapshot was taken from a different game")
+        snapshot.apply(self)
+        if self.board is not None:
+            self.board.attach(self.planets)
+
+    def fork(self, snapshot: Optional[GameSnapshot] = None) -> "Game":
+        """
+        A new game in the state of this one, or of one of its snapshots.
+
+        The fork shares nothing mutable with this game, so each can be
+        played on without affecting the other; playing both on the same
+        decisions gives the same result.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        elif snapshot.game is not self:
+            raise ValueError("Snapshot was taken from a different game")
+        game = self._replica()
+        snapshot.apply(game)
+        game.board = BoardIndex(game.planets)
+        for player in game.players:
+            player._board = game.board
+        return game
+
+    def _replica(self) -> "Game":
+        """
+        A game of this one's setup (players, powers, planets, decks) with
+        objects of its own, for fork to write a snapshot into.
+        """
+        game = Game(
+            config=self.config, verbose=self.verbose, headless=self.headless,
+            verify_board=self.verify_board, compact_board=self.compact_board,
+        )
+        game.selected_expansions = list(self.selected_expansions)
+        for player in self.players:
+            ai = player.ai_strategy
+            if ai is not None:
+                ai = copy.copy(ai)
+                if getattr(ai, "_rng", None) is not None:
+                    ai._rng = random.Random()
+            game.players.append(Player(
+                name=player.name, color=player.color,
+                alien=player.alien.for_game() if player.alien else None,
+                secondary_alien=player.secondary_alien.for_game() if player.secondary_alien else None,
+                ai_strategy=ai,
+            ))
+
+        if self.ship_matrix is not None:
+            game.ship_matrix = ShipMatrix([player.name for player in game.players], len(self.planets))
+        positions = {id(planet): position for position, planet in enumerate(self.planets)}
+        for position, planet in enumerate(self.planets):
+            ships = game.ship_matrix.view(position) if game.ship_matrix is not None else ShipCount()
+            owner = game.players[self._seats[id(planet.owner)]]
+            game.planets.append(Planet(owner=owner, ships=ships, planet_id=planet.planet_id))
+        for player, source in zip(game.players, self.players):
+            player.home_planets.extend(game.planets[positions[id(planet)]] for planet in source.home_planets)
+
+        game.destiny_deck = DestinyDeck(_players=game.players, cards_per_player=self.destiny_deck.cards_per_player)
+        if self.tech_deck is not None:
+            game.tech_deck = TechDeck()
+        if self.hazard_deck is not None:
+            game.hazard_deck = HazardDeck()
+
+        game._player_by_name = {player.name: player for player in game.players}
+        game._build_hook_subscribers()
+        game._build_power_table()
+        game._capabilities = dict(self._capabilities)
+        return game
+
     # ========== Game Flow ==========
 
     def play(self) -> List[Player]:
@@ -639,13 +1006,40 @@ class Game:
         Returns:
             List of winners
         """
+        # Re-seed in case AIs were assigned after setup
+        self._seed_ais()
+
         while not self.is_over and self.current_turn < self.config.max_turns:
             self.play_encounter()
 
         return self.winners
 
+    def steps(self) -> Generator[Decision, Any, List[Player]]:
+        """
+        Play the game to completion as a generator of decisions.
+
+        Yields each Decision the encounter flow needs and resumes with the
+        answer passed to send(). Answering every decision with
+        decision.ask(game, ai) for the player's AI plays exactly as play()
+        does. Choices made inside power, flare and artifact effects are
+        still taken by the player's AI directly.
+
+        Returns:
+            List of winners (the generator's return value)
+        """
+        self._seed_ais()
+
+        while not self.is_over and self.current_turn < self.config.max_turns:
+            yield from self.encounter_steps()
+
+        return self.winners
+
     def play_encounter(self) -> None:
         """Play a single encounter."""
+        self._run_steps(self.encounter_steps())
+
+    def encounter_steps(self) -> Generator[Decision, Any, None]:
+        """Play a single encounter as a generator of decisions (see steps())."""
         if self.is_over:
             return
 
@@ -657,23 +1051,22 @@ class Game:
 
         # Check for skip encounter hazard
         if self.current_hazard and self._check_hazard_skip():
-            self._handle_turn_end()
+            yield from self._turn_end_steps()
             return
 
         # Start turn phase
         if self.encounter_number == 1:
             self.current_turn += 1
             self.offense = self._turn_order[self._player_index]
-            self._log(f"\n=== Turn {self.current_turn}: {self.offense.name}'s turn ===")
+            self._log("\n=== Turn {}: {}'s turn ===", self.current_turn, self.offense.name)
 
         self.phase = GamePhase.START_TURN
 
         # Call turn start hooks
-        for player in self.players:
-            if player.alien:
-                player.alien.on_turn_start(self, player)
-            if player.alien:
-                player.alien.on_encounter_start(self, player)
+        for player in self._hook_subscribers["on_turn_start"]:
+            player.alien.on_turn_start(self, player)
+        for player in self._hook_subscribers["on_encounter_start"]:
+            player.alien.on_encounter_start(self, player)
 
         # Regroup phase (retrieve ship from warp)
         self._regroup_phase()
@@ -682,34 +1075,33 @@ class Game:
         self._destiny_phase()
 
         # Launch phase
-        self._launch_phase()
+        yield from self._launch_steps()
 
         # Alliance phase
-        self._alliance_phase()
+        yield from self._alliance_steps()
 
         # Planning phase
-        self._planning_phase()
+        yield from self._planning_steps()
 
         # Reveal phase
         self._reveal_phase()
 
         # Resolution phase
-        self._resolution_phase()
+        yield from self._resolution_steps()
 
         # Check for game end
         self._check_game_end()
 
         # End of encounter hooks
-        for player in self.players:
-            if player.alien:
-                player.alien.on_encounter_end(self, player)
+        for player in self._hook_subscribers["on_encounter_end"]:
+            player.alien.on_encounter_end(self, player)
 
         # Discard hazard card at end of encounter
         self._discard_hazard()
 
         # Determine if second encounter
         if not self.is_over:
-            self._handle_turn_end()
+            yield from self._turn_end_steps()
 
     def _regroup_phase(self) -> None:
         """Handle the regroup phase."""
@@ -721,19 +1113,17 @@ class Game:
             retrieved = self.offense.retrieve_ships_from_warp(1)
             if retrieved > 0:
                 # Get ALL colonies (home + foreign) where player has ships
-                all_colonies = [p for p in self.planets if p.has_colony(self.offense.name)]
+                all_colonies = self.offense.get_colonies(self.planets)
                 if all_colonies:
                     self.offense.return_ships_to_colonies(retrieved, all_colonies)
                 else:
                     # Fallback to home planets if no colonies (shouldn't happen normally)
                     self.offense.return_ships_to_colonies(retrieved, self.offense.home_planets)
-                self._log(f"{self.offense.name} retrieves 1 ship from warp")
+                self._log("{} retrieves 1 ship from warp", self.offense.name)
 
         # Power hooks
-        for player in self.players:
-            role = self._get_player_role(player)
-            if player.alien:
-                player.alien.on_regroup(self, player, role)
+        for player in self._hook_subscribers["on_regroup"]:
+            player.alien.on_regroup(self, player, self._get_player_role(player))
 
     def _destiny_phase(self) -> None:
         """Handle the destiny phase."""
@@ -744,24 +1134,28 @@ class Game:
             # In 2-player, offense can only attack the other player
             # Use generator to avoid building full list for single element
             self.defense = next((p for p in self.players if p != self.offense), self.offense)
-            self._log(f"Target: {self.defense.name}")
+            self._log("Target: {}", self.defense.name)
         else:
             # Draw destiny
             destiny_card = self.destiny_deck.draw(self.offense)
             self.defense = destiny_card.player
             self.destiny_deck.discard(destiny_card)
-            self._log(f"Destiny: {self.defense.name}")
+            self._log("Destiny: {}", self.defense.name)
 
         # Power hooks (can redirect destiny)
-        for player in self.players:
-            role = self._get_player_role(player)
-            if player.alien and self.is_power_active(player):
+        for player in self._hook_subscribers["on_destiny"]:
+            if self.is_power_active(player):
+                role = self._get_player_role(player)
                 redirect = player.alien.on_destiny(self, player, role, self.defense)
                 if redirect and redirect != self.defense:
-                    self._log(f"{player.name} redirects destiny to {redirect.name}")
+                    self._log("{} redirects destiny to {}", player.name, redirect.name)
                     self.defense = redirect
 
     def _launch_phase(self) -> None:
+        """Handle the launch phase, with the players' AIs deciding."""
+        self._run_steps(self._launch_steps())
+
+    def _launch_steps(self) -> Generator[Decision, Any, None]:
         """
         Handle the launch phase.
 
@@ -782,8 +1176,7 @@ class Game:
         self.hyperspace_gate.clear()
 
         # Select planet to attack (aim the gate)
-        ai = self.offense.ai_strategy or get_default_ai()
-        self.defense_planet = ai.select_attack_planet(self, self.offense, self.defense)
+        self.defense_planet = yield SelectAttackPlanet(self.offense, self.defense)
         self.hyperspace_gate.aim(self.defense_planet)
 
         # Check for powers that affect gate aiming (e.g., Solar Wind artifact already in context)
@@ -791,7 +1184,7 @@ class Game:
 
         # Select ships to commit to the gate
         max_ships = self.config.max_ships_per_encounter
-        ship_count = ai.select_ships_for_encounter(self, self.offense, max_ships)
+        ship_count = yield SelectShips(self.offense, max_ships)
 
         # Take ships from colonies and place on gate
         taken = self.offense.get_ships_from_colonies(ship_count, self.planets)
@@ -804,8 +1197,8 @@ class Game:
         def_ships = self.defense_planet.get_ships(self.defense.name)
         self.defense_ships[self.defense.name] = def_ships
 
-        self._log(f"Gate aimed at {self.defense_planet} with {taken} ships")
-        self._log(f"Defense: {def_ships} ships on planet")
+        self._log("Gate aimed at {} with {} ships", self.defense_planet, taken)
+        self._log("Defense: {} ships on planet", def_ships)
 
     def _check_gate_redirect_powers(self) -> None:
         """Check for powers that can redirect the gate to a different planet."""
@@ -822,7 +1215,7 @@ class Game:
                     new_target = min(valid_planets, key=lambda p: p.get_ships(self.defense.name))
                     if self.hyperspace_gate.reaim(new_target):
                         self.defense_planet = new_target
-                        self._log(f"Navigator redirects attack to {new_target}!")
+                        self._log("Navigator redirects attack to {}!", new_target)
 
             # Bulwark protects strongest planet
             elif power_name == "Bulwark":
@@ -840,7 +1233,7 @@ class Game:
                         new_target = self._rng.choice(other_planets)
                         if self.hyperspace_gate.reaim(new_target):
                             self.defense_planet = new_target
-                            self._log(f"Bulwark protects strongest planet, attack redirected!")
+                            self._log("Bulwark protects strongest planet, attack redirected!")
 
     def reaim_gate(self, new_planet: Planet) -> bool:
         """
@@ -853,7 +1246,7 @@ class Game:
 
         if self.hyperspace_gate.reaim(new_planet):
             self.defense_planet = new_planet
-            self._log(f"Gate re-aimed to {new_planet}")
+            self._log("Gate re-aimed to {}", new_planet)
             return True
         return False
 
@@ -863,6 +1256,10 @@ class Game:
         self._log("Gate is now locked - cannot be re-aimed")
 
     def _alliance_phase(self) -> None:
+        """Handle the alliance phase, with the players' AIs deciding."""
+        self._run_steps(self._alliance_steps())
+
+    def _alliance_steps(self) -> Generator[Decision, Any, None]:
         """Handle the alliance phase."""
         self.phase = GamePhase.ALLIANCE
 
@@ -874,12 +1271,10 @@ class Game:
         potential = [p for p in self.players if p != self.offense and p != self.defense]
 
         # Offense invites allies
-        off_ai = self.offense.ai_strategy or get_default_ai()
-        off_invites = off_ai.decide_alliance_invitation(self, self.offense, potential, True)
+        off_invites = yield InviteAllies(self.offense, potential, True)
 
         # Defense invites allies
-        def_ai = self.defense.ai_strategy or get_default_ai()
-        def_invites = def_ai.decide_alliance_invitation(self, self.defense, potential, False)
+        def_invites = yield InviteAllies(self.defense, potential, False)
 
         # Players respond to invitations
         for player in potential:
@@ -887,42 +1282,41 @@ class Game:
             invited_def = player in def_invites
 
             # Check for Parasite power (can join uninvited)
-            if player.alien and player.alien.name == "Parasite" and self.is_power_active(player):
+            if self.has_capability(player, PowerCapability.JOINS_UNINVITED) and self.is_power_active(player):
                 invited_off = True
                 invited_def = True
 
             if not invited_off and not invited_def:
                 continue
 
-            player_ai = player.ai_strategy or get_default_ai()
-            choice = player_ai.decide_alliance_response(
-                self, player, self.offense, self.defense,
+            choice = yield RespondToAlliance(
+                player, self.offense, self.defense,
                 invited_off, invited_def
             )
 
             if choice == Side.OFFENSE:
                 self.offense_allies.append(player)
-                ships = player_ai.select_ally_ships(
-                    self, player, self.config.max_ships_per_encounter
-                )
+                ships = yield SelectAllyShips(player, self.config.max_ships_per_encounter)
                 taken = player.get_ships_from_colonies(ships, self.planets)
                 self.offense_ships[player.name] = taken
-                self._log(f"{player.name} joins offense with {taken} ships")
+                self._log("{} joins offense with {} ships", player.name, taken)
                 # Track alliance
                 self._record_alliance(player.name, "offense")
 
             elif choice == Side.DEFENSE:
                 self.defense_allies.append(player)
-                ships = player_ai.select_ally_ships(
-                    self, player, self.config.max_ships_per_encounter
-                )
+                ships = yield SelectAllyShips(player, self.config.max_ships_per_encounter)
                 taken = player.get_ships_from_colonies(ships, self.planets)
                 self.defense_ships[player.name] = taken
-                self._log(f"{player.name} joins defense with {taken} ships")
+                self._log("{} joins defense with {} ships", player.name, taken)
                 # Track alliance
                 self._record_alliance(player.name, "defense")
 
     def _planning_phase(self) -> None:
+        """Handle the planning phase, with the players' AIs deciding."""
+        self._run_steps(self._planning_steps())
+
+    def _planning_steps(self) -> Generator[Decision, Any, None]:
         """Handle the planning phase."""
         self.phase = GamePhase.PLANNING
 
@@ -932,31 +1326,29 @@ class Game:
 
         # Power hooks (Trader, Kamikazee, etc.)
         for player in [self.offense, self.defense]:
-            role = self._get_player_role(player)
             if player.alien and self.is_power_active(player):
-                player.alien.on_planning(self, player, role)
+                if "on_planning" in AlienRegistry.get_hooks(player.alien):
+                    player.alien.on_planning(self, player, self._get_player_role(player))
                 # Track power activation during planning
                 self.record_power_activation(player)
 
         # Select cards with validation
-        off_ai = self.offense.ai_strategy or get_default_ai()
         self.offense_card = self._validate_and_select_card(
-            off_ai.select_encounter_card(self, self.offense, True),
+            (yield SelectEncounterCard(self.offense, True)),
             self.offense,
             "offense"
         )
 
-        def_ai = self.defense.ai_strategy or get_default_ai()
         self.defense_card = self._validate_and_select_card(
-            def_ai.select_encounter_card(self, self.defense, False),
+            (yield SelectEncounterCard(self.defense, False)),
             self.defense,
             "defense"
         )
 
         # Select kicker cards (optional)
         if isinstance(self.offense_card, AttackCard):
-            off_kicker = off_ai.select_kicker_card(
-                self, self.offense, True,
+            off_kicker = yield SelectKicker(
+                self.offense, True,
                 self.offense_card.value, 15  # Estimate opponent total
             )
             if off_kicker:
@@ -964,29 +1356,29 @@ class Game:
                 self.offense.remove_card(off_kicker)
 
         if isinstance(self.defense_card, AttackCard):
-            def_kicker = def_ai.select_kicker_card(
-                self, self.defense, False,
+            def_kicker = yield SelectKicker(
+                self.defense, False,
                 self.defense_card.value, 15
             )
             if def_kicker:
                 self.defense_kicker = def_kicker
                 self.defense.remove_card(def_kicker)
 
-        self._log(f"{self.offense.name} selects card")
-        self._log(f"{self.defense.name} selects card")
+        self._log("{} selects card", self.offense.name)
+        self._log("{} selects card", self.defense.name)
 
     def _reveal_phase(self) -> None:
         """Handle the reveal phase."""
         self.phase = GamePhase.REVEAL
 
-        self._log(f"Reveal: {self.offense.name} plays {self.offense_card}")
-        self._log(f"Reveal: {self.defense.name} plays {self.defense_card}")
+        self._log("Reveal: {} plays {}", self.offense.name, self.offense_card)
+        self._log("Reveal: {} plays {}", self.defense.name, self.defense_card)
 
         # Power hooks (Mirror, Sorcerer, etc.)
         for player in [self.offense, self.defense]:
-            role = self._get_player_role(player)
             if player.alien and self.is_power_active(player):
-                player.alien.on_reveal(self, player, role)
+                if "on_reveal" in AlienRegistry.get_hooks(player.alien):
+                    player.alien.on_reveal(self, player, self._get_player_role(player))
                 # Track power activation during reveal
                 self.record_power_activation(player)
 
@@ -995,6 +1387,10 @@ class Game:
         self._check_flare_opportunity("reveal", self._flare_context)
 
     def _resolution_phase(self) -> None:
+        """Handle the resolution phase, with the players' AIs deciding."""
+        self._run_steps(self._resolution_steps())
+
+    def _resolution_steps(self) -> Generator[Decision, Any, None]:
         """Handle the resolution phase."""
         self.phase = GamePhase.RESOLUTION
 
@@ -1026,7 +1422,7 @@ class Game:
         if off_is_morph:
             # Offense Morph copies defense card
             if def_is_attack:
-                self._log(f"Offense Morph copies Attack {def_card.value}")
+                self._log("Offense Morph copies Attack {}", def_card.value)
                 off_is_attack = True
                 off_is_morph = False
             elif def_is_neg:
@@ -1037,7 +1433,7 @@ class Game:
         if def_is_morph:
             # Defense Morph copies offense card
             if off_is_attack:
-                self._log(f"Defense Morph copies Attack {off_card.value}")
+                self._log("Defense Morph copies Attack {}", off_card.value)
                 def_is_attack = True
                 def_is_morph = False
             elif off_is_neg:
@@ -1047,32 +1443,36 @@ class Game:
 
         # Both negotiate -> deal
         if off_is_neg and def_is_neg:
-            self._resolve_deal()
+            yield from self._deal_steps()
             return
 
         # One negotiate, one attack
         if off_is_neg and def_is_attack:
             # Check Pacifist
-            if self.offense.alien and self.offense.alien.name == "Pacifist" and self.is_power_active(self.offense):
+            if self.has_capability(self.offense, PowerCapability.WINS_WITH_NEGOTIATE) and self.is_power_active(self.offense):
                 self._resolve_offense_wins()
             else:
-                self._resolve_defense_wins()
+                yield from self._defense_wins_steps()
                 self._give_compensation(self.offense, self.defense)
             return
 
         if def_is_neg and off_is_attack:
             # Check Pacifist
-            if self.defense.alien and self.defense.alien.name == "Pacifist" and self.is_power_active(self.defense):
-                self._resolve_defense_wins()
+            if self.has_capability(self.defense, PowerCapability.WINS_WITH_NEGOTIATE) and self.is_power_active(self.defense):
+                yield from self._defense_wins_steps()
             else:
                 self._resolve_offense_wins()
                 self._give_compensation(self.defense, self.offense)
             return
 
         # Both attack -> compare totals
-        self._resolve_attack_vs_attack()
+        yield from self._attack_vs_attack_steps()
 
     def _resolve_attack_vs_attack(self) -> None:
+        """Resolve attack against attack, with the players' AIs deciding."""
+        self._run_steps(self._attack_vs_attack_steps())
+
+    def _attack_vs_attack_steps(self) -> Generator[Decision, Any, None]:
         """Resolve when both sides play attack cards (or Morph copying attack)."""
         off_card = self.offense_card
         def_card = self.defense_card
@@ -1097,12 +1497,12 @@ class Game:
         # Apply kicker multipliers
         if self.offense_kicker:
             off_value *= self.offense_kicker.value
-            self._log(f"{self.offense.name} plays {self.offense_kicker} (attack becomes {off_value})")
+            self._log("{} plays {} (attack becomes {})", self.offense.name, self.offense_kicker, off_value)
             self.cosmic_deck.discard(self.offense_kicker)
 
         if self.defense_kicker:
             def_value *= self.defense_kicker.value
-            self._log(f"{self.defense.name} plays {self.defense_kicker} (attack becomes {def_value})")
+            self._log("{} plays {} (attack becomes {})", self.defense.name, self.defense_kicker, def_value)
             self.cosmic_deck.discard(self.defense_kicker)
 
         # Apply power modifications to card values (supports dual powers in 2-player mode)
@@ -1132,8 +1532,8 @@ class Game:
         self.defense_total = def_total
 
         # Allow reinforcement cards to be played
-        off_reinforcements = self._get_reinforcements(self.offense, self.offense_allies, True, off_total, def_total)
-        def_reinforcements = self._get_reinforcements(self.defense, self.defense_allies, False, def_total, off_total)
+        off_reinforcements = yield from self._reinforcement_steps(self.offense, self.offense_allies, True, off_total, def_total)
+        def_reinforcements = yield from self._reinforcement_steps(self.defense, self.defense_allies, False, def_total, off_total)
 
         off_reinforce_bonus = sum(c.value for c in off_reinforcements)
         def_reinforce_bonus = sum(c.value for c in def_reinforcements)
@@ -1143,12 +1543,12 @@ class Game:
 
         if off_reinforcements:
             for card in off_reinforcements:
-                self._log(f"Offense plays {card}")
+                self._log("Offense plays {}", card)
                 self.cosmic_deck.discard(card)
 
         if def_reinforcements:
             for card in def_reinforcements:
-                self._log(f"Defense plays {card}")
+                self._log("Defense plays {}", card)
                 self.cosmic_deck.discard(card)
 
         # Apply flare bonuses if any were played
@@ -1157,7 +1557,7 @@ class Game:
             # Apply flare bonus to main player who played the flare
             # For simplicity, apply to offense (could be tracked more precisely)
             off_total += flare_bonus
-            self._log(f"Flare bonus: +{flare_bonus}")
+            self._log("Flare bonus: +{}", flare_bonus)
 
         # Apply tech bonuses (Cosmic Incursion expansion)
         off_tech_bonus = self._get_tech_combat_bonus(self.offense, True, sum(self.offense_ships.values()))
@@ -1166,9 +1566,9 @@ class Game:
         def_total += def_tech_bonus
 
         if off_tech_bonus > 0:
-            self._log(f"{self.offense.name} tech bonus: +{off_tech_bonus}")
+            self._log("{} tech bonus: +{}", self.offense.name, off_tech_bonus)
         if def_tech_bonus > 0:
-            self._log(f"{self.defense.name} tech bonus: +{def_tech_bonus}")
+            self._log("{} tech bonus: +{}", self.defense.name, def_tech_bonus)
 
         # Apply space station bonus (Cosmic Storm expansion)
         if self.config.use_space_stations and self.defense_planet:
@@ -1177,14 +1577,14 @@ class Game:
             )
             if station_bonus > 0:
                 def_total += station_bonus
-                self._log(f"{self.defense.name} station bonus: +{station_bonus}")
+                self._log("{} station bonus: +{}", self.defense.name, station_bonus)
 
         # Update final totals on game object
         self.offense_total = off_total
         self.defense_total = def_total
 
-        self._log(f"Offense total: {off_total} ({off_value} + {sum(self.offense_ships.values())} ships{f' + {off_reinforce_bonus} reinforcement' if off_reinforce_bonus else ''})")
-        self._log(f"Defense total: {def_total} ({def_value} + {sum(self.defense_ships.values())} ships{f' + {def_reinforce_bonus} reinforcement' if def_reinforce_bonus else ''})")
+        self._log("Offense total: {} ({} + {} ships{})", off_total, off_value, sum(self.offense_ships.values()), f' + {off_reinforce_bonus} reinforcement' if off_reinforce_bonus else '')
+        self._log("Defense total: {} ({} + {} ships{})", def_total, def_value, sum(self.defense_ships.values()), f' + {def_reinforce_bonus} reinforcement' if def_reinforce_bonus else '')
 
         # Validate combat components
         self._validate_combat_components(
@@ -1200,14 +1600,13 @@ class Game:
         reversal_count = 0
         reversal_powers = []
         for player in [self.offense, self.defense]:
-            if player.alien and self.is_power_active(player):
-                if player.alien.name in ["Loser", "Antimatter"]:
-                    reversal_count += 1
-                    reversal_powers.append(f"{player.name} ({player.alien.name})")
+            if self.has_capability(player, PowerCapability.REVERSES_OUTCOME) and self.is_power_active(player):
+                reversal_count += 1
+                reversal_powers.append(f"{player.name} ({player.alien.name})")
 
         # Log reversal powers if any are active
         if reversal_powers:
-            self._log(f"Reversal power(s) active: {', '.join(reversal_powers)}")
+            self._log("Reversal power(s) active: {}", ', '.join(reversal_powers))
             if reversal_count == 2:
                 self._log("Double reversal - effects cancel out!")
 
@@ -1221,7 +1620,7 @@ class Game:
             if off_total < def_total:
                 self._resolve_offense_wins()
             elif def_total < off_total:
-                self._resolve_defense_wins()
+                yield from self._defense_wins_steps()
             else:
                 # Tie with reversal: offense wins (opposite of normal)
                 self._resolve_offense_wins()
@@ -1230,10 +1629,10 @@ class Game:
             if off_total > def_total:
                 self._resolve_offense_wins()
             elif def_total > off_total:
-                self._resolve_defense_wins()
+                yield from self._defense_wins_steps()
             else:
                 # Tie: defense wins (per official rules)
-                self._resolve_defense_wins()
+                yield from self._defense_wins_steps()
 
     def _resolve_offense_wins(self) -> None:
         """Handle offense winning the encounter."""
@@ -1246,13 +1645,13 @@ class Game:
         # Also check for Void (winner destroys losing ships)
         graviton_active = False
         for main_player in [self.offense, self.defense]:
-            if main_player and main_player.alien and main_player.alien.name == "Graviton":
+            if self.has_capability(main_player, PowerCapability.DESTROYS_LOSERS):
                 if self.is_power_active(main_player):
                     graviton_active = True
                     self._log("Graviton's gravity destroys losing ships!")
                     break
         # Void destroys losing ships when Void wins
-        if self.offense and self.offense.alien and self.offense.alien.name == "Void":
+        if self.has_capability(self.offense, PowerCapability.ERADICATES_ON_WIN):
             if self.is_power_active(self.offense):
                 graviton_active = True
                 self._log("Void eradicates losing ships!")
@@ -1268,7 +1667,7 @@ class Game:
                     )
                 if graviton_active:
                     # Ships are destroyed (removed from game) - don't add to warp
-                    self._log(f"{player.name} loses {ships_to_warp} ships permanently!")
+                    self._log("{} loses {} ships permanently!", player.name, ships_to_warp)
                 else:
                     player.send_ships_to_warp(ships_to_warp)
 
@@ -1293,6 +1692,10 @@ class Game:
         self._discard_encounter_cards()
 
     def _resolve_defense_wins(self) -> None:
+        """Handle defense winning the encounter, with the players' AIs deciding."""
+        self._run_steps(self._defense_wins_steps())
+
+    def _defense_wins_steps(self) -> Generator[Decision, Any, None]:
         """Handle defense winning the encounter."""
         self._log("Defense wins!")
 
@@ -1303,13 +1706,13 @@ class Game:
         # Also check for Void (winner destroys losing ships)
         graviton_active = False
         for main_player in [self.offense, self.defense]:
-            if main_player and main_player.alien and main_player.alien.name == "Graviton":
+            if self.has_capability(main_player, PowerCapability.DESTROYS_LOSERS):
                 if self.is_power_active(main_player):
                     graviton_active = True
                     self._log("Graviton's gravity destroys losing ships!")
                     break
         # Void destroys losing ships when Void wins
-        if self.defense and self.defense.alien and self.defense.alien.name == "Void":
+        if self.has_capability(self.defense, PowerCapability.ERADICATES_ON_WIN):
             if self.is_power_active(self.defense):
                 graviton_active = True
                 self._log("Void eradicates losing ships!")
@@ -1325,26 +1728,25 @@ class Game:
                     )
                 if graviton_active:
                     # Ships are destroyed (removed from game) - don't add to warp
-                    self._log(f"{player.name} loses {ships_to_warp} ships permanently!")
+                    self._log("{} loses {} ships permanently!", player.name, ships_to_warp)
                 else:
                     player.send_ships_to_warp(ships_to_warp)
 
         # Defensive allies get rewards (choice: cards OR ships from warp)
         for ally in self.defense_allies:
             reward_count = self.defense_ships.get(ally.name, 0)
-            ally_ai = ally.ai_strategy or get_default_ai()
-            reward_choice = ally_ai.choose_ally_reward(self, ally, reward_count)
+            reward_choice = yield ChooseAllyReward(ally, reward_count)
 
             if reward_choice == "cards":
                 # Draw cards from rewards deck
                 rewards = self.rewards_deck.draw_multiple(reward_count)
                 ally.add_cards(rewards)
-                self._log(f"{ally.name} draws {reward_count} reward cards")
+                self._log("{} draws {} reward cards", ally.name, reward_count)
             else:
                 # Retrieve ships from warp
                 retrieved = ally.retrieve_ships_from_warp(reward_count)
                 ally.return_ships_to_colonies(retrieved, ally.home_planets)
-                self._log(f"{ally.name} retrieves {retrieved} ships from warp")
+                self._log("{} retrieves {} ships from warp", ally.name, retrieved)
 
         # Return defensive ally ships to their colonies (not on planet since defense won)
         for ally in self.defense_allies:
@@ -1398,15 +1800,16 @@ class Game:
         self._discard_encounter_cards()
 
     def _resolve_deal(self) -> None:
+        """Handle a deal, with the players' AIs negotiating."""
+        self._run_steps(self._deal_steps())
+
+    def _deal_steps(self) -> Generator[Decision, Any, None]:
         """Handle deal negotiation when both play negotiate."""
         self._log("Deal phase!")
 
         # Get proposals from both players
-        off_ai = self.offense.ai_strategy or get_default_ai()
-        def_ai = self.defense.ai_strategy or get_default_ai()
-
-        off_proposal = off_ai.negotiate_deal(self, self.offense, self.defense)
-        def_proposal = def_ai.negotiate_deal(self, self.defense, self.offense)
+        off_proposal = yield NegotiateDeal(self.offense, self.defense)
+        def_proposal = yield NegotiateDeal(self.defense, self.offense)
 
         # Both must agree for deal to succeed
         # A deal succeeds if both propose (any valid deal)
@@ -1526,6 +1929,19 @@ class Game:
         current_total: int,
         opponent_total: int
     ) -> List[ReinforcementCard]:
+        """Get reinforcement cards from main player and allies, with their AIs deciding."""
+        return self._run_steps(self._reinforcement_steps(
+            main_player, allies, is_offense, current_total, opponent_total
+        ))
+
+    def _reinforcement_steps(
+        self,
+        main_player: Player,
+        allies: List[Player],
+        is_offense: bool,
+        current_total: int,
+        opponent_total: int
+    ) -> Generator[Decision, Any, List[ReinforcementCard]]:
         """
         Get reinforcement cards from main player and allies.
 
@@ -1535,9 +1951,8 @@ class Game:
         all_reinforcements = []
 
         # Main player selects reinforcements
-        ai = main_player.ai_strategy or get_default_ai()
-        main_reinforcements = ai.select_reinforcement_cards(
-            self, main_player, is_offense, current_total, opponent_total
+        main_reinforcements = yield SelectReinforcements(
+            main_player, is_offense, current_total, opponent_total
         )
 
         for card in main_reinforcements:
@@ -1549,9 +1964,8 @@ class Game:
         updated_total = current_total + sum(c.value for c in all_reinforcements)
 
         for ally in allies:
-            ally_ai = ally.ai_strategy or get_default_ai()
-            ally_reinforcements = ally_ai.select_reinforcement_cards(
-                self, ally, is_offense, updated_total, opponent_total
+            ally_reinforcements = yield SelectReinforcements(
+                ally, is_offense, updated_total, opponent_total
             )
 
             for card in ally_reinforcements:
@@ -1575,11 +1989,11 @@ class Game:
 
         # Per official rules: no compensation if no ships were lost to warp
         if count == 0:
-            self._log(f"{receiver.name} receives no compensation (no ships lost)")
+            self._log("{} receives no compensation (no ships lost)", receiver.name)
             return
 
         # Check for Hacker power
-        if receiver.alien and receiver.alien.name == "Hacker" and receiver.power_active:
+        if self.has_capability(receiver, PowerCapability.INTERCEPTS_COMPENSATION) and receiver.power_active:
             count = receiver.alien.on_compensation(self, receiver, giver, count)
             if count == 0:
                 return  # Hacker handled it
@@ -1594,7 +2008,7 @@ class Game:
                 cards_taken += 1
 
         if cards_taken > 0:
-            self._log(f"{receiver.name} takes {cards_taken} card(s) as compensation")
+            self._log("{} takes {} card(s) as compensation", receiver.name, cards_taken)
 
     def _discard_encounter_cards(self) -> None:
         """Discard the played encounter cards."""
@@ -1619,7 +2033,7 @@ class Game:
             # Draw new hand
             cards = self.cosmic_deck.draw_multiple(self.config.starting_hand_size)
             player.add_cards(cards)
-            self._log(f"{player.name} draws a new hand")
+            self._log("{} draws a new hand", player.name)
 
     def _validate_and_select_card(
         self,
@@ -1648,7 +2062,7 @@ class Game:
 
         # Invalid selection - log and fallback
         if ai_selection:
-            self._log(f"Warning: {role_name} AI selected invalid card, using fallback")
+            self._log("Warning: {} AI selected invalid card, using fallback", role_name)
 
         # Fallback: use first encounter card available
         attacks, negotiates, morphs = player.categorize_encounter_cards()
@@ -1665,7 +2079,7 @@ class Game:
             return fallback_card
 
         # No valid encounter cards (should not happen after _ensure_encounter_card)
-        self._log(f"Error: {player.name} has no encounter cards!")
+        self._log("Error: {} has no encounter cards!", player.name)
         return None
 
     def _validate_combat_components(
@@ -1687,33 +2101,33 @@ class Game:
 
         # Validate card values (attack cards range 0-40, negative indicates error)
         if off_value < 0:
-            self._log(f"Warning: Invalid offense card value: {off_value}")
+            self._log("Warning: Invalid offense card value: {}", off_value)
             is_valid = False
         if def_value < 0:
-            self._log(f"Warning: Invalid defense card value: {def_value}")
+            self._log("Warning: Invalid defense card value: {}", def_value)
             is_valid = False
 
         # Validate ship counts (must be non-negative)
         if off_ships < 0:
-            self._log(f"Warning: Invalid offense ship count: {off_ships}")
+            self._log("Warning: Invalid offense ship count: {}", off_ships)
             is_valid = False
         if def_ships < 0:
-            self._log(f"Warning: Invalid defense ship count: {def_ships}")
+            self._log("Warning: Invalid defense ship count: {}", def_ships)
             is_valid = False
 
         # Validate totals are reasonable (not negative, not impossibly high)
         # Max reasonable total: 40 (card) + 20 (ships) + various bonuses ~= 100
         MAX_REASONABLE_TOTAL = 200
         if off_total < 0:
-            self._log(f"Warning: Negative offense total: {off_total}")
+            self._log("Warning: Negative offense total: {}", off_total)
             is_valid = False
         elif off_total > MAX_REASONABLE_TOTAL:
-            self._log(f"Warning: Extremely high offense total: {off_total}")
+            self._log("Warning: Extremely high offense total: {}", off_total)
         if def_total < 0:
-            self._log(f"Warning: Negative defense total: {def_total}")
+            self._log("Warning: Negative defense total: {}", def_total)
             is_valid = False
         elif def_total > MAX_REASONABLE_TOTAL:
-            self._log(f"Warning: Extremely high defense total: {def_total}")
+            self._log("Warning: Extremely high defense total: {}", def_total)
 
         return is_valid
 
@@ -1730,6 +2144,10 @@ class Game:
         return PlayerRole.NOT_INVOLVED
 
     def _handle_turn_end(self) -> None:
+        """Handle end of encounter, with the offense's AI deciding on a second one."""
+        self._run_steps(self._turn_end_steps())
+
+    def _turn_end_steps(self) -> Generator[Decision, Any, None]:
         """Handle end of encounter, possibly allowing second encounter."""
         # Check if offense won encounter (established colony on defense planet)
         won_encounter = (
@@ -1747,7 +2165,7 @@ class Game:
             return
 
         # Machine can always have another encounter if they have encounter cards
-        if self.offense.alien and self.offense.alien.name == "Machine" and self.is_power_active(self.offense):
+        if self.has_capability(self.offense, PowerCapability.EXTRA_ENCOUNTERS) and self.is_power_active(self.offense):
             if self.offense.has_encounter_card():
                 can_have_second = True
 
@@ -1757,10 +2175,9 @@ class Game:
             can_have_second = True
 
         if can_have_second:
-            ai = self.offense.ai_strategy or get_default_ai()
-            if ai.want_second_encounter(self, self.offense):
+            if (yield TakeSecondEncounter(self.offense)):
                 self.encounter_number = 2
-                self._log(f"{self.offense.name} takes a second encounter")
+                self._log("{} takes a second encounter", self.offense.name)
                 return
 
         # Move to next player's turn
@@ -1782,18 +2199,20 @@ class Game:
             if colonies >= colonies_needed:
                 if player not in self.winners:
                     self.winners.append(player)
-                    self._log(f"{player.name} wins with {colonies} colonies!")
+                    self._log("{} wins with {} colonies!", player.name, colonies)
 
             # Alternate win conditions
             if player.alien and player.alien.has_alternate_win:
                 if player.alien.check_alternate_win(self, player):
                     if player not in self.winners:
                         self.winners.append(player)
-                        self._log(f"{player.name} wins via {player.alien.name}!")
+                        self._log("{} wins via {}!", player.name, player.alien.name)
 
             # Update power status
-            home_count = len([p for p in self.planets if p.owner == player and p.has_colony(player.name)])
-            player.check_power_status(home_count)
+            player.check_power_status(player.count_home_colonies(self.planets))
+
+        if self.verify_board:
+            self.board.verify()
 
         if self.winners:
             self.is_over = True
@@ -1803,6 +2222,7 @@ class Game:
     def _reset_encounter_artifacts(self) -> None:
         """Reset artifact state at start of encounter."""
         self.zapped_powers = []
+        self._zap_bits = 0
         self.encounter_cancelled = False
         self.deal_made = False
 
@@ -1826,7 +2246,7 @@ class Game:
             if player is None:
                 continue
 
-            ai = player.ai_strategy or get_default_ai()
+            ai = self._ai_for(player)
             artifact = ai.select_artifact_to_play(self, player, phase, context)
 
             if artifact and artifact in player.hand:
@@ -1847,7 +2267,7 @@ class Game:
             The artifact that was played
         """
         player.remove_card(artifact)
-        self._log(f"{player.name} plays {artifact}")
+        self._log("{} plays {}", player.name, artifact)
 
         artifact_type = artifact.artifact_type
 
@@ -1888,9 +2308,8 @@ class Game:
     def _apply_cosmic_zap(self, context: Dict[str, Any]) -> None:
         """Cancel a player's alien power for this encounter."""
         target = context.get("target_player")
-        if target and target not in self.zapped_powers:
-            self.zapped_powers.append(target)
-            self._log(f"{target.name}'s power is zapped!")
+        if target and self.zap_power(target):
+            self._log("{}'s power is zapped!", target.name)
 
     def _apply_mobius_tubes(self, player: Player) -> None:
         """Free all of player's ships from the warp."""
@@ -1898,7 +2317,7 @@ class Game:
         if ships > 0:
             player.retrieve_ships_from_warp(ships)
             player.return_ships_to_colonies(ships, player.home_planets)
-            self._log(f"{player.name} frees {ships} ships from warp!")
+            self._log("{} frees {} ships from warp!", player.name, ships)
 
     def _apply_force_field(self) -> None:
         """End the encounter with no winner or loser."""
@@ -1911,7 +2330,7 @@ class Game:
         target_player = context.get("target_player")
         if target_card and target_player:
             # Card is already played, treat as 0 value attack
-            self._log(f"{target_player.name}'s {target_card} is zapped!")
+            self._log("{}'s {} is zapped!", target_player.name, target_card)
 
     def _apply_ionic_gas(self, context: Dict[str, Any]) -> None:
         """Prevent allies from participating."""
@@ -1939,15 +2358,15 @@ class Game:
             if ships > 0:
                 target_planet.remove_ships(target_player.name, ships)
                 target_player.send_ships_to_warp(ships)
-                self._log(f"Plague sends {ships} of {target_player.name}'s ships to warp!")
+                self._log("Plague sends {} of {}'s ships to warp!", ships, target_player.name)
 
     def _apply_emotion_control(self, context: Dict[str, Any]) -> None:
         """Force opponent to play a negotiate card if they have one."""
         target_player = context.get("target_player")
         if target_player:
-            negotiate_cards = [c for c in target_player.hand if isinstance(c, NegotiateCard)]
+            negotiate_cards = target_player.get_negotiate_cards()
             if negotiate_cards:
-                self._log(f"{target_player.name} is forced to play Negotiate!")
+                self._log("{} is forced to play Negotiate!", target_player.name)
                 # The effect is checked during planning phase
 
     def _apply_quash(self, context: Dict[str, Any]) -> None:
@@ -1958,8 +2377,7 @@ class Game:
     def _apply_omni_zap(self, context: Dict[str, Any]) -> None:
         """Zap all alien powers for the remainder of this encounter."""
         for player in self.players:
-            if player not in self.zapped_powers:
-                self.zapped_powers.append(player)
+            self.zap_power(player)
         self._log("Omni-Zap cancels ALL alien powers this encounter!")
 
     def _apply_solar_wind(self, context: Dict[str, Any]) -> None:
@@ -1972,7 +2390,7 @@ class Game:
             if valid_planets:
                 new_target = self._rng.choice(valid_planets)
                 self.defense_planet = new_target
-                self._log(f"Solar Wind redirects attack to {new_target}!")
+                self._log("Solar Wind redirects attack to {}!", new_target)
 
     def _apply_rebirth(self, player: Player) -> None:
         """Return all of this player's ships from warp and give a new hand."""
@@ -1992,7 +2410,7 @@ class Game:
             if card:
                 player.add_card(card)
 
-        self._log(f"Rebirth restores {player.name}'s ships and hand!")
+        self._log("Rebirth restores {}'s ships and hand!", player.name)
 
     def _apply_ship_zap(self, context: Dict[str, Any]) -> None:
         """Remove one ship from the encounter."""
@@ -2005,13 +2423,13 @@ class Game:
                 if ships > 0:
                     self.offense_ships[target_player.name] = ships - 1
                     target_player.ships_in_warp += 1
-                    self._log(f"Ship Zap removes a ship from {target_player.name}!")
+                    self._log("Ship Zap removes a ship from {}!", target_player.name)
             else:
                 ships = self.defense_ships.get(target_player.name, 0)
                 if ships > 0:
                     self.defense_ships[target_player.name] = ships - 1
                     target_player.ships_in_warp += 1
-                    self._log(f"Ship Zap removes a ship from {target_player.name}!")
+                    self._log("Ship Zap removes a ship from {}!", target_player.name)
 
     def _apply_hand_zap(self, context: Dict[str, Any]) -> None:
         """Force a player to discard a random card."""
@@ -2020,7 +2438,7 @@ class Game:
             card = self._rng.choice(target_player.hand)
             target_player.remove_card(card)
             self.cosmic_deck.discard(card)
-            self._log(f"Hand Zap forces {target_player.name} to discard a card!")
+            self._log("Hand Zap forces {} to discard a card!", target_player.name)
 
     def _apply_space_junk(self, context: Dict[str, Any]) -> None:
         """Add +5 to one side's total."""
@@ -2039,7 +2457,7 @@ class Game:
             card = self.cosmic_deck.draw()
             if card:
                 player.add_card(card)
-        self._log(f"Victory Boon gives {player.name} {colonies} cards!")
+        self._log("Victory Boon gives {} {} cards!", player.name, colonies)
 
     # ========== Flare Card Methods ==========
 
@@ -2063,7 +2481,7 @@ class Game:
             if player is None:
                 continue
 
-            ai = player.ai_strategy or get_default_ai()
+            ai = self._ai_for(player)
             flare = ai.select_flare_to_play(self, player, phase, context)
 
             if flare and flare in player.hand:
@@ -2089,15 +2507,14 @@ class Game:
         can_use_super = (
             player.alien and
             player.alien.name == flare.alien_name and
-            player.power_active and
-            player not in self.zapped_powers
+            self.is_power_active(player)
         )
 
         if can_use_super:
-            self._log(f"{player.name} plays {flare} (Super effect)!")
+            self._log("{} plays {} (Super effect)!", player.name, flare)
             self._apply_flare_super(player, flare, context)
         else:
-            self._log(f"{player.name} plays {flare} (Wild effect)!")
+            self._log("{} plays {} (Wild effect)!", player.name, flare)
             self._apply_flare_wild(player, flare, context)
 
         self.cosmic_deck.discard(flare)
@@ -2105,659 +2522,13 @@ class Game:
 
     def _apply_flare_wild(self, player: Player, flare: FlareCard, context: Dict[str, Any]) -> None:
         """Apply a flare's Wild effect (usable by anyone)."""
-        alien_name = flare.alien_name
-
-        # Machine Wild: Take one extra encounter
-        if alien_name == "Machine":
-            self._flare_extra_encounter = True
-
-        # Zombie Wild: Return 2 ships from warp
-        elif alien_name == "Zombie":
-            ships = min(2, player.ships_in_warp)
-            if ships > 0:
-                player.retrieve_ships_from_warp(ships)
-                player.return_ships_to_colonies(ships, player.home_planets)
-
-        # Human Wild: Add +3 to total
-        elif alien_name == "Human":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 3
-
-        # Warrior Wild: +1 per ship in warp
-        elif alien_name == "Warrior":
-            bonus = player.ships_in_warp
-            context["flare_bonus"] = context.get("flare_bonus", 0) + bonus
-
-        # Macron Wild: Ships count as 2 each
-        elif alien_name == "Macron":
-            context["flare_ship_multiplier"] = 2
-
-        # Healer Wild: Return 3 ships from any warp
-        elif alien_name == "Healer":
-            if player.ships_in_warp >= 3:
-                player.retrieve_ships_from_warp(3)
-                player.return_ships_to_colonies(3, player.home_planets)
-
-        # Trader Wild: Draw 2 cards
-        elif alien_name == "Trader":
-            for _ in range(2):
-                card = self.cosmic_deck.draw()
-                player.add_card(card)
-
-        # Filch Wild: Steal a random card
-        elif alien_name == "Filch":
-            opponents = [p for p in self.players if p != player and p.hand]
-            if opponents:
-                target = self._rng.choice(opponents)
-                if target.hand:
-                    stolen = self._rng.choice(target.hand)
-                    target.remove_card(stolen)
-                    player.add_card(stolen)
-
-        # Shadow Wild: Add 2 ships from colonies
-        elif alien_name == "Shadow":
-            taken = player.get_ships_from_colonies(2, self.planets)
-            if taken > 0:
-                if player == self.offense:
-                    self.offense_ships[player.name] = self.offense_ships.get(player.name, 0) + taken
-                elif player == self.defense:
-                    self.defense_ships[player.name] = self.defense_ships.get(player.name, 0) + taken
-                context["flare_bonus"] = context.get("flare_bonus", 0)  # Ships add naturally
-
-        # Warpish Wild: Send 2 opponent ships to warp
-        elif alien_name == "Warpish":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                ships_to_remove = min(2, sum(self.defense_ships.values()) if player == self.offense else sum(self.offense_ships.values()))
-                if player == self.offense and self.defense:
-                    removed = min(ships_to_remove, self.defense_ships.get(self.defense.name, 0))
-                    self.defense_ships[self.defense.name] = self.defense_ships.get(self.defense.name, 0) - removed
-                    self.defense.ships_in_warp += removed
-                elif self.offense:
-                    removed = min(ships_to_remove, self.offense_ships.get(self.offense.name, 0))
-                    self.offense_ships[self.offense.name] = self.offense_ships.get(self.offense.name, 0) - removed
-                    self.offense.ships_in_warp += removed
-
-        # Spiff Wild: Draw 1 from rewards deck
-        elif alien_name == "Spiff":
-            card = self.rewards_deck.draw()
-            if card:
-                player.add_card(card)
-
-        # Horde Wild: Return 1 ship from warp
-        elif alien_name == "Horde":
-            if player.ships_in_warp >= 1:
-                player.retrieve_ships_from_warp(1)
-                player.return_ships_to_colonies(1, player.home_planets)
-
-        # Clone Wild: Copy card just played (give +2 bonus since we can't actually copy)
-        elif alien_name == "Clone":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 2
-
-        # Loser Wild: Win this encounter if you would lose
-        elif alien_name == "Loser":
-            context["loser_flare_wild"] = True
-
-        # Pacifist Wild: Add +10 if playing negotiate
-        elif alien_name == "Pacifist":
-            if player == self.offense and isinstance(self.offense_card, NegotiateCard):
-                context["flare_bonus"] = context.get("flare_bonus", 0) + 10
-            elif player == self.defense and isinstance(self.defense_card, NegotiateCard):
-                context["flare_bonus"] = context.get("flare_bonus", 0) + 10
-
-        # Assassin Wild: Eliminate 1 opponent ship
-        elif alien_name == "Assassin":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                if player == self.offense:
-                    removed = min(1, self.defense_ships.get(opponent.name, 0))
-                    self.defense_ships[opponent.name] = self.defense_ships.get(opponent.name, 0) - removed
-                    opponent.ships_in_warp += removed
-                else:
-                    removed = min(1, self.offense_ships.get(opponent.name, 0))
-                    self.offense_ships[opponent.name] = self.offense_ships.get(opponent.name, 0) - removed
-                    opponent.ships_in_warp += removed
-
-        # Mutant Wild: Draw 2 cards, keep 1
-        elif alien_name == "Mutant":
-            cards = [self.cosmic_deck.draw() for _ in range(2)]
-            cards = [c for c in cards if c]
-            if cards:
-                # Keep the better card (higher attack or any non-attack)
-                best = max(cards, key=lambda c: c.value if hasattr(c, 'value') and c.value else 0)
-                player.add_card(best)
-                for c in cards:
-                    if c != best:
-                        self.cosmic_deck.discard(c)
-
-        # Fodder Wild: Sacrifice 1 ship for +2
-        elif alien_name == "Fodder":
-            if player == self.offense and self.offense_ships.get(player.name, 0) > 1:
-                self.offense_ships[player.name] -= 1
-                player.ships_in_warp += 1
-                context["flare_bonus"] = context.get("flare_bonus", 0) + 2
-            elif player == self.defense and self.defense_ships.get(player.name, 0) > 1:
-                self.defense_ships[player.name] -= 1
-                player.ships_in_warp += 1
-                context["flare_bonus"] = context.get("flare_bonus", 0) + 2
-
-        # Grudge Wild: +3 against attacker
-        elif alien_name == "Grudge":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 3
-
-        # Chosen Wild: Add top card of deck to total
-        elif alien_name == "Chosen":
-            card = self.cosmic_deck.draw()
-            if card and hasattr(card, 'value') and card.value:
-                context["flare_bonus"] = context.get("flare_bonus", 0) + card.value
-            self.cosmic_deck.discard(card)
-
-        # Sorcerer Wild: Swap encounter cards with opponent after reveal
-        elif alien_name == "Sorcerer":
-            if self.offense_card and self.defense_card:
-                self.offense_card, self.defense_card = self.defense_card, self.offense_card
-                self._log("Sorcerer flare swaps encounter cards!")
-
-        # Silencer Wild: Cancel one alien power this encounter
-        elif alien_name == "Silencer":
-            # Zap the opponent's power
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent and opponent not in self.zapped_powers:
-                self.zapped_powers.append(opponent)
-                self._log(f"Silencer flare cancels {opponent.name}'s power!")
-
-        # Void Wild: Remove one opposing ship from the game (to the void)
-        elif alien_name == "Void":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                if player == self.offense and self.defense_ships.get(opponent.name, 0) > 0:
-                    self.defense_ships[opponent.name] -= 1
-                    opponent.ships_in_void = getattr(opponent, 'ships_in_void', 0) + 1
-                    self._log(f"Void flare removes one of {opponent.name}'s ships to the void!")
-                elif player == self.defense and self.offense_ships.get(opponent.name, 0) > 0:
-                    self.offense_ships[opponent.name] -= 1
-                    opponent.ships_in_void = getattr(opponent, 'ships_in_void', 0) + 1
-                    self._log(f"Void flare removes one of {opponent.name}'s ships to the void!")
-
-        # Saboteur Wild: Reduce one attack card by 10
-        elif alien_name == "Saboteur":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                if player == self.offense and isinstance(self.defense_card, AttackCard):
-                    reduction = min(10, self.defense_card.value)
-                    context["saboteur_reduction_defense"] = reduction
-                elif player == self.defense and isinstance(self.offense_card, AttackCard):
-                    reduction = min(10, self.offense_card.value)
-                    context["saboteur_reduction_offense"] = reduction
-
-        # Kamikaze Wild: Sacrifice ships for +4 each
-        elif alien_name == "Kamikaze":
-            if player == self.offense:
-                ships_available = self.offense_ships.get(player.name, 0) - 1
-                sacrifice = min(ships_available, 2)
-                if sacrifice > 0:
-                    self.offense_ships[player.name] -= sacrifice
-                    player.ships_in_warp += sacrifice
-                    context["flare_bonus"] = context.get("flare_bonus", 0) + (sacrifice * 4)
-            elif player == self.defense:
-                ships_available = self.defense_ships.get(player.name, 0) - 1
-                sacrifice = min(ships_available, 2)
-                if sacrifice > 0:
-                    self.defense_ships[player.name] -= sacrifice
-                    player.ships_in_warp += sacrifice
-                    context["flare_bonus"] = context.get("flare_bonus", 0) + (sacrifice * 4)
-
-        # Dictator Wild: Choose which card one opponent must play
-        elif alien_name == "Dictator":
-            # In simulation, force opponent to use their weakest card
-            context["dictator_force_weak"] = True
-
-        # Anti-Matter Wild: Reverse the outcome - lower total wins
-        elif alien_name == "Anti-Matter":
-            context["anti_matter_reverse"] = True
-            self._log("Anti-Matter flare reverses combat - lower total wins!")
-
-        # Leviathan Wild: Add +10 but lose 2 ships to warp
-        elif alien_name == "Leviathan":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 10
-            if player == self.offense and self.offense_ships.get(player.name, 0) > 2:
-                loss = min(2, self.offense_ships[player.name] - 1)
-                self.offense_ships[player.name] -= loss
-                player.ships_in_warp += loss
-            elif player == self.defense and self.defense_ships.get(player.name, 0) > 2:
-                loss = min(2, self.defense_ships[player.name] - 1)
-                self.defense_ships[player.name] -= loss
-                player.ships_in_warp += loss
-
-        # Warhawk Wild: Add +5 when attacking
-        elif alien_name == "Warhawk":
-            if player == self.offense:
-                context["flare_bonus"] = context.get("flare_bonus", 0) + 5
-
-        # Trickster Wild: Play a negotiate as a 20 attack
-        elif alien_name == "Trickster":
-            if player == self.offense and isinstance(self.offense_card, NegotiateCard):
-                context["trickster_negotiate_value"] = 20
-            elif player == self.defense and isinstance(self.defense_card, NegotiateCard):
-                context["trickster_negotiate_value"] = 20
-
-        # Amoeba Wild: Add 2 ships to the encounter from warp
-        elif alien_name == "Amoeba":
-            ships = min(2, player.ships_in_warp)
-            if ships > 0:
-                player.retrieve_ships_from_warp(ships)
-                if player == self.offense:
-                    self.offense_ships[player.name] = self.offense_ships.get(player.name, 0) + ships
-                elif player == self.defense:
-                    self.defense_ships[player.name] = self.defense_ships.get(player.name, 0) + ships
-
-        # Changeling Wild: Copy one alien power for this encounter
-        elif alien_name == "Changeling":
-            # Copy the opponent's power
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent and opponent.alien:
-                context["changeling_copied_power"] = opponent.alien.name
-                self._log(f"Changeling copies {opponent.alien.name}'s power!")
-
-        # Nightmare Wild: Opponent must discard 2 cards
-        elif alien_name == "Nightmare":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                discards = min(2, len(opponent.hand))
-                for _ in range(discards):
-                    if opponent.hand:
-                        card = self._rng.choice(opponent.hand)
-                        opponent.remove_card(card)
-                        self.cosmic_deck.discard(card)
-
-        # Barbarian Wild: Pillage 1 card from loser
-        elif alien_name == "Barbarian":
-            context["barbarian_pillage"] = 1
-
-        # Bully Wild: +4 against players with fewer colonies
-        elif alien_name == "Bully":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                my_colonies = player.count_foreign_colonies(self.planets)
-                opp_colonies = opponent.count_foreign_colonies(self.planets)
-                if opp_colonies < my_colonies:
-                    context["flare_bonus"] = context.get("flare_bonus", 0) + 4
-
-        # Calculator Wild: Increase card value by the number of cards in hand
-        elif alien_name == "Calculator":
-            bonus = len(player.hand)
-            context["flare_bonus"] = context.get("flare_bonus", 0) + bonus
-
-        # Gambler Wild: Flip a coin. If heads, double card value
-        elif alien_name == "Gambler":
-            if self._rng.random() < 0.5:  # Heads
-                context["gambler_double"] = True
-                self._log("Gambler flare: Heads! Card value doubled!")
-            else:
-                self._log("Gambler flare: Tails! No effect.")
-
-        # Default: +2 to total (generic Wild effect)
-        else:
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 2
+        effect = flare.wild_handler or get_wild_effect(flare.alien_name)
+        effect(self, player, context)
 
     def _apply_flare_super(self, player: Player, flare: FlareCard, context: Dict[str, Any]) -> None:
         """Apply a flare's Super effect (only for matching alien)."""
-        alien_name = flare.alien_name
-
-        # Machine Super: Take two extra encounters
-        if alien_name == "Machine":
-            self._flare_extra_encounter = True
-            self._flare_extra_encounter_count = 2
-
-        # Zombie Super: Return all ships from warp
-        elif alien_name == "Zombie":
-            ships = player.ships_in_warp
-            if ships > 0:
-                player.retrieve_ships_from_warp(ships)
-                player.return_ships_to_colonies(ships, player.home_planets)
-
-        # Human Super: Add +6 to total
-        elif alien_name == "Human":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 6
-
-        # Warrior Super: +2 per ship in warp
-        elif alien_name == "Warrior":
-            bonus = player.ships_in_warp * 2
-            context["flare_bonus"] = context.get("flare_bonus", 0) + bonus
-
-        # Macron Super: Ships count as 5 each
-        elif alien_name == "Macron":
-            context["flare_ship_multiplier"] = 5
-
-        # Healer Super: Return all ships from warp to colonies
-        elif alien_name == "Healer":
-            for p in self.players:
-                ships = p.ships_in_warp
-                if ships > 0:
-                    p.retrieve_ships_from_warp(ships)
-                    p.return_ships_to_colonies(ships, p.home_planets)
-
-        # Trader Super: Trade hands with any player
-        elif alien_name == "Trader":
-            opponents = [p for p in self.players if p != player]
-            if opponents:
-                # Trade with player who has most cards
-                target = max(opponents, key=lambda p: len(p.hand))
-                player.hand, target.hand = target.hand, player.hand
-
-        # Filch Super: Steal 2 cards
-        elif alien_name == "Filch":
-            opponents = [p for p in self.players if p != player and p.hand]
-            if opponents:
-                target = self._rng.choice(opponents)
-                for _ in range(min(2, len(target.hand))):
-                    if target.hand:
-                        stolen = self._rng.choice(target.hand)
-                        target.remove_card(stolen)
-                        player.add_card(stolen)
-
-        # Virus Super: Triple ship count when adding
-        elif alien_name == "Virus":
-            context["flare_ship_multiplier"] = 3
-
-        # Oracle Super: Look at and force different card
-        elif alien_name == "Oracle":
-            # Effect handled specially during planning
-            context["oracle_super"] = True
-
-        # Parasite Super: Join both sides
-        elif alien_name == "Parasite":
-            context["parasite_both_sides"] = True
-
-        # Shadow Super: Add 4 ships from colonies
-        elif alien_name == "Shadow":
-            taken = player.get_ships_from_colonies(4, self.planets)
-            if taken > 0:
-                if player == self.offense:
-                    self.offense_ships[player.name] = self.offense_ships.get(player.name, 0) + taken
-                elif player == self.defense:
-                    self.defense_ships[player.name] = self.defense_ships.get(player.name, 0) + taken
-
-        # Warpish Super: Send 4 opponent ships to warp
-        elif alien_name == "Warpish":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                if player == self.offense and self.defense:
-                    removed = min(4, self.defense_ships.get(self.defense.name, 0))
-                    self.defense_ships[self.defense.name] = self.defense_ships.get(self.defense.name, 0) - removed
-                    self.defense.ships_in_warp += removed
-                elif self.offense:
-                    removed = min(4, self.offense_ships.get(self.offense.name, 0))
-                    self.offense_ships[self.offense.name] = self.offense_ships.get(self.offense.name, 0) - removed
-                    self.offense.ships_in_warp += removed
-
-        # Spiff Super: Draw 2 from rewards deck
-        elif alien_name == "Spiff":
-            for _ in range(2):
-                card = self.rewards_deck.draw()
-                if card:
-                    player.add_card(card)
-
-        # Horde Super: Return 2 ships from warp
-        elif alien_name == "Horde":
-            ships = min(2, player.ships_in_warp)
-            if ships > 0:
-                player.retrieve_ships_from_warp(ships)
-                player.return_ships_to_colonies(ships, player.home_planets)
-
-        # Clone Super: Play same card again (give +4 bonus as approximation)
-        elif alien_name == "Clone":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 4
-
-        # Loser Super: Automatically lose and win
-        elif alien_name == "Loser":
-            context["loser_flare_super"] = True
-
-        # Pacifist Super: Extra colony on negotiate win
-        elif alien_name == "Pacifist":
-            context["pacifist_extra_colony"] = True
-            if player == self.offense and isinstance(self.offense_card, NegotiateCard):
-                context["flare_bonus"] = context.get("flare_bonus", 0) + 10
-            elif player == self.defense and isinstance(self.defense_card, NegotiateCard):
-                context["flare_bonus"] = context.get("flare_bonus", 0) + 10
-
-        # Assassin Super: Eliminate 3 opponent ships
-        elif alien_name == "Assassin":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                if player == self.offense:
-                    removed = min(3, self.defense_ships.get(opponent.name, 0))
-                    self.defense_ships[opponent.name] = self.defense_ships.get(opponent.name, 0) - removed
-                    opponent.ships_in_warp += removed
-                else:
-                    removed = min(3, self.offense_ships.get(opponent.name, 0))
-                    self.offense_ships[opponent.name] = self.offense_ships.get(opponent.name, 0) - removed
-                    opponent.ships_in_warp += removed
-
-        # Mutant Super: Draw 4 cards, keep 2
-        elif alien_name == "Mutant":
-            cards = [self.cosmic_deck.draw() for _ in range(4)]
-            cards = [c for c in cards if c]
-            if cards:
-                # Sort by value and keep best 2
-                cards.sort(key=lambda c: c.value if hasattr(c, 'value') and c.value else 0, reverse=True)
-                for i, c in enumerate(cards):
-                    if i < 2:
-                        player.add_card(c)
-                    else:
-                        self.cosmic_deck.discard(c)
-
-        # Fodder Super: Sacrifice any ships for +3 each
-        elif alien_name == "Fodder":
-            if player == self.offense:
-                ships_available = self.offense_ships.get(player.name, 0) - 1
-                sacrifice = min(ships_available, 2)  # Sacrifice up to 2
-                if sacrifice > 0:
-                    self.offense_ships[player.name] -= sacrifice
-                    player.ships_in_warp += sacrifice
-                    context["flare_bonus"] = context.get("flare_bonus", 0) + (sacrifice * 3)
-            elif player == self.defense:
-                ships_available = self.defense_ships.get(player.name, 0) - 1
-                sacrifice = min(ships_available, 2)
-                if sacrifice > 0:
-                    self.defense_ships[player.name] -= sacrifice
-                    player.ships_in_warp += sacrifice
-                    context["flare_bonus"] = context.get("flare_bonus", 0) + (sacrifice * 3)
-
-        # Grudge Super: +6 against attacker
-        elif alien_name == "Grudge":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 6
-
-        # Chosen Super: Add top 2 cards of deck to total
-        elif alien_name == "Chosen":
-            total_bonus = 0
-            for _ in range(2):
-                card = self.cosmic_deck.draw()
-                if card and hasattr(card, 'value') and card.value:
-                    total_bonus += card.value
-                if card:
-                    self.cosmic_deck.discard(card)
-            context["flare_bonus"] = context.get("flare_bonus", 0) + total_bonus
-
-        # Tripler Super: Triple attack card value
-        elif alien_name == "Tripler":
-            context["tripler_super"] = True  # Handled in combat resolution
-
-        # Chronos Super: Take two additional turns
-        elif alien_name == "Chronos":
-            context["chronos_extra_turns"] = 2
-
-        # Diplomat Super: Force deal success with 2 colonies
-        elif alien_name == "Diplomat":
-            context["diplomat_force_deal"] = True
-
-        # Sorcerer Super: Swap hands with any player
-        elif alien_name == "Sorcerer":
-            opponents = [p for p in self.players if p != player]
-            if opponents:
-                # Swap with player who has the best hand
-                target = max(opponents, key=lambda p: len(p.hand))
-                player.hand, target.hand = target.hand, player.hand
-                self._log(f"Sorcerer Super swaps hands with {target.name}!")
-
-        # Silencer Super: Cancel all alien powers this encounter
-        elif alien_name == "Silencer":
-            for p in self.players:
-                if p != player and p not in self.zapped_powers:
-                    self.zapped_powers.append(p)
-            self._log("Silencer Super cancels ALL alien powers!")
-
-        # Void Super: Remove all ships from one planet to the void
-        elif alien_name == "Void":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                if player == self.offense:
-                    ships = self.defense_ships.get(opponent.name, 0)
-                    self.defense_ships[opponent.name] = 0
-                    opponent.ships_in_void = getattr(opponent, 'ships_in_void', 0) + ships
-                else:
-                    ships = self.offense_ships.get(opponent.name, 0)
-                    self.offense_ships[opponent.name] = 0
-                    opponent.ships_in_void = getattr(opponent, 'ships_in_void', 0) + ships
-                if ships > 0:
-                    self._log(f"Void Super removes {ships} ships to the void!")
-
-        # Saboteur Super: Reduce opponent's card to 0
-        elif alien_name == "Saboteur":
-            if player == self.offense:
-                context["saboteur_zero_defense"] = True
-            else:
-                context["saboteur_zero_offense"] = True
-            self._log("Saboteur Super reduces opponent's card to 0!")
-
-        # Kamikaze Super: Sacrifice all ships for instant win
-        elif alien_name == "Kamikaze":
-            context["kamikaze_instant_win"] = True
-            # Sacrifice all ships
-            if player == self.offense:
-                ships = self.offense_ships.get(player.name, 0)
-                self.offense_ships[player.name] = 0
-                player.ships_in_warp += ships
-            elif player == self.defense:
-                ships = self.defense_ships.get(player.name, 0)
-                self.defense_ships[player.name] = 0
-                player.ships_in_warp += ships
-            self._log("Kamikaze Super: All ships sacrificed for instant win!")
-
-        # Dictator Super: Choose the encounter cards for both main players
-        elif alien_name == "Dictator":
-            context["dictator_control_both"] = True
-
-        # Anti-Matter Super: Your 0 attack cards count as 40
-        elif alien_name == "Anti-Matter":
-            if player == self.offense and isinstance(self.offense_card, AttackCard):
-                if self.offense_card.value == 0:
-                    context["anti_matter_zero_boost"] = 40
-            elif player == self.defense and isinstance(self.defense_card, AttackCard):
-                if self.defense_card.value == 0:
-                    context["anti_matter_zero_boost"] = 40
-
-        # Leviathan Super: Add +20, no ship loss
-        elif alien_name == "Leviathan":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 20
-
-        # Warhawk Super: Add +10 when attacking
-        elif alien_name == "Warhawk":
-            if player == self.offense:
-                context["flare_bonus"] = context.get("flare_bonus", 0) + 10
-
-        # Trickster Super: Negotiate counts as 30 attack
-        elif alien_name == "Trickster":
-            if player == self.offense and isinstance(self.offense_card, NegotiateCard):
-                context["trickster_negotiate_value"] = 30
-            elif player == self.defense and isinstance(self.defense_card, NegotiateCard):
-                context["trickster_negotiate_value"] = 30
-
-        # Amoeba Super: Add 4 ships from anywhere to encounter
-        elif alien_name == "Amoeba":
-            # First try warp, then colonies
-            ships_needed = 4
-            from_warp = min(ships_needed, player.ships_in_warp)
-            if from_warp > 0:
-                player.retrieve_ships_from_warp(from_warp)
-            remaining = ships_needed - from_warp
-            if remaining > 0:
-                from_colonies = player.get_ships_from_colonies(remaining, self.planets)
-            else:
-                from_colonies = 0
-            total_added = from_warp + from_colonies
-            if total_added > 0:
-                if player == self.offense:
-                    self.offense_ships[player.name] = self.offense_ships.get(player.name, 0) + total_added
-                elif player == self.defense:
-                    self.defense_ships[player.name] = self.defense_ships.get(player.name, 0) + total_added
-
-        # Changeling Super: Copy two alien powers for this encounter
-        elif alien_name == "Changeling":
-            other_aliens = [p.alien.name for p in self.players if p != player and p.alien]
-            if len(other_aliens) >= 2:
-                context["changeling_copied_powers"] = other_aliens[:2]
-            elif other_aliens:
-                context["changeling_copied_powers"] = other_aliens
-
-        # Nightmare Super: Opponent discards half their hand
-        elif alien_name == "Nightmare":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                discards = len(opponent.hand) // 2
-                for _ in range(discards):
-                    if opponent.hand:
-                        card = self._rng.choice(opponent.hand)
-                        opponent.remove_card(card)
-                        self.cosmic_deck.discard(card)
-
-        # Barbarian Super: Pillage 3 cards from loser
-        elif alien_name == "Barbarian":
-            context["barbarian_pillage"] = 3
-
-        # Bully Super: +8 against players with fewer colonies
-        elif alien_name == "Bully":
-            opponent = self.defense if player == self.offense else self.offense
-            if opponent:
-                my_colonies = player.count_foreign_colonies(self.planets)
-                opp_colonies = opponent.count_foreign_colonies(self.planets)
-                if opp_colonies < my_colonies:
-                    context["flare_bonus"] = context.get("flare_bonus", 0) + 8
-
-        # Calculator Super: Double card value based on cards in hand
-        elif alien_name == "Calculator":
-            bonus = len(player.hand) * 2
-            context["flare_bonus"] = context.get("flare_bonus", 0) + bonus
-
-        # Gambler Super: Triple card value on heads, normal on tails (choose the result)
-        elif alien_name == "Gambler":
-            context["gambler_triple"] = True
-            self._log("Gambler Super: Guaranteed triple!")
-
-        # Magician Super: Take best cards from all hands
-        elif alien_name == "Magician":
-            for p in self.players:
-                if p != player and p.hand:
-                    attack_cards = [c for c in p.hand if hasattr(c, 'value') and c.value]
-                    if attack_cards:
-                        best = max(attack_cards, key=lambda c: c.value)
-                        p.remove_card(best)
-                        player.add_card(best)
-
-        # Negator Super: Cancel all alien powers this encounter
-        elif alien_name == "Negator":
-            for p in self.players:
-                if p not in self.zapped_powers:
-                    self.zapped_powers.append(p)
-            self._log("Negator Super cancels ALL alien powers!")
-
-        # Anarchist Super: You make the rules this encounter (+10 bonus as approximation)
-        elif alien_name == "Anarchist":
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 10
-            context["anarchist_super"] = True
-
-        # Default: +4 to total (generic Super effect)
-        else:
-            context["flare_bonus"] = context.get("flare_bonus", 0) + 4
+        effect = flare.super_handler or get_super_effect(flare.alien_name)
+        effect(self, player, context)
 
     def _resolve_force_field(self) -> None:
         """Handle resolution when Force Field was played - encounter ends with no winner."""
@@ -2778,9 +2549,35 @@ class Game:
         # Discard encounter cards
         self._discard_encounter_cards()
 
+    def _is_zapped(self, player: Player) -> bool:
+        if not self.zapped_powers:
+            return False
+        seat = self._seats.get(id(player))
+        if seat is None:
+            return player in self.zapped_powers
+        return bool(self._zap_bits >> seat & 1)
+
+    def zap_power(self, player: Player) -> bool:
+        """
+        Cancel a player's powers for the rest of this encounter.
+
+        The only way players are added to zapped_powers, so the zap bits
+        stay in step with it.
+
+        Returns:
+            True if the player was not already zapped
+        """
+        if self._is_zapped(player):
+            return False
+        self.zapped_powers.append(player)
+        seat = self._seats.get(id(player))
+        if seat is not None:
+            self._zap_bits |= 1 << seat
+        return True
+
     def is_power_active(self, player: Player) -> bool:
         """Check if a player's power is currently active (not zapped)."""
-        if player in self.zapped_powers:
+        if self._is_zapped(player):
             return False
         return player.power_active
 
@@ -2794,55 +2591,33 @@ class Game:
         Returns:
             True if the power timing matches the current phase
         """
-        from .types import PowerTiming
-
         if not player.alien:
             return False
+        seat = self._seats.get(id(player))
+        if seat is None:
+            return player.alien.timing in _PHASE_TIMINGS.get(self.phase, ())
+        return bool(self._phase_powers.get(self.phase, 0) >> (2 * seat) & 1)
 
-        timing = player.alien.timing
-
-        # These timings are always valid
-        if timing in (PowerTiming.CONSTANT, PowerTiming.ANY):
-            return True
-
-        # Map phase to valid power timings
-        phase_timing_map = {
-            GamePhase.START_TURN: [PowerTiming.START_TURN, PowerTiming.START_ENCOUNTER],
-            GamePhase.REGROUP: [PowerTiming.REGROUP],
-            GamePhase.DESTINY: [PowerTiming.DESTINY],
-            GamePhase.LAUNCH: [PowerTiming.LAUNCH],
-            GamePhase.ALLIANCE: [PowerTiming.ALLIANCE],
-            GamePhase.PLANNING: [PowerTiming.PLANNING],
-            GamePhase.REVEAL: [PowerTiming.REVEAL],
-            GamePhase.RESOLUTION: [
-                PowerTiming.RESOLUTION,
-                PowerTiming.WIN_ENCOUNTER,
-                PowerTiming.LOSE_ENCOUNTER,
-                PowerTiming.SHIPS_TO_WARP,
-            ],
-        }
-
-        valid_timings = phase_timing_map.get(self.phase, [])
-        return timing in valid_timings
-
-    def get_active_powers(self, player: Player) -> list:
+    def get_active_powers(self, player: Player) -> Tuple[AlienPower, ...]:
         """
         Get all active alien powers for a player.
 
         In dual power mode (2-player variant), returns both primary and secondary powers.
-        Returns list of AlienPower objects that are currently active.
+        Returns a tuple of AlienPower objects that are currently active (the
+        seat's entry in the power table, not a copy).
         """
-        powers = []
+        if not self.is_power_active(player):
+            return ()
+        seat = self._seats.get(id(player))
+        if seat is not None:
+            return self._seat_powers[seat]
 
-        if player.alien and self.is_power_active(player):
+        powers = []
+        if player.alien:
             powers.append(player.alien)
-
-        # Include secondary alien for dual power mode
-        if self.config.dual_powers and hasattr(player, 'secondary_alien') and player.secondary_alien:
-            if player not in self.zapped_powers and player.power_active:
-                powers.append(player.secondary_alien)
-
-        return powers
+        if self.config.dual_powers and player.secondary_alien:
+            powers.append(player.secondary_alien)
+        return tuple(powers)
 
     def apply_power_modifications(
         self,
@@ -2863,7 +2638,15 @@ class Game:
         Returns:
             Modified value after all applicable powers are applied
         """
-        for power in self.get_active_powers(player):
+        if not self.is_power_active(player):
+            return value
+        seat = self._seats.get(id(player))
+        powers = self._seat_powers[seat] if seat is not None else self.get_active_powers(player)
+
+        hook = _MODIFICATION_HOOKS.get(modification_type)
+        for power in powers:
+            if hook not in AlienRegistry.get_hooks(power):
+                continue
             if modification_type == 'attack':
                 value = power.modify_attack_value(self, player, value, side)
             elif modification_type == 'ships':
@@ -2883,7 +2666,7 @@ class Game:
 
         self.current_hazard = self.hazard_deck.draw()
         if self.current_hazard:
-            self._log(f"⚠️ Hazard: {self.current_hazard.name} - {self.current_hazard.description}")
+            self._log("⚠️ Hazard: {} - {}", self.current_hazard.name, self.current_hazard.description)
 
             # Apply immediate (START_ENCOUNTER) hazard effects
             if self.current_hazard.timing == HazardTiming.START_ENCOUNTER:
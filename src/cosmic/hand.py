@@ -0,0 +1,171 @@
+"""
+Indexed hand of cards for Cosmic Encounter.
+
+The AIs ask about a player's hand (its attack cards, the highest attack,
+whether any encounter card is left) at nearly every decision. A Hand is a
+list of cards that keeps per-type buckets and the sorted attack values
+current as cards come and go, so those questions don't rescan the hand.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional
+
+from .cards.base import Card, AttackCard
+
+
+class Hand(list):
+    """
+    A player's cards, in the order they were added.
+
+    Behaves as a list; every mutating list method also updates the index:
+    the cards of each class in hand order, the number of encounter cards,
+    and the attack values as a sorted list with their sum.
+    """
+    __slots__ = ("_buckets", "_encounters", "attack_values", "attack_total")
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        super().__init__(cards)
+        self._reindex()
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copies and pickles are reindexed
+        return (Hand, (list(self),))
+
+    # ========== Index ==========
+
+    def _reindex(self) -> None:
+        """Rebuild the index from the cards."""
+        self._buckets: Dict[type, List[Card]] = {}
+        self._encounters = 0
+        self.attack_values: List[int] = []
+        self.attack_total = 0
+        for card in self:
+            self._index(card)
+
+    def _index(self, card: Card) -> None:
+        """Add a card appended to the end of the hand."""
+        bucket = self._buckets.get(type(card))
+        if bucket is None:
+            bucket = self._buckets[type(card)] = []
+        bucket.append(card)
+        if card.is_encounter_card():
+            self._encounters += 1
+        if type(card) is AttackCard:
+            insort(self.attack_values, card.value)
+            self.attack_total += card.value
+
+    def _unindex(self, card: Card, last: bool) -> None:
+        """Drop a card removed from the hand (the last card of its class if last, else the first equal one)."""
+        bucket = self._buckets[type(card)]
+        if last:
+            bucket.pop()
+        else:
+            bucket.remove(card)
+        if card.is_encounter_card():
+            self._encounters -= 1
+        if type(card) is AttackCard:
+            del self.attack_values[bisect_left(self.attack_values, card.value)]
+            self.attack_total -= card.value
+
+    # ========== List mutation ==========
+
+    def append(self, card: Card) -> None:
+        super().append(card)
+        self._index(card)
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        cards = list(cards)
+        super().extend(cards)
+        for card in cards:
+            self._index(card)
+
+    def __iadd__(self, cards: Iterable[Card]) -> "Hand":
+        self.extend(cards)
+        return self
+
+    def remove(self, card: Card) -> None:
+        # list.remove takes the first equal card, which is the first equal
+        # card of its class's bucket (cards only equal cards of their class)
+        super().remove(card)
+        self._unindex(card, last=False)
+
+    def pop(self, index: int = -1) -> Card:
+        last = index == -1 or index == len(self) - 1
+        card = super().pop(index)
+        if last:
+            self._unindex(card, last=True)
+        else:
+            self._reindex()
+        return card
+
+    def clear(self) -> None:
+        super().clear()
+        self._reindex()
+
+    def insert(self, index: int, card: Card) -> None:
+        super().insert(index, card)
+        self._reindex()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._reindex()
+
+    def __imul__(self, count: int) -> "Hand":
+        super().__imul__(count)
+        self._reindex()
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._reindex()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._reindex()
+
+    # ========== Queries ==========
+
+    def of_type(self, card_class: type) -> List[Card]:
+        """The cards whose class is card_class, in hand order (do not modify)."""
+        return self._buckets.get(card_class) or []
+
+    def encounter_count(self) -> int:
+        """Number of encounter cards (attack, negotiate, morph)."""
+        return self._encounters
+
+    def nth_highest_attack(self, n: int) -> Optional[AttackCard]:
+        """
+        The nth highest attack card (1 = highest), or the lowest if there
+        are fewer than n.
+
+        Matches sorting the attack cards by value, highest first (ties in
+        hand order), and indexing.
+        """
+        if n < 1:
+            raise ValueError(f"Attack rank must be at least 1, got {n}")
+        values = self.attack_values
+        if not values:
+            return None
+        rank = min(n, len(values)) - 1
+        value = values[len(values) - 1 - rank]
+        higher = len(values) - bisect_right(values, value)
+        return self._attack_with_value(value, rank - higher)
+
+    def lowest_attack(self) -> Optional[AttackCard]:
+        """The first lowest attack card in hand order."""
+        if not self.attack_values:
+            return None
+        return self._attack_with_value(self.attack_values[0], 0)
+
+    def _attack_with_value(self, value: int, skip: int) -> AttackCard:
+        """The attack card with the value, after skipping that many earlier ones in hand order."""
+        for card in self._buckets[AttackCard]:
+            if card.value == value:
+                if skip == 0:
+                    return card
+                skip -= 1
+        raise RuntimeError(f"Hand index out of sync: no attack card of value {value}")
@@ -15,6 +15,7 @@ from typing import List, Dict, Any, Optional, Callable
 from enum import Enum, auto
 from datetime import datetime
 import json
+import threading
 
 
 class LogLevel(Enum):
@@ -411,19 +412,20 @@ class GameLogger:
         self.deal_count = 0
 
 
-# Global logger instance (optional singleton pattern)
-_global_logger: Optional[GameLogger] = None
+# Default logger, one per thread so games running on different threads
+# never share (and interleave entries in) the same GameLogger
+_thread_state = threading.local()
 
 
 def get_logger() -> GameLogger:
-    """Get the global logger instance."""
-    global _global_logger
-    if _global_logger is None:
-        _global_logger = GameLogger()
-    return _global_logger
+    """Get the current thread's logger instance."""
+    logger = getattr(_thread_state, "logger", None)
+    if logger is None:
+        logger = GameLogger()
+        _thread_state.logger = logger
+    return logger
 
 
 def set_logger(logger: GameLogger) -> None:
-    """Set the global logger instance."""
-    global _global_logger
-    _global_logger = logger
+    """Set the current thread's logger instance."""
+    _thread_state.logger = logger
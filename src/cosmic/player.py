@@ -6,12 +6,14 @@ import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
 
-from .types import Color, PlayerRole, SpaceStation, StationType
+from .types import Color, PlayerRole, PowerCapability, SpaceStation, StationType
 from .cards.base import Card, EncounterCard, AttackCard, NegotiateCard, MorphCard
 from .cards.tech_deck import PlayerTechState
+from .hand import Hand
 
 if TYPE_CHECKING:
     from .planet import Planet
+    from .board_index import BoardIndex
     from .aliens.base import AlienPower
     from .ai.base import AIStrategy
 
@@ -27,8 +29,8 @@ class Player:
     secondary_alien: Optional["AlienPower"] = None  # For 2-player dual power variant
     ai_strategy: Optional["AIStrategy"] = None
 
-    # Hand of cards
-    hand: List[Card] = field(default_factory=list)
+    # Hand of cards (a Hand: a list indexed by card type)
+    hand: List[Card] = field(default_factory=Hand)
 
     # Power state
     power_active: bool = True
@@ -54,12 +56,17 @@ class Player:
     # Hand strength cache: (hand_length, attack_card_ids, strength_value)
     _hand_strength_cache: Optional[Tuple[int, int, float]] = field(default=None, init=False)
 
+    # Board index of the game's planets (set by Game); used when queries pass those planets
+    _board: Optional["BoardIndex"] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         # Intern player name for memory efficiency (names are used as dict keys)
         self.name = sys.intern(self.name)
         # Validate color
         if isinstance(self.color, str):
             self.color = Color(self.color)
+        if type(self.hand) is not Hand:
+            self.hand = Hand(self.hand)
 
     @property
     def alien_name(self) -> str:
@@ -75,16 +82,44 @@ class Player:
     def home_planets(self, planets: List["Planet"]) -> None:
         self._home_planets = planets
 
+    def _indexed(self, all_planets: List["Planet"]) -> Optional["BoardIndex"]:
+        """The board index, if it tracks exactly these planets."""
+        board = self._board
+        return board if board is not None and board.planets is all_planets else None
+
+    def get_colonies(self, all_planets: List["Planet"]) -> List["Planet"]:
+        """Get every planet (home or foreign) where this player has ships."""
+        board = self._indexed(all_planets)
+        if board is not None:
+            return board.planets_with_ships(self.name)
+        return [p for p in all_planets if p.has_colony(self.name)]
+
     def get_foreign_colonies(self, all_planets: List["Planet"]) -> List["Planet"]:
         """Get planets where this player has colonies but doesn't own."""
+        board = self._indexed(all_planets)
+        if board is not None:
+            return board.foreign_colonies(self.name)
         return [p for p in all_planets if p.is_foreign_colony(self)]
 
     def count_foreign_colonies(self, all_planets: List["Planet"]) -> int:
         """Count the number of foreign colonies."""
+        board = self._indexed(all_planets)
+        if board is not None:
+            return board.foreign_colony_count(self.name)
         return len(self.get_foreign_colonies(all_planets))
 
+    def count_home_colonies(self, all_planets: List["Planet"]) -> int:
+        """Count own home planets where this player still has ships."""
+        board = self._indexed(all_planets)
+        if board is not None:
+            return board.home_colony_count(self.name)
+        return sum(1 for p in all_planets if p.is_home_planet(self) and p.has_colony(self.name))
+
     def total_ships_in_play(self, all_planets: List["Planet"]) -> int:
         """Count all ships this player has on planets."""
+        board = self._indexed(all_planets)
+        if board is not None:
+            return board.ships_in_play(self.name)
         return sum(p.get_ships(self.name) for p in all_planets)
 
     def total_ships(self, all_planets: List["Planet"]) -> int:
@@ -109,30 +144,44 @@ class Player:
         """Check if a specific card is in hand."""
         return card in self.hand
 
+    def _indexed_hand(self) -> Hand:
+        """The hand as a Hand, converting a plain list assigned to it."""
+        hand = self.hand
+        if type(hand) is not Hand:
+            hand = self.hand = Hand(hand)
+        return hand
+
     def has_encounter_card(self) -> bool:
         """Check if player has at least one encounter card."""
-        return any(card.is_encounter_card() for card in self.hand)
+        return self._indexed_hand().encounter_count() > 0
 
     def get_encounter_cards(self) -> List[EncounterCard]:
         """Get all encounter cards in hand."""
+        if not self._indexed_hand().encounter_count():
+            return []
         return [card for card in self.hand if card.is_encounter_card()]
 
+    def get_cards_of_type(self, card_class: type) -> List[Card]:
+        """Get the cards of a class (e.g. KickerCard) in hand, in hand order."""
+        return list(self._indexed_hand().of_type(card_class))
+
     def get_attack_cards(self) -> List[AttackCard]:
         """Get all attack cards in hand."""
-        return [card for card in self.hand if isinstance(card, AttackCard)]
+        return list(self._indexed_hand().of_type(AttackCard))
 
     def get_negotiate_cards(self) -> List[NegotiateCard]:
         """Get all negotiate cards in hand."""
-        return [card for card in self.hand if isinstance(card, NegotiateCard)]
+        return list(self._indexed_hand().of_type(NegotiateCard))
 
     def get_hand_strength_cached(self) -> float:
         """
         Get hand strength with caching. Returns value 0.0 to 1.0.
         Cache is invalidated when hand length or attack cards change.
         """
-        attack_cards = self.get_attack_cards()
-        hand_len = len(self.hand)
-        attack_count = len(attack_cards)
+        hand = self._indexed_hand()
+        values = hand.attack_values
+        hand_len = len(hand)
+        attack_count = len(values)
 
         # Check cache validity
         if self._hand_strength_cache is not None:
@@ -141,11 +190,11 @@ class Player:
                 return cached_strength
 
         # Calculate hand strength
-        if not attack_cards:
+        if not values:
             strength = 0.0
         else:
-            max_value = max(c.value for c in attack_cards)
-            avg_value = sum(c.value for c in attack_cards) / attack_count
+            max_value = values[-1]
+            avg_value = hand.attack_total / attack_count
             strength = min(1.0, (max_value / 40 * 0.5) + (avg_value / 40 * 0.5))
 
         # Update cache
@@ -154,21 +203,16 @@ class Player:
 
     def categorize_encounter_cards(self) -> Tuple[List[AttackCard], List[NegotiateCard], List[MorphCard]]:
         """
-        Categorize encounter cards in a single pass.
+        Categorize encounter cards from the hand index.
         Returns (attack_cards, negotiate_cards, morph_cards) tuple.
         More efficient than calling get_attack_cards() and get_negotiate_cards() separately.
         """
-        attacks: List[AttackCard] = []
-        negotiates: List[NegotiateCard] = []
-        morphs: List[MorphCard] = []
-        for card in self.hand:
-            if isinstance(card, AttackCard):
-                attacks.append(card)
-            elif isinstance(card, NegotiateCard):
-                negotiates.append(card)
-            elif isinstance(card, MorphCard):
-                morphs.append(card)
-        return attacks, negotiates, morphs
+        hand = self._indexed_hand()
+        return (
+            list(hand.of_type(AttackCard)),
+            list(hand.of_type(NegotiateCard)),
+            list(hand.of_type(MorphCard)),
+        )
 
     def hand_size(self) -> int:
         """Number of cards in hand."""
@@ -178,28 +222,19 @@ class Player:
 
     def select_highest_attack(self) -> Optional[AttackCard]:
         """Select the highest value attack card in hand."""
-        attacks = self.get_attack_cards()
-        if not attacks:
-            return None
-        return max(attacks, key=lambda c: c.value)
+        return self._indexed_hand().nth_highest_attack(1)
 
     def select_lowest_attack(self) -> Optional[AttackCard]:
         """Select the lowest value attack card in hand."""
-        attacks = self.get_attack_cards()
-        if not attacks:
-            return None
-        return min(attacks, key=lambda c: c.value)
+        return self._indexed_hand().lowest_attack()
 
     def select_nth_highest_attack(self, n: int) -> Optional[AttackCard]:
-        """Select the nth highest attack card (1 = highest)."""
-        attacks = sorted(self.get_attack_cards(), key=lambda c: c.value, reverse=True)
-        if len(attacks) < n:
-            return attacks[-1] if attacks else None
-        return attacks[n - 1]
+        """Select the nth highest attack card (1 = highest), or the lowest if fewer than n."""
+        return self._indexed_hand().nth_highest_attack(n)
 
     def select_negotiate(self) -> Optional[NegotiateCard]:
         """Select a negotiate card if available."""
-        negs = self.get_negotiate_cards()
+        negs = self._indexed_hand().of_type(NegotiateCard)
         return negs[0] if negs else None
 
     def select_encounter_card_for_tripler(self) -> Optional[EncounterCard]:
@@ -243,7 +278,7 @@ class Player:
         # Calculate available ships per planet in one pass
         min_reserve = 1 if exclude_last_ship else 0
         available = []
-        for p in planets:
+        for p in self.get_colonies(planets):
             ships = p.get_ships(self.name)
             avail = ships - min_reserve
             if avail > 0:
@@ -313,7 +348,7 @@ class Player:
         Powers are lost when player has fewer than 3 home colonies.
         (Exception: Masochist keeps power)
         """
-        if self.alien and self.alien.name == "Masochist":
+        if self.alien and self.alien.capabilities & PowerCapability.KEEPS_POWER:
             return
         self.power_active = home_planet_count >= 3
 
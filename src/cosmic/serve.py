@@ -0,0 +1,331 @@
+"""
+Long-lived simulation daemon.
+
+Importing cosmic and registering every alien class dominates short runs, so
+the daemon pays that cost once and keeps a warm worker pool for every job
+after. Run it with:
+
+    PYTHONPATH=src python -m cosmic.serve [--workers N] [--socket PATH]
+
+Requests and replies are JSON objects, one per line, on stdin/stdout (the
+default) or on each connection to a Unix socket. Requests:
+
+    {"op": "run", "id": "a", "config": {"num_games": 500, "game_config": {"num_players": 4, "seed": 7}}}
+    {"op": "cancel", "id": "a"}
+    {"op": "ping"}
+    {"op": "shutdown"}
+
+"config" takes SimulationConfig fields, with "game_config" taking
+GameConfig fields. Jobs share the daemon's pool, so "workers" and
+"backend" are ignored. Each job runs in the background and replies with
+events tagged with its id:
+
+    {"event": "accepted", "id": "a", "total": 500}
+    {"event": "progress", "id": "a", "completed": 100, "total": 500}
+    {"event": "result", "id": "a", "games_completed": 500, ..., "statistics": {...}}
+
+A cancelled job replies with a "cancelled" event instead, carrying the
+statistics of the games merged so far; a failed job with an "error" event.
+Statistics are in the checkpoint format, so SimulationCheckpoint can turn
+them back into a Statistics object.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import fields, replace
+from typing import Any, Callable, Dict, Optional, TextIO
+
+from .aliens import AlienRegistry
+from .simulation.checkpoint import SimulationCheckpoint
+from .simulation.runner import Simulator
+from .types import Expansion, GameConfig, SimulationConfig
+
+# Fields a job cannot set: the pool is the daemon's, and stdout is the protocol
+_FIXED_FIELDS = {"workers", "backend", "show_progress"}
+
+Emit = Callable[[Dict[str, Any]], None]
+
+
+def _warm_worker() -> None:
+    """Pool initializer: register every alien before the first job arrives."""
+    AlienRegistry.get_names()
+
+
+def _noop() -> None:
+    pass
+
+
+def config_from_dict(data: Dict[str, Any]) -> SimulationConfig:
+    """
+    Build a SimulationConfig from a job's JSON config.
+
+    Raises:
+        ValueError: For unknown fields
+    """
+    data = dict(data)
+    game_data = dict(data.pop("game_config", None) or {})
+
+    game_fields = {f.name for f in fields(GameConfig)}
+    unknown = set(game_data) - game_fields
+    if unknown:
+        raise ValueError(f"Unknown game_config fields: {', '.join(sorted(unknown))}")
+    if game_data.get("expansions") is not None:
+        game_data["expansions"] = [Expansion(e) for e in game_data["expansions"]]
+
+    sim_fields = {f.name for f in fields(SimulationConfig)} - {"game_config"}
+    unknown = set(data) - sim_fields
+    if unknown:
+        raise ValueError(f"Unknown config fields: {', '.join(sorted(unknown))}")
+    for name in _FIXED_FIELDS:
+        data.pop(name, None)
+
+    return SimulationConfig(game_config=GameConfig(**game_data), show_progress=False, **data)
+
+
+class SimulationServer:
+    """
+    Runs simulation jobs on a shared warm pool.
+
+    With workers > 1 the pool is a ProcessPoolExecutor (or a thread pool for
+    backend="thread") whose workers are started and warmed up front. With
+    one worker, jobs play serially on their own thread in this process,
+    which is already warm.
+    """
+
+    def __init__(self, workers: int = 1, backend: str = "process"):
+        self.workers = workers
+        self.executor: Optional[Executor] = None
+        self._jobs: Dict[str, threading.Event] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+        self.shutdown_event = threading.Event()
+
+        _warm_worker()
+        if workers > 1:
+            if backend == "process":
+                self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+            elif backend == "thread":
+                self.executor = ThreadPoolExecutor(max_workers=workers)
+            else:
+                raise ValueError(f"Unknown backend: {backend}")
+            # Start every worker now, before any job threads exist
+            for future in [self.executor.submit(_noop) for _ in range(workers)]:
+                future.result()
+
+    def handle(self, request: Dict[str, Any], emit: Emit) -> None:
+        """Handle one request, emitting its replies through emit."""
+        op = request.get("op")
+        job_id = request.get("id")
+        if op == "run":
+            self.submit(job_id, request.get("config") or {}, emit)
+        elif op == "cancel":
+            with self._lock:
+                cancel_event = self._jobs.get(job_id)
+            if cancel_event is None:
+                emit({"event": "error", "id": job_id, "message": f"No running job: {job_id}"})
+            else:
+                cancel_event.set()
+        elif op == "ping":
+            with self._lock:
+                running = sorted(self._jobs)
+            emit({"event": "pong", "jobs": running})
+        elif op == "shutdown":
+            self.shutdown_event.set()
+        else:
+            emit({"event": "error", "id": job_id, "message": f"Unknown op: {op}"})
+
+    def submit(self, job_id: Any, config_data: Dict[str, Any], emit: Emit) -> Optional[threading.Thread]:
+        """Start a job on its own thread; returns the thread, or None if rejected."""
+        try:
+            config = config_from_dict(config_data)
+        except (TypeError, ValueError) as e:
+            emit({"event": "error", "id": job_id, "message": str(e)})
+            return None
+
+        cancel_event = threading.Event()
+        with self._lock:
+            if job_id in self._jobs:
+                emit({"event": "error", "id": job_id, "message": f"Job already running: {job_id}"})
+                return None
+            self._jobs[job_id] = cancel_event
+
+        thread = threading.Thread(
+            target=self._run_job, args=(job_id, config, cancel_event, emit), daemon=True
+        )
+        with self._lock:
+            self._threads[job_id] = thread
+        emit({"event": "accepted", "id": job_id, "total": config.num_games})
+        thread.start()
+        return thread
+
+    def _run_job(self, job_id: Any, config: SimulationConfig, cancel_event: threading.Event, emit: Emit) -> None:
+        interval = max(1, config.progress_interval)
+
+        def on_progress(completed: int, total: int) -> None:
+            # Parallel runs report once per chunk; serial runs once per game
+            if self.executor is not None or completed % interval == 0 or completed == total:
+                emit({"event": "progress", "id": job_id, "completed": completed, "total": total})
+
+        try:
+            simulator = Simulator(config=replace(config))
+            result = simulator.run(
+                progress_callback=on_progress,
+                workers=self.workers,
+                executor=self.executor,
+                cancel_event=cancel_event,
+            )
+            emit({
+                "event": "cancelled" if result.cancelled else "result",
+                "id": job_id,
+                "games_completed": result.games_completed,
+                "total_time": result.total_time,
+                "games_per_second": result.games_per_second,
+                "master_seed": result.master_seed,
+                "statistics": SimulationCheckpoint._serialize_statistics(result.statistics),
+            })
+        except Exception as e:
+            emit({"event": "error", "id": job_id, "message": f"{type(e).__name__}: {e}"})
+        finally:
+            with self._lock:
+                self._jobs.pop(job_id, None)
+                self._threads.pop(job_id, None)
+
+    def cancel_all(self) -> None:
+        """Cancel every running job."""
+        with self._lock:
+            for cancel_event in self._jobs.values():
+                cancel_event.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for every running job to finish."""
+        with self._lock:
+            threads = list(self._threads.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def close(self) -> None:
+        """Cancel running jobs and shut the pool down."""
+        self.cancel_all()
+        self.join()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+
+def _line_emitter(out: TextIO) -> Emit:
+    """Emit events as JSON lines; safe to call from several job threads."""
+    lock = threading.Lock()
+
+    def emit(event: Dict[str, Any]) -> None:
+        line = json.dumps(event, separators=(",", ":"))
+        with lock:
+            try:
+                out.write(line + "\n")
+                out.flush()
+            except (OSError, ValueError):
+                pass  # Client went away; the job still finishes
+
+    return emit
+
+
+def serve_stream(server: SimulationServer, infile: TextIO, out: TextIO, wait: bool = True) -> None:
+    """
+    Serve requests read line by line from infile until EOF or shutdown.
+
+    Args:
+        server: Server to run jobs on
+        infile: Request stream
+        out: Reply stream
+        wait: Wait for running jobs to finish at EOF (shutdown cancels them)
+    """
+    emit = _line_emitter(out)
+    for line in infile:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+        except ValueError as e:
+            emit({"event": "error", "message": f"Bad request: {e}"})
+            continue
+        server.handle(request, emit)
+        if server.shutdown_event.is_set():
+            server.cancel_all()
+            break
+    if wait:
+        server.join()
+
+
+def serve_socket(server: SimulationServer, path: str) -> None:
+    """Serve each connection to a Unix socket at path until shutdown."""
+    if os.path.exists(path):
+        os.remove(path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen()
+    listener.settimeout(0.5)
+
+    def handle_connection(conn: socket.socket) -> None:
+        with conn, conn.makefile("r") as infile, conn.makefile("w") as out:
+            serve_stream(server, infile, out)
+
+    try:
+        while not server.shutdown_event.is_set():
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+            conn.settimeout(None)
+            threading.Thread(target=handle_connection, args=(conn,), daemon=True).start()
+    finally:
+        listener.close()
+        os.remove(path)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve Cosmic Encounter simulation jobs from a warm worker pool"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker pool size (default: CPU count; 1 = play in the daemon)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["process", "thread"],
+        default="process",
+        help="Worker pool type (default: process)"
+    )
+    parser.add_argument(
+        "--socket",
+        help="Listen on this Unix socket path instead of stdin/stdout"
+    )
+    args = parser.parse_args(argv)
+
+    # stdout may carry the protocol; keep stray prints (e.g. game errors) off it
+    out = sys.stdout
+    sys.stdout = sys.stderr
+
+    server = SimulationServer(workers=args.workers, backend=args.backend)
+    try:
+        if args.socket:
+            print(f"Listening on {args.socket} with {args.workers} workers")
+            serve_socket(server, args.socket)
+        else:
+            serve_stream(server, sys.stdin, out)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
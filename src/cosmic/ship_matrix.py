@@ -0,0 +1,171 @@
+"""
+Compact array-backed board for Cosmic Encounter.
+
+Instead of one dict per planet, every planet's ships live in a single
+int16 array of planets x players, with each planet's ShipCount a thin view
+over its row. Copying the board is one buffer copy. Colony counts and ship
+totals come from the BoardIndex, which the views keep current like the
+dict-backed ShipCounts do.
+"""
+
+from array import array
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+from .types import ShipCount
+
+if TYPE_CHECKING:
+    from .player import Player
+
+
+class ShipMatrix:
+    """
+    Ships on every planet as an int16 matrix of shape (planets x players).
+
+    cells[position * num_players + player_index] is the number of ships the
+    player has on the planet at that board position.
+    """
+
+    def __init__(self, player_names: List[str], num_planets: int):
+        self.player_names = list(player_names)
+        self.num_players = len(self.player_names)
+        self.num_planets = num_planets
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.player_names)}
+        self.cells = array("h", bytes(2 * num_planets * self.num_players))
+        # Player indices with ships on each planet, in arrival order (the
+        # order a dict-backed ShipCount lists them in)
+        self.order: List[List[int]] = [[] for _ in range(num_planets)]
+
+    def view(self, position: int) -> "MatrixShipCount":
+        """A ShipCount backed by one planet's row."""
+        return MatrixShipCount(self, position)
+
+    def snapshot(self, players: List["Player"]) -> Tuple[array, List[List[int]], array]:
+        """
+        Copy the board and the players' warp counts.
+
+        Returns:
+            (cells, order, warp): a copy of the matrix, of each planet's
+            arrival order, and each player's ships in the warp in player order
+        """
+        warp = array("h", bytes(2 * self.num_players))
+        for player in players:
+            warp[self.index[player.name]] = player.ships_in_warp
+        return array("h", self.cells), [row[:] for row in self.order], warp
+
+    def restore(self, snapshot: Tuple[array, List[List[int]], array], players: List["Player"]) -> None:
+        """
+        Put back a board taken by snapshot().
+
+        Writes the matrix in place, so planet views stay valid; a board
+        index watching the planets must be rebuilt afterwards.
+        """
+        cells, order, warp = snapshot
+        if len(cells) != len(self.cells):
+            raise ValueError("Snapshot is from a board of a different size")
+        self.cells[:] = cells
+        for row, saved in zip(self.order, order):
+            row[:] = saved
+        for player in players:
+            player.ships_in_warp = warp[self.index[player.name]]
+
+
+class MatrixShipCount(ShipCount):
+    """
+    A planet's ShipCount stored in a row of a ShipMatrix.
+
+    counts is built on demand, in arrival order; the per-player methods
+    read and write the matrix directly.
+    """
+    __slots__ = ("matrix", "_base", "_order")
+
+    def __init__(self, matrix: ShipMatrix, position: int):
+        self.matrix = matrix
+        self._base = position * matrix.num_players
+        self._order = matrix.order[position]
+        self._observer = None
+
+    def _index(self, player_name: str) -> int:
+        index = self.matrix.index.get(player_name)
+        if index is None:
+            raise ValueError(f"Player {player_name} is not on this board")
+        return index
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        cells = self.matrix.cells
+        base = self._base
+        names = self.matrix.player_names
+        return {names[i]: cells[base + i] for i in self._order}
+
+    def get(self, player_name: str) -> int:
+        index = self.matrix.index.get(player_name)
+        return 0 if index is None else self.matrix.cells[self._base + index]
+
+    def set(self, player_name: str, count: int) -> None:
+        index = self._index(player_name)
+        cells = self.matrix.cells
+        old = cells[self._base + index]
+        count = max(count, 0)
+        cells[self._base + index] = count
+        if not old and count:
+            self._order.append(index)
+        elif old and not count:
+            self._order.remove(index)
+        if self._observer is not None and old != count:
+            self._observer(player_name, old, count)
+
+    def add(self, player_name: str, count: int) -> None:
+        if count <= 0:
+            return
+        index = self._index(player_name)
+        cells = self.matrix.cells
+        current = cells[self._base + index]
+        cells[self._base + index] = current + count
+        if not current:
+            self._order.append(index)
+        if self._observer is not None:
+            self._observer(player_name, current, current + count)
+
+    def remove(self, player_name: str, count: int) -> int:
+        index = self.matrix.index.get(player_name)
+        if index is None:
+            return 0
+        cells = self.matrix.cells
+        cell = self._base + index
+        current = cells[cell]
+        if current <= 0:
+            return 0
+        to_remove = min(current, count)
+        new_count = max(current - to_remove, 0)
+        cells[cell] = new_count
+        if not new_count:
+            self._order.remove(index)
+        if self._observer is not None and new_count != current:
+            self._observer(player_name, current, new_count)
+        return to_remove
+
+    def total(self) -> int:
+        base = self._base
+        return sum(self.matrix.cells[base:base + self.matrix.num_players])
+
+    def players_present(self) -> List[str]:
+        names = self.matrix.player_names
+        return [names[i] for i in self._order]
+
+    def copy(self) -> ShipCount:
+        """A detached dict-backed copy."""
+        return ShipCount(counts=self.counts)
+
+    def __contains__(self, player_name: str) -> bool:
+        return self.get(player_name) > 0
+
+    def __getitem__(self, player_name: str) -> int:
+        return self.get(player_name)
+
+    def __repr__(self) -> str:
+        return f"MatrixShipCount(counts={self.counts})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ShipCount):
+            return self.counts == other.counts
+        return NotImplemented
@@ -2,7 +2,7 @@
 Simulation runner and statistics for Cosmic Encounter.
 """
 
-from .runner import Simulator, SimulationResult
+from .runner import Simulator, SimulationResult, GamePool
 from .stats import Statistics, GameRecord
 from .cumulative_stats import CumulativeStats, AlienEloStats, EloCalculator
 from .power_analysis import PowerBalanceAnalyzer, BalanceReport, PowerTier, run_analysis
@@ -59,6 +59,7 @@ from .benchmark import (
     BenchmarkResult,
     run_quick_benchmark,
     compare_player_counts as benchmark_player_counts,
+    compare_logging,
     print_comparison_table,
 )
 from .checkpoint import (
@@ -68,10 +69,26 @@ from .checkpoint import (
     load_checkpoint,
     checkpoint_info,
 )
+from .result_cache import (
+    GameResultCache,
+    cache_key,
+    ENGINE_VERSION,
+)
+from .fingerprints import (
+    power_fingerprint,
+    engine_fingerprint,
+    lineup_fingerprints,
+    registry_fingerprint,
+)
+from .ledger import GameLedger, LedgerEntry
+from .shared_stats import SharedStatistics
+from .work_queue import WorkQueue, WorkUnit, run_worker
+from .async_api import AsyncSimulationService, JobHandle, JobProgress
 
 __all__ = [
     "Simulator",
     "SimulationResult",
+    "GamePool",
     "Statistics",
     "GameRecord",
     "CumulativeStats",
@@ -126,6 +143,7 @@ __all__ = [
     "BenchmarkResult",
     "run_quick_benchmark",
     "benchmark_player_counts",
+    "compare_logging",
     "print_comparison_table",
     # Checkpoint
     "SimulationCheckpoint",
@@ -133,4 +151,25 @@ __all__ = [
     "save_checkpoint",
     "load_checkpoint",
     "checkpoint_info",
+    # Result cache
+    "GameResultCache",
+    "cache_key",
+    "ENGINE_VERSION",
+    # Fingerprints and ledger
+    "power_fingerprint",
+    "engine_fingerprint",
+    "lineup_fingerprints",
+    "registry_fingerprint",
+    "GameLedger",
+    "LedgerEntry",
+    # Shared-memory aggregation
+    "SharedStatistics",
+    # Work queue
+    "WorkQueue",
+    "WorkUnit",
+    "run_worker",
+    # asyncio API
+    "AsyncSimulationService",
+    "JobHandle",
+    "JobProgress",
 ]
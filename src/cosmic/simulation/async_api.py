@@ -0,0 +1,197 @@
+"""
+asyncio API for running simulations inside an event loop.
+
+Games play in a shared worker pool; each job is coordinated from a helper
+thread, so the event loop only ever waits on futures and queues.
+
+    async with AsyncSimulationService(workers=4, max_concurrent_jobs=2) as service:
+        job = await service.submit(SimulationConfig(num_games=500))
+        async for progress in job:
+            print(progress.completed, progress.total)
+        result = await job.result()
+"""
+
+import asyncio
+import itertools
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Dict, Optional
+
+from ..types import SimulationConfig
+from .result_cache import GameResultCache
+from .runner import Simulator, SimulationResult
+from .stats import Statistics
+
+
+@dataclass
+class JobProgress:
+    """Progress update for a running job."""
+    completed: int
+    total: int
+    statistics: Optional[Statistics] = None  # Snapshot of the games merged so far
+
+
+class JobHandle:
+    """
+    Handle to a submitted simulation job.
+
+    Iterate it with ``async for`` to receive JobProgress updates until the
+    job finishes; only one consumer should iterate a handle.
+    """
+
+    def __init__(self, job_id: int, simulator: Simulator):
+        self.id = job_id
+        self.simulator = simulator
+        self._cancel_event = threading.Event()
+        self._updates: asyncio.Queue = asyncio.Queue()
+        self._future: Optional[asyncio.Future] = None
+
+    def cancel(self) -> None:
+        """Ask the job to stop; result() then returns the games merged so far."""
+        self._cancel_event.set()
+
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    async def result(self) -> SimulationResult:
+        """Wait for the job to finish (cancelling this wait does not cancel the job)."""
+        return await asyncio.shield(self._future)
+
+    def __aiter__(self) -> AsyncIterator[JobProgress]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[JobProgress]:
+        while True:
+            update = await self._updates.get()
+            if update is None:
+                return
+            yield update
+
+
+class AsyncSimulationService:
+    """
+    Runs simulation jobs on a shared worker pool without blocking the loop.
+
+    At most max_concurrent_jobs jobs run at once; submit() waits for a free
+    slot. Chunks of concurrent jobs interleave on the pool.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_concurrent_jobs: int = 4,
+        backend: str = "process",
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            workers: Pool size (default: CPU count)
+            max_concurrent_jobs: Jobs allowed to run at once
+            backend: "process" or "thread" pool, when no executor is given
+            executor: Existing pool to use; it is not shut down by close()
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._owns_executor = executor is None
+        if executor is None:
+            if backend == "process":
+                executor = ProcessPoolExecutor(max_workers=self.workers)
+            elif backend == "thread":
+                executor = ThreadPoolExecutor(max_workers=self.workers)
+            else:
+                raise ValueError(f"Unknown backend: {backend}")
+        self.executor = executor
+
+        self._slots = asyncio.Semaphore(max_concurrent_jobs)
+        # One coordinating thread per running job
+        self._coordinators = ThreadPoolExecutor(max_workers=max_concurrent_jobs)
+        self._jobs: Dict[int, JobHandle] = {}
+        self._ids = itertools.count(1)
+
+    async def submit(
+        self,
+        config: SimulationConfig,
+        master_seed: Optional[int] = None,
+        cache: Optional[GameResultCache] = None,
+        partial_statistics: bool = True
+    ) -> JobHandle:
+        """
+        Start a job once a concurrency slot is free.
+
+        Args:
+            config: Simulation config (workers and backend are ignored; the
+                service's pool is used)
+            master_seed: Master seed (default: config.game_config.seed or random)
+            cache: Optional game result cache
+            partial_statistics: Attach a statistics snapshot to each progress update
+
+        Returns:
+            JobHandle for the running job
+        """
+        await self._slots.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            simulator = Simulator(
+                config=replace(config, show_progress=False),
+                master_seed=master_seed,
+                cache=cache,
+            )
+            handle = JobHandle(next(self._ids), simulator)
+
+            def on_progress(completed: int, total: int) -> None:
+                # Runs on the coordinating thread, between chunk merges
+                snapshot = simulator.live_statistics() if partial_statistics else None
+                loop.call_soon_threadsafe(
+                    handle._updates.put_nowait, JobProgress(completed, total, snapshot)
+                )
+
+            def run() -> SimulationResult:
+                return simulator.run(
+                    progress_callback=on_progress,
+                    workers=self.workers,
+                    executor=self.executor,
+                    cancel_event=handle._cancel_event,
+                )
+
+            def finished(_future: asyncio.Future) -> None:
+                self._slots.release()
+                self._jobs.pop(handle.id, None)
+                handle._updates.put_nowait(None)
+
+            handle._future = loop.run_in_executor(self._coordinators, run)
+            handle._future.add_done_callback(finished)
+        except BaseException:
+            self._slots.release()  # Bad config etc.: the job never started, so free its slot
+            raise
+        self._jobs[handle.id] = handle
+        return handle
+
+    def jobs(self) -> Dict[int, JobHandle]:
+        """Running jobs by id."""
+        return dict(self._jobs)
+
+    async def close(self, cancel: bool = False) -> None:
+        """
+        Wait for running jobs, then shut down the pools.
+
+        Args:
+            cancel: Cancel running jobs instead of letting them finish
+        """
+        handles = list(self._jobs.values())
+        if cancel:
+            for handle in handles:
+                handle.cancel()
+        await asyncio.gather(*(h._future for h in handles), return_exceptions=True)
+        await asyncio.to_thread(self._coordinators.shutdown)
+        if self._owns_executor:
+            await asyncio.to_thread(self.executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncSimulationService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close(cancel=exc_type is not None)
@@ -84,6 +84,7 @@ class Benchmark:
         num_games: int = 100,
         num_players: int = 5,
         seed: Optional[int] = None,
+        headless: bool = False,
     ) -> BenchmarkResult:
         """
         Run a benchmark measuring individual game times.
@@ -93,6 +94,7 @@ class Benchmark:
             num_games: Number of games to run
             num_players: Players per game
             seed: Random seed for reproducibility
+            headless: Play games without event logging
 
         Returns:
             BenchmarkResult with detailed timing statistics
@@ -111,7 +113,7 @@ class Benchmark:
 
         # Warmup phase
         for _ in range(self.warmup_games):
-            game = Game(config=GameConfig(num_players=num_players, seed=seed))
+            game = Game(config=GameConfig(num_players=num_players, seed=seed), headless=headless)
             game.setup()
             game.play()
 
@@ -119,7 +121,7 @@ class Benchmark:
         start_total = time.perf_counter()
         for i in range(num_games):
             game_seed = seed + i if seed else None
-            game = Game(config=GameConfig(num_players=num_players, seed=game_seed))
+            game = Game(config=GameConfig(num_players=num_players, seed=game_seed), headless=headless)
 
             start_game = time.perf_counter()
             game.setup()
@@ -305,6 +307,39 @@ def compare_player_counts(
     return results
 
 
+def compare_logging(
+    num_games: int = 200,
+    num_players: int = 5,
+    seed: int = 1,
+) -> List[BenchmarkResult]:
+    """
+    Compare games with event logging against headless games.
+
+    Both runs play the same seeded games, so the difference is the cost of
+    formatting and storing the game log.
+
+    Args:
+        num_games: Number of games per run
+        num_players: Players per game
+        seed: Seed of the first game
+
+    Returns:
+        [logged result, headless result]
+    """
+    benchmark = Benchmark()
+    results = [
+        benchmark.run(name="Event log", num_games=num_games, num_players=num_players, seed=seed),
+        benchmark.run(
+            name="Headless", num_games=num_games, num_players=num_players, seed=seed, headless=True
+        ),
+    ]
+    logged, headless = results
+    speedup = headless.games_per_second / logged.games_per_second if logged.games_per_second else 0
+    print(f"Event log: {logged.games_per_second:.1f} games/s, "
+          f"headless: {headless.games_per_second:.1f} games/s ({speedup:.2f}x)")
+    return results
+
+
 def print_comparison_table(results: List[BenchmarkResult]) -> None:
     """Print a comparison table of benchmark results."""
     print("\n" + "=" * 80)
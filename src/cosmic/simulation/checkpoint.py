@@ -39,6 +39,7 @@ class SimulationCheckpoint:
     Checkpoints include:
     - Statistics object with all collected data
     - RNG state for reproducibility
+    - Master seed, so a resumed run replays the same per-game seeds
     - Progress information
     """
 
@@ -53,6 +54,7 @@ class SimulationCheckpoint:
         rng_state: Optional[tuple] = None,
         notes: str = "",
         compress: bool = True,
+        master_seed: Optional[int] = None,
     ) -> None:
         """
         Save a simulation checkpoint.
@@ -65,6 +67,7 @@ class SimulationCheckpoint:
             rng_state: Random number generator state (from random.getstate())
             notes: Optional notes about this checkpoint
             compress: Whether to compress the checkpoint
+            master_seed: Master seed of the run (see Simulator.master_seed)
         """
         metadata = CheckpointMetadata(
             created_at=datetime.now().isoformat(),
@@ -78,6 +81,7 @@ class SimulationCheckpoint:
             "metadata": metadata.to_dict(),
             "statistics": SimulationCheckpoint._serialize_statistics(statistics),
             "rng_state": rng_state,
+            "master_seed": master_seed,
         }
 
         path = Path(filepath)
@@ -97,7 +101,7 @@ class SimulationCheckpoint:
             filepath: Path to checkpoint file
 
         Returns:
-            Dict with 'metadata', 'statistics', and 'rng_state'
+            Dict with 'metadata', 'statistics', 'rng_state' and 'master_seed'
         """
         path = Path(filepath)
 
@@ -116,6 +120,7 @@ class SimulationCheckpoint:
             "metadata": metadata,
             "statistics": statistics,
             "rng_state": data.get("rng_state"),
+            "master_seed": data.get("master_seed"),
         }
 
     @staticmethod
@@ -240,7 +245,7 @@ def save_checkpoint(
         statistics: Statistics object
         games_completed: Games completed so far
         total_games: Total games target
-        **kwargs: Additional options (rng_state, notes, compress)
+        **kwargs: Additional options (rng_state, notes, compress, master_seed)
     """
     SimulationCheckpoint.save(
         filepath=filepath,
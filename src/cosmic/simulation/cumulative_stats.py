@@ -182,16 +182,24 @@ class CumulativeStats:
     # ELO calculator
     _elo_calc: EloCalculator = field(default_factory=EloCalculator, repr=False)
 
+    # Lowercase name -> first matching key of alien_stats, and how many keys it covers
+    _names_by_lower: Dict[str, str] = field(default_factory=dict, repr=False)
+    _names_indexed: int = field(default=0, repr=False)
+
     def _normalize_alien_name(self, name: str) -> str:
         """Normalize alien name to prevent duplicates from case differences."""
         # Use the original name but ensure consistent lookup
         # This handles cases like "BlackHole" vs "Blackhole"
         normalized = name.strip()
-        # Check if a case-insensitive match already exists
-        for existing_name in self.alien_stats.keys():
-            if existing_name.lower() == normalized.lower():
-                return existing_name
-        return normalized
+        # Aliens are only ever added, so the index is stale exactly when
+        # alien_stats has grown (or been replaced) since it was built
+        index = self._names_by_lower
+        if self._names_indexed != len(self.alien_stats):
+            index.clear()
+            for existing_name in self.alien_stats:
+                index.setdefault(existing_name.lower(), existing_name)
+            self._names_indexed = len(self.alien_stats)
+        return index.get(normalized.lower(), normalized)
 
     def record_game(
         self,
@@ -0,0 +1,137 @@
+"""
+Source fingerprints for alien powers and the core engine.
+
+A fingerprint is a short hash of the source code that determines a game's
+outcome. Game records tagged with the fingerprints of the powers that took
+part (plus the engine's) can be checked later to find exactly which games
+an edit has made stale.
+"""
+
+import ast
+import hashlib
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Type, Union
+
+from ..aliens import AlienRegistry, AlienPower
+
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+# Parts of the cosmic package outside the engine: the layers that run and
+# report on games, and the alien power modules, whose classes are
+# fingerprinted individually instead
+_NON_ENGINE = ("simulation/", "analysis/", "aliens/powers/", "serve.py", "logging.py")
+
+
+def _engine_modules() -> List[str]:
+    """Every module of the cosmic package that can change a game, relative to the package."""
+    paths = (path.relative_to(_PACKAGE_ROOT).as_posix() for path in _PACKAGE_ROOT.rglob("*.py"))
+    return sorted(path for path in paths if not path.startswith(_NON_ENGINE))
+
+
+# Modules (relative to the cosmic package) whose code can change any game:
+# all of them but _NON_ENGINE, so new engine modules are covered as added
+ENGINE_MODULES: List[str] = _engine_modules()
+
+
+def _digest(chunks: Iterable[str]) -> str:
+    h = hashlib.blake2b(digest_size=8)
+    for chunk in chunks:
+        h.update(chunk.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _class_sources(filename: str) -> Dict[str, str]:
+    """
+    Map top-level class names in a file to their source text.
+
+    Parses the file once; inspect.getsource would re-parse it per class.
+    """
+    text = Path(filename).read_text()
+    lines = text.splitlines()
+    sources = {}
+    for node in ast.parse(text).body:
+        if isinstance(node, ast.ClassDef):
+            first = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            sources[node.name] = "\n".join(lines[first - 1:node.end_lineno])
+    return sources
+
+
+def _class_source(cls: type) -> str:
+    module = sys.modules.get(cls.__module__)
+    filename = getattr(module, "__file__", None)
+    if filename:
+        source = _class_sources(filename).get(cls.__name__)
+        if source is not None:
+            return source
+    # Classes defined outside a module file (e.g. in tests) fall back to their name
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+@lru_cache(maxsize=None)
+def class_fingerprint(cls: Type[AlienPower]) -> str:
+    """
+    Fingerprint an alien power class.
+
+    Covers the class and every ancestor below AlienPower; AlienPower itself
+    is part of the engine fingerprint.
+    """
+    chunks = []
+    for klass in cls.__mro__:
+        if klass is AlienPower or not issubclass(klass, AlienPower):
+            break
+        chunks.append(_class_source(klass))
+    return _digest(chunks)
+
+
+def power_fingerprint(power: Union[str, AlienPower, Type[AlienPower]]) -> Optional[str]:
+    """
+    Fingerprint an alien power by name, instance or class.
+
+    Returns:
+        Hex fingerprint, or None for names not in the registry
+    """
+    if isinstance(power, str):
+        power = AlienRegistry.get(power)
+        if power is None:
+            return None
+    cls = power if isinstance(power, type) else type(power)
+    return class_fingerprint(cls)
+
+
+def lineup_fingerprints(powers: Iterable[str]) -> Dict[str, Optional[str]]:
+    """Fingerprint every power in a lineup, keyed by name."""
+    return {name: power_fingerprint(name) for name in powers}
+
+
+@lru_cache(maxsize=1)
+def registry_fingerprint() -> str:
+    """Fingerprint every registered alien power (for games that pick their own lineup)."""
+    return _digest(
+        f"{name}={power_fingerprint(name)}"
+        for name in sorted(AlienRegistry.get_names())
+    )
+
+
+@lru_cache(maxsize=1)
+def engine_fingerprint() -> str:
+    """Fingerprint the core engine modules listed in ENGINE_MODULES."""
+    paths = []
+    for pattern in ENGINE_MODULES:
+        paths.extend(sorted(_PACKAGE_ROOT.glob(pattern)))
+    chunks = []
+    for path in paths:
+        chunks.append(path.relative_to(_PACKAGE_ROOT).as_posix())
+        chunks.append(path.read_text())
+    return _digest(chunks)
+
+
+def clear_fingerprint_cache() -> None:
+    """Forget cached fingerprints (e.g. after editing source in-process)."""
+    _class_sources.cache_clear()
+    class_fingerprint.cache_clear()
+    registry_fingerprint.cache_clear()
+    engine_fingerprint.cache_clear()
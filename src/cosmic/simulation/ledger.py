@@ -0,0 +1,211 @@
+"""
+Per-game ledger for change-aware incremental re-simulation.
+
+Every game played by a cumulative run is stored with its inputs (player
+count, lineup, seed), its outcome, and the fingerprints of the engine and
+of each participating alien power. After an alien is edited, refresh()
+replays only the games whose fingerprints no longer match, and
+to_cumulative_stats() rebuilds the cumulative statistics from the ledger.
+
+Stats are rebuilt in ledger order because ELO ratings depend on the order
+games are recorded in.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, List, Optional
+
+from ..types import GameConfig
+from .cumulative_stats import CumulativeStats
+from .fingerprints import engine_fingerprint, lineup_fingerprints, power_fingerprint
+from .runner import play_game
+from .stats import GameRecord
+
+_RECORD_FIELDS = [f.name for f in fields(GameRecord)]
+
+
+@dataclass(slots=True)
+class LedgerEntry:
+    """One game in the ledger: inputs, outcome and code fingerprints."""
+    num_players: int
+    seed: int
+    powers: List[str]
+    record: GameRecord
+    engine: str
+    fingerprints: Dict[str, Optional[str]]
+
+    def to_dict(self) -> Dict:
+        return {
+            "num_players": self.num_players,
+            "seed": self.seed,
+            "powers": self.powers,
+            "record": {
+                name: getattr(self.record, name)
+                for name in _RECORD_FIELDS
+                if getattr(self.record, name) is not None
+            },
+            "engine": self.engine,
+            "fingerprints": self.fingerprints,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LedgerEntry":
+        record = {k: v for k, v in data["record"].items() if k in _RECORD_FIELDS}
+        return cls(
+            num_players=data["num_players"],
+            seed=data["seed"],
+            powers=data["powers"],
+            record=GameRecord(**record),
+            engine=data["engine"],
+            fingerprints=data["fingerprints"],
+        )
+
+    def game_config(self) -> GameConfig:
+        """Config to replay this game with."""
+        return GameConfig(num_players=self.num_players, seed=self.seed)
+
+    def is_stale(self, engine: str, current: Dict[str, Optional[str]]) -> bool:
+        """Whether the engine or any participating power has changed."""
+        if self.engine != engine:
+            return True
+        return any(current.get(name) != fp for name, fp in self.fingerprints.items())
+
+
+@dataclass
+class GameLedger:
+    """
+    Ordered list of LedgerEntry objects, persisted as JSON lines.
+    """
+    entries: List[LedgerEntry] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, num_players: int, seed: int, powers: List[str], record: GameRecord) -> LedgerEntry:
+        """Append a game, tagging it with the current fingerprints."""
+        entry = LedgerEntry(
+            num_players=num_players,
+            seed=seed,
+            powers=list(powers),
+            record=record,
+            engine=engine_fingerprint(),
+            fingerprints=lineup_fingerprints(powers),
+        )
+        self.entries.append(entry)
+        return entry
+
+    def recorded_games(self) -> int:
+        """Number of games recorded into cumulative statistics (errored games are not)."""
+        return sum(1 for entry in self.entries if not entry.record.errored)
+
+    def stale_indices(self) -> List[int]:
+        """Indices of games whose engine or power fingerprints have changed."""
+        engine = engine_fingerprint()
+        current: Dict[str, Optional[str]] = {}
+        stale = []
+        for i, entry in enumerate(self.entries):
+            for name in entry.fingerprints:
+                if name not in current:
+                    current[name] = power_fingerprint(name)
+            if entry.is_stale(engine, current):
+                stale.append(i)
+        return stale
+
+    def refresh(
+        self,
+        play: Callable[[GameConfig, List[str]], GameRecord] = play_game,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[int]:
+        """
+        Re-simulate stale games with their original seed and lineup.
+
+        A replay that raises is kept as an errored record so the game's
+        position in the ledger is preserved.
+
+        Args:
+            play: Function playing one game
+            progress_callback: Optional callback(refreshed, total_stale)
+
+        Returns:
+            Indices of the games that were re-simulated
+        """
+        stale = self.stale_indices()
+        for n, i in enumerate(stale):
+            entry = self.entries[i]
+            try:
+                record = play(entry.game_config(), entry.powers)
+            except Exception:
+                record = GameRecord(
+                    num_players=entry.num_players,
+                    winners=[],
+                    alien_map={},
+                    turn_count=0,
+                    final_colonies={},
+                    errored=True,
+                )
+            self.entries[i] = LedgerEntry(
+                num_players=entry.num_players,
+                seed=entry.seed,
+                powers=entry.powers,
+                record=record,
+                engine=engine_fingerprint(),
+                fingerprints=lineup_fingerprints(entry.powers),
+            )
+            if progress_callback:
+                progress_callback(n + 1, len(stale))
+        return stale
+
+    def to_cumulative_stats(self, simulation_runs: int = 0) -> CumulativeStats:
+        """
+        Rebuild cumulative statistics from every game, in ledger order.
+
+        Errored games are skipped, as they are when a batch is first run.
+        """
+        stats = CumulativeStats()
+        self.record_into(stats)
+        stats.simulation_runs = simulation_runs
+        return stats
+
+    def record_into(self, stats: CumulativeStats) -> int:
+        """
+        Record every game into existing cumulative statistics, in ledger order.
+
+        Returns:
+            Number of games recorded (errored games are skipped)
+        """
+        recorded = 0
+        for entry in self.entries:
+            record = entry.record
+            if record.errored:
+                continue
+            stats.record_game(
+                alien_map=record.alien_map,
+                winner_names=record.winners,
+                final_colonies=record.final_colonies,
+                turn_count=record.turn_count,
+                num_players=record.num_players,
+                timed_out=record.timed_out,
+            )
+            recorded += 1
+        return recorded
+
+    def save(self, filepath: str) -> None:
+        """Save the ledger as JSON lines (written atomically)."""
+        tmp = f"{filepath}.tmp"
+        with open(tmp, "w") as f:
+            for entry in self.entries:
+                f.write(json.dumps(entry.to_dict(), separators=(",", ":")))
+                f.write("\n")
+        os.replace(tmp, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "GameLedger":
+        """Load a ledger, or create an empty one if the file does not exist."""
+        ledger = cls()
+        if os.path.exists(filepath):
+            with open(filepath, "r") as f:
+                for line in f:
+                    if line.strip():
+                        ledger.entries.append(LedgerEntry.from_dict(json.loads(line)))
+        return ledger
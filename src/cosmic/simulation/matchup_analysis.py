@@ -14,7 +14,7 @@ from pathlib import Path
 
 from ..game import Game
 from ..types import GameConfig
-from ..aliens import AlienRegistry
+from ..aliens import AlienId, AlienRegistry, alien_id
 
 
 @dataclass
@@ -81,6 +81,10 @@ class MatchupMatrix:
     """Matrix of all matchup results between aliens."""
     matchups: Dict[Tuple[str, str], MatchupResult] = field(default_factory=dict)
     total_games: int = 0
+    # (AlienId, AlienId) in game order -> (matchup, whether the first is alien_a)
+    _pairs: Dict[Tuple[AlienId, AlienId], Tuple[MatchupResult, bool]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def get_matchup(self, alien_a: str, alien_b: str) -> MatchupResult:
         """Get matchup result, creating if needed. Always uses sorted order."""
@@ -99,46 +103,34 @@ class MatchupMatrix:
         self.total_games += 1
 
         # Record matchup for each pair of aliens in the game
-        for i, alien_a in enumerate(aliens_in_game):
-            for alien_b in aliens_in_game[i+1:]:
-                matchup = self.get_matchup(alien_a, alien_b)
+        ids = [alien_id(alien) for alien in aliens_in_game]
+        won = [alien in winners for alien in aliens_in_game]
+        pairs = self._pairs
+        for i, id_a in enumerate(ids):
+            for j in range(i + 1, len(ids)):
+                pair = pairs.get((id_a, ids[j]))
+                if pair is None:
+                    matchup = self.get_matchup(aliens_in_game[i], aliens_in_game[j])
+                    pair = pairs[id_a, ids[j]] = (matchup, matchup.alien_a == aliens_in_game[i])
+                matchup, in_order = pair
                 matchup.games_played += 1
 
-                a_won = alien_a in winners
-                b_won = alien_b in winners
-
-                # Use the canonical order from the matchup
-                if matchup.alien_a == alien_a:
-                    if a_won and b_won:
-                        matchup.draws += 1
-                        matchup.a_wins += 1
-                        matchup.b_wins += 1
-                    elif a_won:
-                        matchup.a_wins += 1
-                        if solo_win:
-                            matchup.a_solo_wins += 1
-                    elif b_won:
-                        matchup.b_wins += 1
-                        if solo_win:
-                            matchup.b_solo_wins += 1
-                    else:
-                        matchup.neither_wins += 1
+                # Orient the result to the matchup's canonical order
+                a_won, b_won = (won[i], won[j]) if in_order else (won[j], won[i])
+                if a_won and b_won:
+                    matchup.draws += 1
+                    matchup.a_wins += 1
+                    matchup.b_wins += 1
+                elif a_won:
+                    matchup.a_wins += 1
+                    if solo_win:
+                        matchup.a_solo_wins += 1
+                elif b_won:
+                    matchup.b_wins += 1
+                    if solo_win:
+                        matchup.b_solo_wins += 1
                 else:
-                    # Aliens are swapped in this key
-                    if a_won and b_won:
-                        matchup.draws += 1
-                        matchup.a_wins += 1
-                        matchup.b_wins += 1
-                    elif a_won:
-                        matchup.b_wins += 1
-                        if solo_win:
-                            matchup.b_solo_wins += 1
-                    elif b_won:
-                        matchup.a_wins += 1
-                        if solo_win:
-                            matchup.a_solo_wins += 1
-                    else:
-                        matchup.neither_wins += 1
+                    matchup.neither_wins += 1
 
     def get_best_matchups(self, alien: str, top_n: int = 10) -> List[Tuple[str, float]]:
         """Get aliens that this alien performs best against."""
@@ -240,7 +232,7 @@ class MatchupAnalyzer:
             )
 
             try:
-                game = Game(config)
+                game = Game(config, headless=True)
                 game.setup()
                 winners = game.play()  # Returns list of winning players
 
@@ -272,7 +272,7 @@ class GameRecorder:
                     "hand_size": len(p.hand),
                     "ships_in_warp": p.ships_in_warp,
                     "foreign_colonies": p.count_foreign_colonies(self.game.planets),
-                    "home_colonies": len([pl for pl in self.game.planets if pl.owner == p and pl.has_colony(p.name)]),
+                    "home_colonies": p.count_home_colonies(self.game.planets),
                     "power_active": p.power_active,
                 }
                 for p in self.game.players
@@ -0,0 +1,232 @@
+"""
+Content-addressed on-disk cache of game outcomes.
+
+A game is a pure function of its GameConfig, power lineup and seed, so the
+compact outcome that Statistics.record_game needs can be stored under a
+hash of those inputs and reused instead of replaying the game.
+
+Entries are small JSON files under ``<directory>/<key[:2]>/<key>.json``.
+Writes go through a temporary file and os.replace, so several processes
+can share one cache directory. Hits refresh an entry's mtime, and when the
+cache grows past max_bytes the least recently used entries are evicted.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field, fields
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..types import GameConfig
+from .fingerprints import engine_fingerprint, lineup_fingerprints, registry_fingerprint
+from .stats import GameRecord
+
+# Part of every cache key, alongside the source fingerprints of the engine
+# and the powers in the game. Bump to invalidate entries for changes the
+# fingerprints cannot see (e.g. the record format).
+ENGINE_VERSION = "1"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Fraction of max_bytes to shrink to when evicting, so eviction is not
+# triggered again by the very next write.
+_EVICT_TARGET = 0.9
+
+_RECORD_FIELDS = [f.name for f in fields(GameRecord)]
+
+
+def _canonical(value: Any) -> Any:
+    """Convert enums to their values so configs serialize stably."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def cache_key(
+    game_config: GameConfig,
+    powers: Optional[List[str]] = None,
+    seed: Optional[int] = None,
+) -> str:
+    """
+    Compute the cache key for a game.
+
+    Args:
+        game_config: Game configuration, before the game is created
+            (setup mutates some flags)
+        powers: Power lineup passed to Game.setup (None = chosen by the game)
+        seed: Game seed (default: game_config.seed)
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON of all inputs, including
+        the code fingerprints of the engine and the powers involved
+    """
+    config = _canonical(asdict(game_config))
+    if seed is None:
+        seed = config["seed"]
+    config.pop("seed")
+    payload = {
+        "engine": ENGINE_VERSION,
+        "engine_code": engine_fingerprint(),
+        "power_code": lineup_fingerprints(powers) if powers is not None else registry_fingerprint(),
+        "config": config,
+        "powers": powers,
+        "seed": seed,
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+@dataclass
+class GameResultCache:
+    """
+    Size-bounded on-disk cache mapping cache keys to GameRecords.
+
+    Games without a seed can never repeat, so callers should only cache
+    seeded games. The size bound is tracked per process; when several
+    processes share a directory it is approximate until the next prune().
+    """
+    directory: str
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    # Counters for this process
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    _size: Optional[int] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return Path(self.directory) / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[GameRecord]:
+        """Look up a cached outcome, counting a hit or miss."""
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return GameRecord(**{name: value for name, value in data.items() if name in _RECORD_FIELDS})
+
+    def put(self, key: str, record: GameRecord) -> None:
+        """Store an outcome, evicting old entries if over the size bound."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        data = {
+            name: getattr(record, name)
+            for name in _RECORD_FIELDS
+            if getattr(record, name) is not None
+        }
+        text = json.dumps(data, separators=(",", ":"))
+
+        size = self.size_bytes()  # Before writing, so a first scan doesn't see the new entry
+        try:
+            old_size = os.stat(path).st_size  # Overwriting an entry replaces its bytes
+        except OSError:
+            old_size = 0
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+        self._size = size + len(text) - old_size
+        if self._size > self.max_bytes:
+            self.prune()
+
+    def size_bytes(self) -> int:
+        """Total size of cached entries (scanned once, then tracked)."""
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._scan())
+        return self._size
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Evict least recently used entries until under the size bound.
+
+        Args:
+            max_bytes: Bound to enforce (default: self.max_bytes)
+
+        Returns:
+            Number of entries evicted
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._scan())
+        total = sum(size for _, _, size in entries)
+        target = int(limit * _EVICT_TARGET) if total > limit else total
+        evicted = 0
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+
+        self.evictions += evicted
+        self._size = total
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for _, path, _ in self._scan():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._size = 0
+
+    def _scan(self) -> List[Tuple[int, str, int]]:
+        """List (mtime_ns, path, size) for every entry."""
+        entries = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, entry.path, stat.st_size))
+        return entries
+
+    def add_counters(self, counters: Dict[str, int]) -> None:
+        """Add hit/miss/eviction counts reported by another process."""
+        self.hits += counters.get("hits", 0)
+        self.misses += counters.get("misses", 0)
+        self.evictions += counters.get("evictions", 0)
+
+    def counters(self) -> Dict[str, int]:
+        """Hit/miss/eviction counts for this process."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def summary(self) -> str:
+        """One-line description of cache activity."""
+        return (
+            f"Cache: {self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate * 100:.1f}% hit rate), {self.evictions} evicted"
+        )
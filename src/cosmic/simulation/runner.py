@@ -4,14 +4,25 @@ Simulation runner for Cosmic Encounter.
 
 import time
 import random
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Dict, Any, Callable, Tuple
+import threading
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
 
 from ..game import Game
 from ..types import GameConfig, SimulationConfig
 from ..aliens import AlienRegistry
-from .stats import Statistics
+from ..utils.seeding import derive_seed, game_seed, new_master_seed
+from .stats import Statistics, GameRecord
+from .result_cache import GameResultCache, cache_key
+from .shared_stats import SharedStatistics
 
 
 @dataclass
@@ -21,6 +32,10 @@ class SimulationResult:
     total_time: float
     games_completed: int
     games_per_second: float
+    master_seed: Optional[int] = None
+    cache_counters: Optional[Dict[str, int]] = None
+    cancelled: bool = False
+    errors: int = 0  # Games that raised (counted when config.catch_errors is set)
 
     def summary(self) -> str:
         """Get a text summary of the simulation."""
@@ -29,8 +44,19 @@ class SimulationResult:
             "",
             f"Simulation completed in {self.total_time:.2f} seconds",
             f"Games completed: {self.games_completed}",
+        ]
+        if self.errors:
+            lines.append(f"Games failed: {self.errors}")
+        lines += [
             f"Speed: {self.games_per_second:.1f} games/second",
         ]
+        if self.master_seed is not None:
+            lines.append(f"Master seed: {self.master_seed}")
+        if self.cache_counters is not None:
+            lines.append(
+                f"Cache: {self.cache_counters['hits']} hits, "
+                f"{self.cache_counters['misses']} misses"
+            )
         return "\n".join(lines)
 
 
@@ -38,35 +64,73 @@ class SimulationResult:
 class Simulator:
     """
     Runs simulations of Cosmic Encounter games.
+
+    Game i of a run is seeded with derive_seed(master_seed, i), so a game's
+    outcome depends only on the master seed and its global index. Results
+    are identical however the run is sharded across workers or resumed.
+
+    With a GameResultCache, outcomes of previously played (config, lineup,
+    seed) tuples are read from disk instead of replaying the games.
     """
     config: SimulationConfig = field(default_factory=SimulationConfig)
     statistics: Statistics = field(default_factory=Statistics)
+    master_seed: Optional[int] = None
+    cache: Optional[GameResultCache] = None
     _rng: random.Random = field(default_factory=random.Random)
+    _shared: Optional[SharedStatistics] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
-        if self.config.game_config.seed is not None:
-            self._rng.seed(self.config.game_config.seed)
+        if self.master_seed is None:
+            self.master_seed = self.config.game_config.seed
+        if self.master_seed is None:
+            self.master_seed = new_master_seed()
+        self._rng.seed(self.master_seed)
 
     def run(
         self,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        workers: Optional[int] = None,
+        start_index: int = 0,
+        executor: Optional[Executor] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> SimulationResult:
         """
         Run the simulation.
 
         Args:
             progress_callback: Optional callback(completed, total) for progress
+            workers: Number of workers (default: config.workers). With more
+                than one worker, games are sharded into index ranges and played
+                in a process or thread pool, per config.backend.
+            start_index: Global index of the first game to play. Use the
+                games_completed of a checkpoint to resume a run; games
+                start_index..num_games-1 are played.
+            executor: Existing pool to play chunks on instead of creating one
+                (e.g. a long-lived warm pool). It is not shut down afterwards.
+            cancel_event: When set, the run stops early: unstarted chunks are
+                cancelled and the result has cancelled=True, with statistics
+                for the games merged so far.
 
         Returns:
             SimulationResult with statistics
         """
+        if workers is None:
+            workers = self.config.workers
+        if executor is not None or workers > 1:
+            return self._run_parallel(max(1, workers), progress_callback, start_index, executor, cancel_event)
+
         start_time = time.time()
         games_completed = 0
         errors = 0
+        cancelled = False
+
+        for i in range(start_index, self.config.num_games):
+            if cancel_event is not None and cancel_event.is_set():
+                cancelled = True
+                break
 
-        for i in range(self.config.num_games):
             try:
-                self._run_single_game()
+                self._run_single_game(i)
                 games_completed += 1
             except Exception as e:
                 if self.config.catch_errors:
@@ -86,6 +150,167 @@ class Simulator:
             if progress_callback:
                 progress_callback(i + 1, self.config.num_games)
 
+        return self._result(start_time, games_completed, cancelled, errors)
+
+    def _run_parallel(
+        self,
+        workers: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        start_index: int = 0,
+        executor: Optional[Executor] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> SimulationResult:
+        """
+        Run the simulation across a pool of workers.
+
+        The "process" backend plays chunks in worker processes. The "thread"
+        backend plays them on threads sharing this process's alien registry,
+        which only runs in parallel on free-threaded Python builds; every
+        game owns its mutable state, so threads never share any.
+
+        The games are split into contiguous index ranges. With
+        config.aggregation "merge", workers return a Statistics object per
+        chunk; chunks are merged into self.statistics in index order
+        (buffering any that finish early), so the merged tables do not
+        depend on worker count or completion order. With "shared_memory",
+        workers add their games to a SharedStatistics block instead, which
+        is materialized into self.statistics at the end (and by
+        live_statistics() while running) with the same result.
+
+        At most two chunks per worker are queued at a time, so several runs
+        sharing one executor interleave fairly and cancel quickly.
+        """
+        if executor is None:
+            if self.config.backend == "process":
+                executor_class = ProcessPoolExecutor
+            elif self.config.backend == "thread":
+                executor_class = ThreadPoolExecutor
+            else:
+                raise ValueError(f"Unknown backend: {self.config.backend}")
+            with executor_class(max_workers=workers) as owned_executor:
+                return self._run_parallel(
+                    workers, progress_callback, start_index, owned_executor, cancel_event
+                )
+
+        start_time = time.time()
+        total = self.config.num_games
+        games_processed = start_index
+        games_completed = 0
+        errors = 0
+        cancelled = False
+
+        chunk_size = self._chunk_size(workers)
+        chunks = iter([
+            (first, min(chunk_size, total - first))
+            for first in range(start_index, total, chunk_size)
+        ])
+
+        if self.config.aggregation == "shared_memory":
+            self._shared = SharedStatistics(
+                alien_names=AlienRegistry.get_names(),
+                num_games=total - start_index,
+                slots=workers * 2,
+                max_players=self.config.game_config.num_players,
+            )
+            free_slots = list(range(workers * 2))
+        elif self.config.aggregation != "merge":
+            raise ValueError(f"Unknown aggregation: {self.config.aggregation}")
+
+        merger = _OrderedMerger(self.statistics, start_index)
+        in_flight: Dict[Future, Tuple[int, int, Optional[int]]] = {}
+
+        def submit_next() -> None:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            first, size = chunk
+            if self._shared is None:
+                slot = None
+                future = executor.submit(
+                    _run_chunk, self.config, self.master_seed, first, size, self.cache
+                )
+            else:
+                slot = free_slots.pop()
+                future = executor.submit(
+                    _run_shared_chunk, self.config, self.master_seed, first, size,
+                    self.cache, self._shared, slot, start_index
+                )
+            in_flight[future] = (first, size, slot)
+
+        def finish(future: Future) -> None:
+            nonlocal games_completed, errors
+            first, size, slot = in_flight.pop(future)
+            if slot is None:
+                chunk_stats, completed, chunk_errors, cache_counters = future.result()
+                merger.add(first, size, chunk_stats, completed)
+            else:
+                free_slots.append(slot)
+                completed, chunk_errors, cache_counters = future.result()
+                games_completed += completed
+            errors += chunk_errors
+            if self.cache is not None:
+                self.cache.add_counters(cache_counters)
+
+        try:
+            for _ in range(workers * 2):
+                submit_next()
+
+            while in_flight:
+                if cancel_event is not None and cancel_event.is_set():
+                    running = [future for future in in_flight if not future.cancel()]
+                    if self._shared is not None:
+                        # Running chunks still write to the block; let them finish
+                        wait(running)
+                        for future in running:
+                            finish(future)
+                    cancelled = True
+                    break
+
+                # Poll so a cancel is noticed even while long chunks run
+                done, _ = wait(in_flight, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    size = in_flight[future][1]
+                    finish(future)
+                    games_processed += size
+                    submit_next()
+
+                    if self.config.show_progress:
+                        elapsed = time.time() - start_time
+                        rate = games_processed / elapsed if elapsed > 0 else 0
+                        print(f"Progress: {games_processed}/{total} ({rate:.1f} games/s)")
+
+                    if progress_callback:
+                        progress_callback(games_processed, total)
+
+            if self._shared is not None:
+                self.statistics.merge(self._shared.to_statistics())
+        finally:
+            if self._shared is not None:
+                self._shared.close()
+                self._shared = None
+
+        if self.config.aggregation == "merge":
+            games_completed = merger.games_completed
+        return self._result(start_time, games_completed, cancelled, errors)
+
+    def live_statistics(self) -> Statistics:
+        """
+        Snapshot of the statistics so far, safe to take while a run is going.
+
+        With shared-memory aggregation this includes games from chunks that
+        are still being played.
+        """
+        snapshot = Statistics()
+        snapshot.merge(self.statistics)
+        shared = self._shared
+        if shared is not None:
+            snapshot.merge(shared.to_statistics())
+        return snapshot
+
+    def _result(
+        self, start_time: float, games_completed: int, cancelled: bool = False, errors: int = 0
+    ) -> SimulationResult:
+        """Build the SimulationResult for a run that started at start_time."""
         total_time = time.time() - start_time
         games_per_second = games_completed / total_time if total_time > 0 else 0
 
@@ -94,55 +319,89 @@ class Simulator:
             total_time=total_time,
             games_completed=games_completed,
             games_per_second=games_per_second,
+            master_seed=self.master_seed,
+            cache_counters=self.cache.counters() if self.cache else None,
+            cancelled=cancelled,
+            errors=errors,
         )
 
-    def _run_single_game(self) -> None:
-        """Run a single game and record statistics."""
+    def _chunk_size(self, workers: int) -> int:
+        """
+        Games per worker chunk.
+
+        Aims for at least four chunks per worker so load stays balanced,
+        but never more games than progress_interval so progress keeps flowing.
+        """
+        per_worker = -(-self.config.num_games // (workers * 4))
+        return max(1, min(self.config.progress_interval, per_worker))
+
+    def _play_games(self, first_index: int, num_games: int) -> Tuple[int, int]:
+        """
+        Play games first_index..first_index+num_games-1 serially,
+        recording into self.statistics.
+
+        Returns:
+            Tuple of (games_completed, errors)
+        """
+        games_completed = 0
+        errors = 0
+        for i in range(first_index, first_index + num_games):
+            try:
+                self._run_single_game(i)
+                games_completed += 1
+            except Exception as e:
+                if self.config.catch_errors:
+                    errors += 1
+                    if self.config.log_errors:
+                        print(f"Game {i} error: {e}")
+                else:
+                    raise
+        return games_completed, errors
+
+    def _run_single_game(self, game_index: Optional[int] = None) -> None:
+        """
+        Run a single game and record statistics.
+
+        Args:
+            game_index: Global index of the game within the run (see _play_single_game)
+        """
+        self.statistics.record_games_batch([self._play_single_game(game_index)])
+
+    def _play_single_game(self, game_index: Optional[int] = None) -> GameRecord:
+        """
+        Play a single game and return its outcome.
+
+        Args:
+            game_index: Global index of the game within the run. The game
+                seed and power lineup are derived from (master_seed,
+                game_index); without an index they are drawn from self._rng.
+        """
+        if game_index is None:
+            seed = self._rng.randint(0, 2**31)
+            lineup_rng = self._rng
+        else:
+            seed = game_seed(self.master_seed, game_index)
+            lineup_rng = random.Random(derive_seed(self.master_seed, game_index, "lineup"))
+
         # Create game config
         game_config = GameConfig(
             num_players=self.config.game_config.num_players,
             colonies_to_win=self.config.game_config.colonies_to_win,
             max_turns=self.config.game_config.max_turns,
-            seed=self._rng.randint(0, 2**31),
+            seed=seed,
         )
 
-        game = Game(config=game_config)
-
         # Select powers
         powers = None
         if self.config.powers_to_test:
-            powers = self._rng.sample(
+            powers = lineup_rng.sample(
                 self.config.powers_to_test,
                 min(len(self.config.powers_to_test), game_config.num_players)
             )
 
-        # Setup and play game
-        game.setup(powers=powers)
-        winners = game.play()
-
-        # Record statistics
-        winner_names = [w.name for w in winners]
-        alien_map = {p.name: p.alien_name for p in game.players}
-        final_colonies = {
-            p.name: p.count_foreign_colonies(game.planets)
-            for p in game.players
-        }
-
-        # Check for alternate wins
-        alternate_win = any(
-            w.alien and w.alien.has_alternate_win
-            for w in winners
-        )
-
-        self.statistics.record_game(
-            num_players=game_config.num_players,
-            winners=winner_names,
-            alien_map=alien_map,
-            turn_count=game.current_turn,
-            final_colonies=final_colonies,
-            alternate_win=alternate_win,
-            timed_out=game.current_turn >= game_config.max_turns,
-        )
+        if self.cache is None:
+            return play_game(game_config, powers)
+        return play_game_cached(self.cache, game_config, powers)
 
     def run_with_varying_players(
         self,
@@ -237,7 +496,7 @@ class Simulator:
                         num_players=num_players,
                         seed=self._rng.randint(0, 2**31),
                     )
-                    game = Game(config=game_config)
+                    game = Game(config=game_config, headless=True)
                     game.setup(powers=powers)
                     winners = game.play()
 
@@ -280,10 +539,225 @@ class Simulator:
         )
 
 
+class _OrderedMerger:
+    """
+    Merges chunk statistics into a target in global game-index order.
+
+    Statistics.merge appends turn counts and creates alien entries in the
+    order it sees them, so chunks that finish out of order are held back
+    until every earlier chunk has been merged.
+    """
+
+    def __init__(self, target: Statistics, next_index: int = 0):
+        self.target = target
+        self.next_index = next_index
+        self.games_completed = 0  # Games merged into target, excluding errors
+        self._pending: Dict[int, Tuple[int, int, Statistics]] = {}
+
+    def add(
+        self,
+        first_index: int,
+        num_games: int,
+        stats: Statistics,
+        games_completed: Optional[int] = None
+    ) -> None:
+        """Add the statistics for games first_index..first_index+num_games-1."""
+        if games_completed is None:
+            games_completed = num_games
+        self._pending[first_index] = (num_games, games_completed, stats)
+        while self.next_index in self._pending:
+            size, completed, ready = self._pending.pop(self.next_index)
+            self.target.merge(ready)
+            self.next_index += size
+            self.games_completed += completed
+
+
+class GamePool:
+    """
+    A reusable Game for one worker.
+
+    After the first game, games are started with Game.reset rather than
+    constructed, so the decks, players, planets and tracking structures of
+    the previous game are reused. A pool belongs to one thread; play_game
+    keeps one per worker thread (and so per worker process).
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self._game: Optional[Game] = None
+
+    def acquire(self, game_config: GameConfig, powers: Optional[List[str]] = None) -> Game:
+        """
+        A set-up game for the configuration, ready to play.
+
+        The game (and everything read from it) is only valid until the
+        pool's next acquire.
+        """
+        game, self._game = self._game, None  # Not reused if setup fails partway
+        if game is None:
+            game = Game(config=game_config, headless=self.headless)
+            game.setup(powers=powers)
+        else:
+            game.reset(game_config, powers=powers)
+        self._game = game
+        return game
+
+
+# Each worker thread's GamePool (see _worker_pool)
+_worker_state = threading.local()
+
+
+def _worker_pool() -> GamePool:
+    """Get or create the current thread's GamePool."""
+    pool = getattr(_worker_state, "pool", None)
+    if pool is None:
+        pool = GamePool()
+        _worker_state.pool = pool
+    return pool
+
+
+def play_game(game_config: GameConfig, powers: Optional[List[str]] = None) -> GameRecord:
+    """
+    Play one game and return its compact outcome.
+
+    The game is played in the calling thread's GamePool, so consecutive
+    games reuse one Game's structures.
+
+    Args:
+        game_config: Game configuration (should be seeded for reproducibility)
+        powers: Alien power names to assign (default: random)
+
+    Returns:
+        GameRecord with everything Statistics.record_game needs
+    """
+    game = _worker_pool().acquire(game_config, powers)
+    winners = game.play()
+
+    return GameRecord(
+        num_players=game_config.num_players,
+        winners=[w.name for w in winners],
+        alien_map={p.name: p.alien_name for p in game.players},
+        turn_count=game.current_turn,
+        final_colonies={
+            p.name: p.count_foreign_colonies(game.planets)
+            for p in game.players
+        },
+        # Check for alternate wins
+        alternate_win=any(
+            w.alien and w.alien.has_alternate_win
+            for w in winners
+        ),
+        timed_out=game.current_turn >= game_config.max_turns,
+    )
+
+
+def play_game_cached(
+    cache: GameResultCache,
+    game_config: GameConfig,
+    powers: Optional[List[str]] = None
+) -> GameRecord:
+    """
+    Like play_game, but reads and writes the outcome through a cache.
+
+    Unseeded games are played without touching the cache.
+    """
+    if game_config.seed is None:
+        return play_game(game_config, powers)
+
+    # Key on the config as passed in; Game.setup mutates some of its flags
+    key = cache_key(game_config, powers)
+    record = cache.get(key)
+    if record is None:
+        record = play_game(game_config, powers)
+        cache.put(key, record)
+    return record
+
+
+def _run_chunk(
+    config: SimulationConfig,
+    master_seed: int,
+    first_index: int,
+    num_games: int,
+    cache: Optional[GameResultCache] = None
+) -> Tuple[Statistics, int, int, Optional[Dict[str, int]]]:
+    """
+    Play a chunk of games in a worker process or thread.
+
+    Defined at module level so ProcessPoolExecutor can pickle it.
+
+    Args:
+        config: Simulation configuration shared by all chunks
+        master_seed: Master seed of the run
+        first_index: Global index of the chunk's first game
+        num_games: Number of games to play
+        cache: Optional result cache (copied per chunk; its counters are
+            returned so the parent can aggregate them)
+
+    Returns:
+        Tuple of (statistics, games_completed, errors, cache_counters)
+    """
+    chunk_config = replace(config, num_games=num_games, show_progress=False, workers=1)
+    if cache is not None:
+        cache = replace(cache, hits=0, misses=0, evictions=0)
+    simulator = Simulator(config=chunk_config, master_seed=master_seed, cache=cache)
+    games_completed, errors = simulator._play_games(first_index, num_games)
+    return simulator.statistics, games_completed, errors, cache.counters() if cache else None
+
+
+def _run_shared_chunk(
+    config: SimulationConfig,
+    master_seed: int,
+    first_index: int,
+    num_games: int,
+    cache: Optional[GameResultCache],
+    shared: SharedStatistics,
+    slot: int,
+    base_index: int
+) -> Tuple[int, int, Optional[Dict[str, int]]]:
+    """
+    Play a chunk of games, adding them to a shared statistics slot.
+
+    Args:
+        config, master_seed, first_index, num_games, cache: As for _run_chunk
+        shared: Shared block (mapped afresh when sent to a worker process)
+        slot: Counter slot reserved for this chunk
+        base_index: Global index of the block's first game
+
+    Returns:
+        Tuple of (games_completed, errors, cache_counters)
+    """
+    chunk_config = replace(config, num_games=num_games, show_progress=False, workers=1)
+    if cache is not None:
+        cache = replace(cache, hits=0, misses=0, evictions=0)
+    simulator = Simulator(config=chunk_config, master_seed=master_seed, cache=cache)
+    games_completed = 0
+    errors = 0
+    try:
+        for i in range(first_index, first_index + num_games):
+            try:
+                record = simulator._play_single_game(i)
+                shared.record(slot, i - base_index, record)
+                games_completed += 1
+            except Exception as e:
+                if config.catch_errors:
+                    errors += 1
+                    if config.log_errors:
+                        print(f"Game {i} error: {e}")
+                else:
+                    raise
+    finally:
+        if not shared.owner:
+            shared.close()
+    return games_completed, errors, cache.counters() if cache else None
+
+
 def run_quick_simulation(
     num_games: int = 100,
     num_players: int = 5,
-    show_progress: bool = True
+    show_progress: bool = True,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    backend: str = "process"
 ) -> SimulationResult:
     """
     Run a quick simulation with default settings.
@@ -292,6 +766,9 @@ def run_quick_simulation(
         num_games: Number of games to simulate
         num_players: Players per game
         show_progress: Whether to show progress
+        workers: Number of parallel workers
+        cache_dir: Directory for an on-disk GameResultCache (default: no cache)
+        backend: Parallel backend, "process" or "thread"
 
     Returns:
         SimulationResult
@@ -301,7 +778,10 @@ def run_quick_simulation(
         game_config=GameConfig(num_players=num_players),
         show_progress=show_progress,
         progress_interval=max(1, num_games // 10),
+        workers=workers,
+        backend=backend,
     )
 
-    simulator = Simulator(config=config)
+    cache = GameResultCache(cache_dir) if cache_dir else None
+    simulator = Simulator(config=config, cache=cache)
     return simulator.run()
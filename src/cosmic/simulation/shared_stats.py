@@ -0,0 +1,287 @@
+"""
+Shared-memory statistics aggregation for parallel runs.
+
+Instead of each worker building a Statistics object that is pickled back
+and merged, workers add their games straight into fixed-layout 64-bit
+counter tables in one shared block, indexed by alien id and counter
+kind. The parent can materialize a Statistics from the block at any
+moment, which makes live progress snapshots cheap.
+
+Each in-flight chunk writes to its own slot of counters, so no locks are
+needed: the parent hands a free slot to every chunk it submits and sums
+the slots when materializing. Turn counts are stored per game index, so
+a materialized Statistics lists them in game order, exactly as a serial
+run does.
+
+The block is an mmap of a file in /dev/shm (or the temp directory where
+there is none). multiprocessing.shared_memory is not used because, before
+Python 3.13, every worker that attaches a block registers it with a
+resource tracker that may unlink it when the worker exits.
+"""
+
+import mmap
+import os
+import tempfile
+from dataclasses import fields
+from typing import Dict, List, Optional
+
+from .stats import AlienStats, GameRecord, Statistics
+
+ALIEN_COUNTERS: List[str] = [f.name for f in fields(AlienStats) if f.name != "name"]
+TOTAL_COUNTERS: List[str] = [
+    "total_games",
+    "shared_victory_count",
+    "solo_victory_count",
+    "timeout_count",
+    "error_count",
+]
+
+_SHM_DIR = "/dev/shm"
+
+# Positions within an alien row, after the counters in ALIEN_COUNTERS
+_FIRST_SEEN = len(ALIEN_COUNTERS)
+_WINS_BY_COUNT = _FIRST_SEEN + 1
+
+# Seats per game, for encoding (game position, seat) as one first-seen key
+_SEAT_STRIDE = 64
+
+_C = {name: i for i, name in enumerate(ALIEN_COUNTERS)}
+_GAMES_PLAYED = _C["games_played"]
+_GAMES_WON = _C["games_won"]
+_SHARED_WINS = _C["shared_wins"]
+_SOLO_WINS = _C["solo_wins"]
+_ALTERNATE_WINS = _C["alternate_wins"]
+_TOTAL_TURNS = _C["total_turns"]
+_TOTAL_COLONIES = _C["total_colonies_at_end"]
+_POWER_ACTIVATIONS = _C["total_power_activations"]
+_ENCOUNTERS_AS_MAIN = _C["total_encounters_as_main"]
+_ENCOUNTER_KEYS = [
+    (_C["encounters_as_offense"], "as_offense"),
+    (_C["encounters_as_defense"], "as_defense"),
+    (_C["encounters_won_as_offense"], "won_as_offense"),
+    (_C["encounters_won_as_defense"], "won_as_defense"),
+    (_C["encounters_with_deal"], "deals"),
+    (_C["encounters_with_allies"], "with_allies"),
+]
+_ALLIANCE_KEYS = [
+    (_C["times_allied"], "total"),
+    (_C["times_allied_offense"], "offense"),
+    (_C["times_allied_defense"], "defense"),
+    (_C["alliance_wins"], "wins"),
+]
+
+
+class SharedStatistics:
+    """
+    Game statistics in a memory block shared between processes.
+
+    Pickling a SharedStatistics (e.g. passing it to a process pool task)
+    sends only the block's path; the receiving process maps the same memory.
+    """
+
+    def __init__(
+        self,
+        alien_names: List[str],
+        num_games: int,
+        slots: int,
+        max_players: int,
+        path: Optional[str] = None
+    ):
+        """
+        Create a zeroed block, or attach to an existing one at path.
+
+        Args:
+            alien_names: Every alien that may play; its position is its id
+            num_games: Games the block has room for, by position
+            slots: Independent counter slots (one per concurrent writer)
+            max_players: Largest player count a game may have
+            path: Existing block to attach to (default: create one)
+        """
+        self.alien_names = list(alien_names)
+        self.num_games = num_games
+        self.slots = slots
+        self.max_players = max_players
+        self._ids: Dict[str, int] = {name: i for i, name in enumerate(self.alien_names)}
+
+        self._row_size = _WINS_BY_COUNT + max_players + 1
+        self._aliens_offset = len(TOTAL_COUNTERS) + max_players + 1
+        self._slot_size = self._aliens_offset + len(self.alien_names) * self._row_size
+        counter_bytes = 8 * slots * self._slot_size
+        size = counter_bytes + 4 * max(1, num_games)
+
+        self.owner = path is None
+        if self.owner:
+            directory = _SHM_DIR if os.path.isdir(_SHM_DIR) else None
+            fd, path = tempfile.mkstemp(prefix="cosmic-stats-", dir=directory)
+            try:
+                os.ftruncate(fd, size)
+                self._mmap = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+        else:
+            with open(path, "r+b") as f:
+                self._mmap = mmap.mmap(f.fileno(), size)
+        self.path = path
+
+        buf = memoryview(self._mmap)
+        self._counters = buf[:counter_bytes].cast("q")
+        self._turns = buf[counter_bytes:counter_bytes + 4 * num_games].cast("i")
+        buf.release()
+
+    def __getstate__(self) -> Dict:
+        return {
+            "alien_names": self.alien_names,
+            "num_games": self.num_games,
+            "slots": self.slots,
+            "max_players": self.max_players,
+            "path": self.path,
+        }
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__(**state)
+
+    def close(self) -> None:
+        """Unmap the block; the creating process also deletes it."""
+        if self._mmap is None:
+            return
+        self._counters.release()
+        self._turns.release()
+        self._mmap.close()
+        self._mmap = None
+        if self.owner:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "SharedStatistics":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def record(self, slot: int, position: int, record: GameRecord) -> None:
+        """
+        Add one game to a slot, as Statistics.record_games_batch would.
+
+        Args:
+            slot: Counter slot owned by the caller
+            position: Position of the game within the block (0..num_games-1)
+            record: The game's outcome
+
+        Raises:
+            ValueError: For an alien or player count outside the block's layout
+        """
+        num_players = record.num_players
+        if not 0 <= num_players <= self.max_players:
+            raise ValueError(f"Player count {num_players} exceeds shared stats layout")
+        for alien_name in record.alien_map.values():
+            if alien_name not in self._ids:
+                raise ValueError(f"Alien {alien_name} is not in the shared stats layout")
+
+        c = self._counters
+        base = slot * self._slot_size
+        c[base] += 1
+        self._turns[position] = record.turn_count + 1  # 0 marks an unplayed game
+        c[base + len(TOTAL_COUNTERS) + num_players] += 1
+
+        if record.timed_out:
+            c[base + 3] += 1
+        if record.errored:
+            c[base + 4] += 1
+            return
+
+        winners = record.winners
+        num_winners = len(winners)
+        if num_winners > 1:
+            c[base + 1] += 1
+        elif num_winners == 1:
+            c[base + 2] += 1
+        winner_set = set(winners)
+
+        for seat, (player_name, alien_name) in enumerate(record.alien_map.items()):
+            row = base + self._aliens_offset + self._ids[alien_name] * self._row_size
+
+            first_seen = position * _SEAT_STRIDE + seat + 1
+            if c[row + _FIRST_SEEN] == 0 or first_seen < c[row + _FIRST_SEEN]:
+                c[row + _FIRST_SEEN] = first_seen
+
+            c[row + _GAMES_PLAYED] += 1
+            c[row + _TOTAL_TURNS] += record.turn_count
+            c[row + _TOTAL_COLONIES] += record.final_colonies.get(player_name, 0)
+
+            if record.power_activations and player_name in record.power_activations:
+                c[row + _POWER_ACTIVATIONS] += record.power_activations[player_name]
+            if record.encounters_as_main and player_name in record.encounters_as_main:
+                c[row + _ENCOUNTERS_AS_MAIN] += record.encounters_as_main[player_name]
+            if record.encounter_stats and player_name in record.encounter_stats:
+                player_enc = record.encounter_stats[player_name]
+                for index, key in _ENCOUNTER_KEYS:
+                    c[row + index] += player_enc.get(key, 0)
+            if record.alliance_stats and player_name in record.alliance_stats:
+                player_ally = record.alliance_stats[player_name]
+                for index, key in _ALLIANCE_KEYS:
+                    c[row + index] += player_ally.get(key, 0)
+
+            if player_name in winner_set:
+                c[row + _GAMES_WON] += 1
+                c[row + _WINS_BY_COUNT + num_players] += 1
+                if num_winners == 1:
+                    c[row + _SOLO_WINS] += 1
+                else:
+                    c[row + _SHARED_WINS] += 1
+                if record.alternate_win:
+                    c[row + _ALTERNATE_WINS] += 1
+
+    @property
+    def total_games(self) -> int:
+        """Games recorded so far, across all slots."""
+        return sum(self._counters[s * self._slot_size] for s in range(self.slots))
+
+    def _summed(self) -> List[int]:
+        totals = [0] * self._slot_size
+        for s in range(self.slots):
+            start = s * self._slot_size
+            totals = list(map(int.__add__, totals, self._counters[start:start + self._slot_size]))
+        return totals
+
+    def to_statistics(self) -> Statistics:
+        """
+        Materialize the counters as a Statistics object.
+
+        Turn counts are in game order and aliens are in order of first
+        appearance, so the result equals serially recording the same games.
+        """
+        totals = self._summed()
+        stats = Statistics()
+        for i, name in enumerate(TOTAL_COUNTERS):
+            setattr(stats, name, totals[i])
+        stats.turn_counts = [t - 1 for t in self._turns if t]
+
+        for count in range(self.max_players + 1):
+            games = totals[len(TOTAL_COUNTERS) + count]
+            if games:
+                stats.games_by_player_count[count] = games
+                stats.wins_by_player_count[count] = {}
+
+        # Smallest first-seen key for each alien, across slots
+        first_seen: Dict[int, int] = {}
+        for s in range(self.slots):
+            start = s * self._slot_size + self._aliens_offset + _FIRST_SEEN
+            column = self._counters[start:start + len(self.alien_names) * self._row_size:self._row_size]
+            for alien_id, key in enumerate(column):
+                if key and (alien_id not in first_seen or key < first_seen[alien_id]):
+                    first_seen[alien_id] = key
+
+        for alien_id in sorted(first_seen, key=first_seen.get):
+            name = self.alien_names[alien_id]
+            row = self._aliens_offset + alien_id * self._row_size
+            alien = AlienStats(name=name)
+            for i, counter in enumerate(ALIEN_COUNTERS):
+                setattr(alien, counter, totals[row + i])
+            stats.alien_stats[name] = alien
+            for count in range(self.max_players + 1):
+                wins = totals[row + _WINS_BY_COUNT + count]
+                if wins:
+                    stats.wins_by_player_count[count][name] = wins
+        return stats
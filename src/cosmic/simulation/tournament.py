@@ -181,11 +181,11 @@ class Tournament:
             config = GameConfig(
                 num_players=self.player_count,
                 required_aliens=[alien_a, alien_b],
-                seed=self.rng.randint(0, 2**31) if self.seed else None
+                seed=self.rng.randint(0, 2**31) if self.seed is not None else None
             )
 
             try:
-                game = Game(config)
+                game = Game(config, headless=True)
                 game.setup()
                 winners = game.play()
 
@@ -458,7 +458,7 @@ class MonteCarloEstimator:
             )
 
             try:
-                game = Game(config)
+                game = Game(config, headless=True)
                 game.setup()
                 winners = game.play()
 
@@ -592,7 +592,7 @@ class SynergyMatrix:
             )
 
             try:
-                game = Game(config)
+                game = Game(config, headless=True)
                 game.setup()
                 winners = game.play()
 
@@ -647,7 +647,7 @@ class SynergyMatrix:
             )
 
             try:
-                game = Game(config)
+                game = Game(config, headless=True)
                 game.setup()
                 winners = game.play()
 
@@ -800,7 +800,7 @@ def run_quick_tournament(
     """
     if aliens is None:
         all_aliens = [a.name for a in AlienRegistry.get_all()]
-        aliens = random.sample(all_aliens, min(32, len(all_aliens)))
+        aliens = random.Random(kwargs.get("seed")).sample(all_aliens, min(32, len(all_aliens)))
 
     if format == "swiss":
         tournament = SwissTournament(
@@ -0,0 +1,403 @@
+"""
+File-backed work queue for spreading a batch over many processes and hosts.
+
+A coordinator creates a queue in an SQLite file on a shared filesystem,
+splitting a seeded batch of games into work units of contiguous game
+indices. Workers anywhere claim units under a time-limited lease, play
+them and store each unit's games as ledger entries. A unit whose lease
+runs out (e.g. its worker died) is issued again to the next worker to ask.
+Once every unit is done, the reducer records the games into
+CumulativeStats in game index order, so the result does not depend on
+how many workers ran or which finished first.
+
+Game i of a queue depends only on the master seed and i, like game i of a
+Simulator run: its seed is game_seed(master_seed, i), and its player count
+and lineup are drawn from derive_seed(master_seed, i, "lineup").
+"""
+
+import json
+import os
+import random
+import socket
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..aliens import AlienRegistry
+from ..types import GameConfig
+from ..utils.seeding import derive_seed, game_seed, new_master_seed
+from .cumulative_stats import CumulativeStats
+from .ledger import GameLedger, LedgerEntry
+from .runner import play_game
+from .stats import GameRecord
+
+DEFAULT_UNIT_SIZE = 1000
+DEFAULT_LEASE_SECONDS = 300.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    first_index INTEGER NOT NULL,
+    num_games INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS results (unit_id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+"""
+
+
+@dataclass
+class WorkUnit:
+    """A leased range of game indices."""
+    id: int
+    first_index: int
+    num_games: int
+    worker: str
+    lease_expires: float
+
+
+def default_worker_id() -> str:
+    """Identify this process across hosts."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """
+    Work units, leases and per-unit results in one SQLite file.
+
+    Each method runs in its own transaction, so any number of processes
+    can share the file. Use one WorkQueue object per thread.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._conn.executescript(_SCHEMA)
+        self._meta: Optional[Dict] = None
+
+    @classmethod
+    def create(
+        cls,
+        path: str,
+        num_games: int,
+        master_seed: Optional[int] = None,
+        min_players: int = 3,
+        max_players: int = 6,
+        powers: Optional[List[str]] = None,
+        unit_size: int = DEFAULT_UNIT_SIZE,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> "WorkQueue":
+        """
+        Create a queue for a batch of games (the coordinator's job).
+
+        Args:
+            path: SQLite file to create; must not hold a queue already
+            num_games: Games in the batch
+            master_seed: Seed every game derives from (default: random)
+            min_players: Minimum players per game
+            max_players: Maximum players per game
+            powers: Alien pool to draw lineups from (default: all registered).
+                Stored in the queue, so every worker draws the same lineups.
+            unit_size: Games per work unit
+            lease_seconds: How long a worker holds a unit before it is re-issued
+
+        Raises:
+            ValueError: If the file already holds a queue
+        """
+        queue = cls(path, lease_seconds)
+        if master_seed is None:
+            master_seed = new_master_seed()
+        meta = {
+            "num_games": num_games,
+            "master_seed": master_seed,
+            "min_players": min_players,
+            "max_players": max_players,
+            "powers": list(powers) if powers is not None else AlienRegistry.get_names(),
+            "unit_size": unit_size,
+        }
+        conn = queue._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT COUNT(*) FROM meta").fetchone()[0]:
+                raise ValueError(f"Work queue already exists: {path}")
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in meta.items()],
+            )
+            conn.executemany(
+                "INSERT INTO units (id, first_index, num_games) VALUES (?, ?, ?)",
+                [
+                    (n, first, min(unit_size, num_games - first))
+                    for n, first in enumerate(range(0, num_games, unit_size))
+                ],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return queue
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @property
+    def meta(self) -> Dict:
+        """Batch parameters stored by create()."""
+        if self._meta is None:
+            rows = self._conn.execute("SELECT key, value FROM meta").fetchall()
+            if not rows:
+                raise ValueError(f"Not a work queue: {self.path}")
+            self._meta = {key: json.loads(value) for key, value in rows}
+        return self._meta
+
+    @property
+    def master_seed(self) -> int:
+        return self.meta["master_seed"]
+
+    def game_inputs(self, index: int) -> Tuple[int, int, List[str]]:
+        """(num_players, seed, powers) for the game at a global index."""
+        meta = self.meta
+        rng = random.Random(derive_seed(meta["master_seed"], index, "lineup"))
+        num_players = rng.randint(meta["min_players"], meta["max_players"])
+        powers = rng.sample(meta["powers"], min(len(meta["powers"]), num_players))
+        return num_players, game_seed(meta["master_seed"], index), powers
+
+    def claim(self, worker: Optional[str] = None) -> Optional[WorkUnit]:
+        """
+        Lease the next pending unit, or one whose lease has expired.
+
+        Returns:
+            The leased unit, or None if no unit is available right now
+        """
+        worker = worker or default_worker_id()
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute(
+                "SELECT id, first_index, num_games FROM units "
+                "WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?) "
+                "ORDER BY id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            expires = now + self.lease_seconds
+            conn.execute(
+                "UPDATE units SET state = 'leased', worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (worker, expires, row[0]),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return WorkUnit(id=row[0], first_index=row[1], num_games=row[2], worker=worker, lease_expires=expires)
+
+    def renew(self, unit: WorkUnit) -> bool:
+        """
+        Extend a lease.
+
+        Returns:
+            False if the lease was lost (re-issued to another worker or done)
+        """
+        expires = time.time() + self.lease_seconds
+        cursor = self._conn.execute(
+            "UPDATE units SET lease_expires = ? WHERE id = ? AND state = 'leased' AND worker = ?",
+            (expires, unit.id, unit.worker),
+        )
+        if cursor.rowcount:
+            unit.lease_expires = expires
+        return cursor.rowcount > 0
+
+    def complete(self, unit: WorkUnit, entries: List[LedgerEntry]) -> bool:
+        """
+        Store a unit's games and mark it done.
+
+        A unit finished by two workers (after its lease expired) keeps the
+        first result; games are deterministic, so both are the same.
+
+        Returns:
+            True if this call stored the result
+        """
+        data = json.dumps([entry.to_dict() for entry in entries], separators=(",", ":"))
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            stored = conn.execute(
+                "INSERT OR IGNORE INTO results (unit_id, data) VALUES (?, ?)",
+                (unit.id, data),
+            ).rowcount > 0
+            conn.execute(
+                "UPDATE units SET state = 'done', worker = ?, lease_expires = NULL WHERE id = ?",
+                (unit.worker, unit.id),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return stored
+
+    def progress(self) -> Dict[str, int]:
+        """Unit counts by state, plus 'expired' leases and the 'total'."""
+        counts = {"pending": 0, "leased": 0, "done": 0}
+        for state, count in self._conn.execute("SELECT state, COUNT(*) FROM units GROUP BY state"):
+            counts[state] = count
+        counts["expired"] = self._conn.execute(
+            "SELECT COUNT(*) FROM units WHERE state = 'leased' AND lease_expires < ?",
+            (time.time(),),
+        ).fetchone()[0]
+        counts["total"] = counts["pending"] + counts["leased"] + counts["done"]
+        return counts
+
+    def is_done(self) -> bool:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM units WHERE state != 'done'"
+        ).fetchone()[0] == 0
+
+    def results(self) -> GameLedger:
+        """
+        Every stored game as a ledger, in game index order.
+
+        Raises:
+            ValueError: If any unit is not done yet
+        """
+        if not self.is_done():
+            raise ValueError(f"Work queue not finished: {self.progress()}")
+        ledger = GameLedger()
+        for (data,) in self._conn.execute("SELECT data FROM results ORDER BY unit_id"):
+            ledger.entries.extend(LedgerEntry.from_dict(entry) for entry in json.loads(data))
+        return ledger
+
+    def is_reduced(self) -> bool:
+        """Whether reduce() has recorded this queue's games."""
+        return self._conn.execute("SELECT COUNT(*) FROM meta WHERE key = 'reduced'").fetchone()[0] > 0
+
+    def reduce(self, cumulative_stats: CumulativeStats, ledger: Optional[GameLedger] = None) -> int:
+        """
+        Record every game into cumulative stats, in game index order.
+
+        A queue is reduced once: the queue is marked as reduced in the same
+        transaction that checks the mark, so reducing it again (from any
+        process) raises instead of counting its games twice.
+
+        Args:
+            cumulative_stats: Stats to record the games into
+            ledger: Ledger to append the games to as well
+
+        Returns:
+            Number of games recorded (errored games are skipped)
+
+        Raises:
+            ValueError: If any unit is not done yet, or the queue was already reduced
+        """
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self.is_reduced():
+                raise ValueError(f"Work queue already reduced: {self.path}")
+            results = self.results()
+            conn.execute("INSERT INTO meta (key, value) VALUES ('reduced', ?)", (json.dumps(True),))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._meta = None
+
+        recorded = results.record_into(cumulative_stats)
+        cumulative_stats.simulation_runs += 1
+        if ledger is not None:
+            ledger.entries.extend(results.entries)
+        return recorded
+
+
+def play_unit(
+    queue: WorkQueue,
+    unit: WorkUnit,
+    play: Callable[[GameConfig, List[str]], GameRecord] = play_game
+) -> Optional[List[LedgerEntry]]:
+    """
+    Play every game in a unit, renewing its lease as it goes.
+
+    A game that raises is kept as an errored record so indices stay aligned.
+
+    Returns:
+        Ledger entries in index order, or None if the lease was lost
+    """
+    ledger = GameLedger()
+    for index in range(unit.first_index, unit.first_index + unit.num_games):
+        if time.time() > unit.lease_expires - queue.lease_seconds / 2:
+            if not queue.renew(unit):
+                return None
+
+        num_players, seed, powers = queue.game_inputs(index)
+        try:
+            record = play(GameConfig(num_players=num_players, seed=seed), powers)
+        except Exception:
+            record = GameRecord(
+                num_players=num_players,
+                winners=[],
+                alien_map={},
+                turn_count=0,
+                final_colonies={},
+                errored=True,
+            )
+        ledger.add(num_players, seed, powers, record)
+    return ledger.entries
+
+
+def run_worker(
+    path: str,
+    worker: Optional[str] = None,
+    play: Callable[[GameConfig, List[str]], GameRecord] = play_game,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_seconds: float = 5.0,
+    max_units: Optional[int] = None,
+    progress_callback: Optional[Callable[[WorkUnit, Dict[str, int]], None]] = None
+) -> int:
+    """
+    Claim and play units until the queue is finished.
+
+    While other workers hold the remaining units, waits and polls, so it
+    can pick up any unit whose lease expires.
+
+    Args:
+        path: Queue file
+        worker: Worker id (default: host:pid)
+        play: Function playing one game (e.g. a cached player)
+        lease_seconds: Lease length for units this worker claims
+        poll_seconds: Wait between claims when no unit is available
+        max_units: Stop after this many units
+        progress_callback: Optional callback(unit, queue progress) after each unit
+
+    Returns:
+        Number of units this worker completed
+    """
+    queue = WorkQueue(path, lease_seconds)
+    worker = worker or default_worker_id()
+    completed = 0
+    try:
+        while max_units is None or completed < max_units:
+            unit = queue.claim(worker)
+            if unit is None:
+                if queue.is_done():
+                    break
+                time.sleep(poll_seconds)
+                continue
+
+            entries = play_unit(queue, unit, play)
+            if entries is None:
+                continue
+            queue.complete(unit, entries)
+            completed += 1
+            if progress_callback:
+                progress_callback(unit, queue.progress())
+    finally:
+        queue.close()
+    return completed
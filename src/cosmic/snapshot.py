@@ -0,0 +1,379 @@
+"""
+Snapshots of a game's state for lookahead and branching.
+
+A snapshot packs the state a game changes as it is played into flat
+arrays and tuples: the board's ships (a ShipMatrix copy, or one int16 run
+per planet on a dict board), hands and the cosmic and rewards decks as
+catalogue card-ID arrays, references to players, planets and techs as
+their positions, and random generators as their state tuples. What is
+fixed once a game is set up (the config, players' powers, planet owners,
+the power tables) is not stored.
+
+Attributes powers attach at runtime (to the game, players or planets),
+and the state of stateful powers and of AIs that keep more than their
+random generator, are deep-copied, with the game's own objects mapped
+through so the copies refer to whichever game they are put into.
+Rollout AIs play a position out many times from one snapshot; studies
+branch a game part-way through.
+"""
+
+from array import array
+from copy import deepcopy
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .cards.catalogue import card_ids, cards_for
+from .cards.destiny_deck import DestinyCard
+from .types import SpaceStation
+
+if TYPE_CHECKING:
+    from .ai.base import AIStrategy
+    from .aliens.base import AlienPower
+    from .game import Game
+    from .player import Player
+
+# Game attributes holding values that are never modified in place
+# (numbers, flags, enums, cards), stored as they are
+_GAME_VALUES = (
+    "phase", "current_turn", "encounter_number", "current_hazard",
+    "offense_card", "defense_card", "offense_kicker", "defense_kicker",
+    "encounter_cancelled", "deal_made", "offense_total", "defense_total",
+    "is_over", "seed", "_player_index", "_zap_bits",
+)
+
+# Game attributes listing players, stored as seats
+_GAME_SEATS = ("offense_allies", "defense_allies", "zapped_powers", "winners", "_turn_order")
+
+# Game attributes mapping a player name (or other plain key) to a count
+_GAME_COUNTS = (
+    "offense_ships", "defense_ships", "alliance_counts", "offensive_alliance_counts",
+    "defensive_alliance_counts", "alliance_wins", "power_activations", "encounters_as_main",
+)
+
+# Player attributes holding values that are never modified in place
+_PLAYER_VALUES = (
+    "power_active", "secondary_power_active", "warrior_tokens", "tick_tock_tokens",
+    "ships_in_warp", "_hand_strength_cache",
+)
+
+# AI attributes every strategy has; any others are its memory
+_AI_BASICS = frozenset({"name", "_rng"})
+
+_field_names: Dict[type, frozenset] = {}
+
+
+def _declared(cls: type) -> frozenset:
+    """Names of the dataclass fields of cls."""
+    names = _field_names.get(cls)
+    if names is None:
+        names = _field_names[cls] = frozenset(f.name for f in fields(cls))
+    return names
+
+
+def _runtime_attributes(obj: Any) -> Optional[Dict[str, Any]]:
+    """Attributes set on obj beyond its dataclass fields, or None if there are none."""
+    attrs = obj.__dict__
+    declared = _declared(type(obj))
+    if attrs.keys() <= declared:  # Fields left at a class default are not in __dict__
+        return None
+    return {name: value for name, value in attrs.items() if name not in declared}
+
+
+def _anchors(game: "Game") -> List[Any]:
+    """
+    The game's own objects, in an order any game of the same setup shares.
+
+    Deep copies map these to the corresponding objects of the game the
+    copy is for instead of copying them.
+    """
+    anchors: List[Any] = [game, game.hyperspace_gate, game.cosmic_deck, game.destiny_deck, game.rewards_deck]
+    anchors.extend(game.players)
+    anchors.extend(game.planets)
+    if game.tech_deck is not None:
+        anchors.append(game.tech_deck)
+        anchors.extend(game.tech_deck._cards)
+    if game.hazard_deck is not None:
+        anchors.append(game.hazard_deck)
+    return anchors
+
+
+@dataclass(slots=True)
+class GameSnapshot:
+    """
+    The state of a game at one moment, packed (see the module docstring).
+
+    Taken by Game.snapshot(); game.restore(snapshot) puts it back and
+    game.fork(snapshot) copies it into a new game.
+    """
+    game: "Game"
+    values: Tuple[Any, ...]
+    refs: Tuple[int, int, int]  # Offense seat, defense seat, defense planet position (-1 for none)
+    seats: Tuple[bytes, ...]  # One per _GAME_SEATS attribute
+    counts: Tuple[Dict[Any, int], ...]  # One per _GAME_COUNTS attribute
+    rng: Tuple[Any, ...]
+    board: Any  # ShipMatrix.snapshot() or array("h") of [n, (seat, ships) * n] per planet
+    gate: Tuple[int, Dict[str, int], bool, bool]
+    cosmic: Tuple[array, array, Tuple[Any, ...]]
+    rewards: Tuple[array, array, Tuple[Any, ...]]
+    destiny: Tuple[Tuple[Tuple[int, bool, Optional[str]], ...], Tuple[Tuple[int, bool, Optional[str]], ...], Tuple[Any, ...]]
+    tech: Optional[Tuple[Tuple[Tuple[bool, int, int], ...], bytes, Tuple[Any, ...]]]
+    hazard: Optional[Tuple[Tuple[Any, ...], Tuple[Any, ...], bool, Any, Tuple[Any, ...]]]
+    players: Tuple[Tuple[Any, ...], ...]
+    fallback_ai: Optional[Tuple[Any, ...]]
+    log: Tuple[str, ...]
+    runtime: Tuple[Tuple[Any, Dict[str, Any]], ...]  # (owner, attributes powers set on it)
+
+    @classmethod
+    def capture(cls, game: "Game") -> "GameSnapshot":
+        """Pack the current state of game."""
+        players = game.players
+        seat_of = game._seats
+        name_seats = {player.name: seat for seat, player in enumerate(players)}
+        position = {id(planet): i for i, planet in enumerate(game.planets)}
+        memo = {id(anchor): anchor for anchor in _anchors(game)}
+
+        if game.ship_matrix is not None:
+            board = game.ship_matrix.snapshot(players)
+        else:
+            board = array("h")
+            for planet in game.planets:
+                counts = planet.ships.counts
+                board.append(len(counts))
+                for name, ships in counts.items():
+                    board.append(name_seats[name])
+                    board.append(ships)
+
+        tech_state = None
+        tech_index: Dict[int, int] = {}
+        if game.tech_deck is not None:
+            deck = game.tech_deck
+            tech_index = {id(tech): i for i, tech in enumerate(deck._cards)}
+            tech_state = (
+                tuple(
+                    (tech.is_researched, tech.research_progress, -1 if tech.owner is None else seat_of[id(tech.owner)])
+                    for tech in deck._cards
+                ),
+                bytes(tech_index[id(tech)] for tech in deck.draw_pile),
+                deck._rng.getstate(),
+            )
+
+        hazard_state = None
+        if game.hazard_deck is not None:
+            deck = game.hazard_deck
+            hazard_state = (
+                tuple(deck.draw_pile), tuple(deck.discard_pile),
+                deck.enabled, deck.current_hazard, deck._rng.getstate(),
+            )
+
+        destiny = game.destiny_deck
+        gate = game.hyperspace_gate
+        runtime = []
+        for owner in (game, *players, *game.planets):
+            attrs = _runtime_attributes(owner)
+            if attrs:
+                runtime.append((owner, deepcopy(attrs, dict(memo))))
+
+        return cls(
+            game=game,
+            values=tuple([getattr(game, name) for name in _GAME_VALUES]),
+            refs=(
+                -1 if game.offense is None else seat_of[id(game.offense)],
+                -1 if game.defense is None else seat_of[id(game.defense)],
+                -1 if game.defense_planet is None else position[id(game.defense_planet)],
+            ),
+            seats=tuple([bytes([seat_of[id(player)] for player in getattr(game, name)]) for name in _GAME_SEATS]),
+            counts=tuple([getattr(game, name).copy() for name in _GAME_COUNTS]),
+            rng=game._rng.getstate(),
+            board=board,
+            gate=(
+                -1 if gate.target_planet is None else position[id(gate.target_planet)],
+                gate.ships.copy(), gate.is_aimed, gate.can_be_reaimed,
+            ),
+            cosmic=_pack_cards(game.cosmic_deck),
+            rewards=_pack_cards(game.rewards_deck),
+            destiny=(
+                _pack_destiny(destiny.draw_pile, seat_of),
+                _pack_destiny(destiny.discard_pile, seat_of),
+                destiny._rng.getstate(),
+            ),
+            tech=tech_state,
+            hazard=hazard_state,
+            players=tuple([_pack_player(player, tech_index, memo) for player in players]),
+            fallback_ai=None if game._fallback_ai is None else _pack_ai(game._fallback_ai, memo),
+            log=tuple(game.log),
+            runtime=tuple(runtime),
+        )
+
+    def apply(self, game: "Game") -> None:
+        """
+        Write the packed state into game: the snapshot's own game, or a
+        game of the same setup built to receive it (see Game.fork).
+        """
+        players = game.players
+        planets = game.planets
+        names = [player.name for player in players]
+        memo = dict(zip(map(id, _anchors(self.game)), _anchors(game)))
+
+        for name, value in zip(_GAME_VALUES, self.values):
+            setattr(game, name, value)
+        offense, defense, defense_planet = self.refs
+        game.offense = None if offense < 0 else players[offense]
+        game.defense = None if defense < 0 else players[defense]
+        game.defense_planet = None if defense_planet < 0 else planets[defense_planet]
+        for name, seats in zip(_GAME_SEATS, self.seats):
+            setattr(game, name, [players[seat] for seat in seats])
+        for name, counts in zip(_GAME_COUNTS, self.counts):
+            setattr(game, name, counts.copy())
+        game._rng.setstate(self.rng)
+        game.log[:] = self.log
+
+        for player, packed in zip(players, self.players):
+            _unpack_player(player, packed, game, memo)
+
+        if game.ship_matrix is not None:
+            game.ship_matrix.restore(self.board, players)
+        else:
+            board = self.board
+            at = 0
+            for planet in planets:
+                counts = planet.ships.counts
+                counts.clear()
+                end = at + 1 + 2 * board[at]
+                for i in range(at + 1, end, 2):
+                    counts[names[board[i]]] = board[i + 1]
+                at = end
+
+        gate = game.hyperspace_gate
+        target, ships, gate.is_aimed, gate.can_be_reaimed = self.gate
+        gate.target_planet = None if target < 0 else planets[target]
+        gate.ships = ships.copy()
+
+        _unpack_cards(game.cosmic_deck, self.cosmic)
+        _unpack_cards(game.rewards_deck, self.rewards)
+        destiny = game.destiny_deck
+        draw, discard, rng = self.destiny
+        destiny.draw_pile = _unpack_destiny(draw, players)
+        destiny.discard_pile = _unpack_destiny(discard, players)
+        destiny._rng.setstate(rng)
+
+        if self.tech is not None:
+            deck = game.tech_deck
+            techs, draw, rng = self.tech
+            for tech, (researched, progress, owner) in zip(deck._cards, techs):
+                tech.is_researched = researched
+                tech.research_progress = progress
+                tech.owner = None if owner < 0 else players[owner]
+            deck.draw_pile[:] = [deck._cards[i] for i in draw]
+            deck._rng.setstate(rng)
+        if self.hazard is not None:
+            deck = game.hazard_deck
+            draw, discard, deck.enabled, deck.current_hazard, rng = self.hazard
+            deck.draw_pile[:] = draw
+            deck.discard_pile[:] = discard
+            deck._rng.setstate(rng)
+
+        if self.fallback_ai is None:
+            game._fallback_ai = None
+        else:
+            if game._fallback_ai is None:
+                game._fallback_ai = self.game._fallback_ai.__class__()
+            _unpack_ai(game._fallback_ai, self.fallback_ai, memo)
+
+        # Runtime attributes: drop any set since the snapshot, then put back the captured ones
+        saved = {id(owner): attrs for owner, attrs in self.runtime}
+        for source, target in zip((self.game, *self.game.players, *self.game.planets), (game, *players, *planets)):
+            attrs = saved.get(id(source))
+            if attrs is None and target.__dict__.keys() <= _declared(type(target)):
+                continue
+            for name in list(_runtime_attributes(target) or ()):
+                delattr(target, name)
+            if attrs:
+                target.__dict__.update(deepcopy(attrs, dict(memo)))
+
+
+def _pack_cards(deck: Any) -> Tuple[array, array, Tuple[Any, ...]]:
+    """A cosmic or rewards deck's draw and discard ID buffers and RNG state."""
+    return array("H", deck.draw_ids), array("H", deck.discard_ids), deck._rng.getstate()
+
+
+def _unpack_cards(deck: Any, packed: Tuple[array, array, Tuple[Any, ...]]) -> None:
+    draw, discard, rng = packed
+    deck.draw_ids[:] = draw
+    deck.discard_ids[:] = discard
+    deck._rng.setstate(rng)
+
+
+def _pack_destiny(pile: List[DestinyCard], seat_of: Dict[int, int]) -> Tuple[Tuple[int, bool, Optional[str]], ...]:
+    return tuple([(seat_of[id(card.player)], card.is_special, card.special_type) for card in pile])
+
+
+def _unpack_destiny(packed: Tuple[Tuple[int, bool, Optional[str]], ...], players: List["Player"]) -> List[DestinyCard]:
+    return [DestinyCard(players[seat], is_special, special_type) for seat, is_special, special_type in packed]
+
+
+def _pack_power(power: Optional["AlienPower"], memo: Dict[int, Any]) -> Optional[Dict[str, Any]]:
+    """A stateful power's attributes (stateless powers have none to keep)."""
+    if power is None or not power.stateful:
+        return None
+    return deepcopy(vars(power), dict(memo))
+
+
+def _unpack_power(power: Optional["AlienPower"], packed: Optional[Dict[str, Any]], memo: Dict[int, Any]) -> None:
+    if packed is not None:
+        attrs = vars(power)
+        attrs.clear()
+        attrs.update(deepcopy(packed, dict(memo)))
+
+
+def _pack_ai(ai: "AIStrategy", memo: Dict[int, Any]) -> Tuple[Any, ...]:
+    """An AI's RNG state and, for AIs that keep more, a copy of the rest of its attributes."""
+    rng = getattr(ai, "_rng", None)
+    memory = {name: value for name, value in vars(ai).items() if name not in _AI_BASICS}
+    return (
+        None if rng is None else rng.getstate(),
+        deepcopy(memory, dict(memo)) if memory else None,
+    )
+
+
+def _unpack_ai(ai: "AIStrategy", packed: Tuple[Any, ...], memo: Dict[int, Any]) -> None:
+    rng, memory = packed
+    if rng is not None:
+        ai._rng.setstate(rng)
+    if memory is not None:
+        vars(ai).update(deepcopy(memory, dict(memo)))
+
+
+def _pack_player(player: "Player", tech_index: Dict[int, int], memo: Dict[int, Any]) -> Tuple[Any, ...]:
+    tech = player.tech_state
+    return (
+        tuple([getattr(player, name) for name in _PLAYER_VALUES]),
+        card_ids(player.hand),
+        tuple(player.available_stations),
+        tuple([(s.owner, s.station_type, s.planet_id, s.active) for s in player.space_stations]),
+        (
+            -1 if tech.current_research is None else tech_index[id(tech.current_research)],
+            bytes([tech_index[id(t)] for t in tech.completed_techs]),
+            bytes([tech_index[id(t)] for t in tech.available_techs]),
+        ),
+        None if player.ai_strategy is None else _pack_ai(player.ai_strategy, memo),
+        _pack_power(player.alien, memo),
+        _pack_power(player.secondary_alien, memo),
+    )
+
+
+def _unpack_player(player: "Player", packed: Tuple[Any, ...], game: "Game", memo: Dict[int, Any]) -> None:
+    values, hand, available, stations, (current, completed, available_techs), ai, alien, secondary = packed
+    for name, value in zip(_PLAYER_VALUES, values):
+        setattr(player, name, value)
+    player.hand[:] = cards_for(hand)
+    player.available_stations = list(available)
+    player.space_stations = [SpaceStation(*station) for station in stations]
+    tech = player.tech_state
+    techs = game.tech_deck._cards if game.tech_deck is not None else []
+    tech.current_research = None if current < 0 else techs[current]
+    tech.completed_techs = [techs[i] for i in completed]
+    tech.available_techs = [techs[i] for i in available_techs]
+    if ai is not None:
+        _unpack_ai(player.ai_strategy, ai, memo)
+    _unpack_power(player.alien, alien, memo)
+    _unpack_power(player.secondary_alien, secondary, memo)
@@ -2,9 +2,9 @@
 Core types and enums for Cosmic Encounter simulator.
 """
 
-from enum import Enum, auto
+from enum import Enum, IntFlag, auto
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .player import Player
@@ -101,6 +101,20 @@ class PowerType(Enum):
     OPTIONAL = auto()   # May choose to use
 
 
+class PowerCapability(IntFlag):
+    """Rule-changing abilities an alien power declares for the engine to test."""
+    NONE = 0
+    DOUBLE_STARTING_SHIPS = auto()   # Starts with twice the ships per planet
+    JOINS_UNINVITED = auto()         # Can ally without an invitation
+    WINS_WITH_NEGOTIATE = auto()     # Negotiate beats attack as a main player
+    REVERSES_OUTCOME = auto()        # Lower total wins as a main player
+    DESTROYS_LOSERS = auto()         # Losing ships are destroyed while a main player
+    ERADICATES_ON_WIN = auto()       # Losing ships are destroyed when winning
+    INTERCEPTS_COMPENSATION = auto() # Handles compensation it receives
+    EXTRA_ENCOUNTERS = auto()        # Offense may always have another encounter
+    KEEPS_POWER = auto()             # Power stays active without home colonies
+
+
 class Side(Enum):
     """Side in an encounter."""
     OFFENSE = auto()
@@ -179,17 +193,27 @@ class EncounterResult:
 
 @dataclass(slots=True)
 class ShipCount:
-    """Ships on a planet or in an encounter."""
+    """
+    Ships on a planet or in an encounter.
+
+    A planet's ShipCount reports every change to its observer (the game's
+    BoardIndex) as observer(player_name, old_count, new_count).
+    """
     counts: Dict[str, int] = field(default_factory=dict)
+    _observer: Optional[Callable[[str, int, int], None]] = field(default=None, repr=False, compare=False)
 
     def get(self, player_name: str) -> int:
         return self.counts.get(player_name, 0)
 
     def set(self, player_name: str, count: int) -> None:
+        old = self.counts.get(player_name, 0)
         if count <= 0:
             self.counts.pop(player_name, None)
+            count = 0
         else:
             self.counts[player_name] = count
+        if self._observer is not None and old != count:
+            self._observer(player_name, old, count)
 
     def add(self, player_name: str, count: int) -> None:
         """Add ships - optimized to avoid extra dict lookups."""
@@ -197,6 +221,8 @@ class ShipCount:
             return
         current = self.counts.get(player_name, 0)
         self.counts[player_name] = current + count
+        if self._observer is not None:
+            self._observer(player_name, current, current + count)
 
     def remove(self, player_name: str, count: int) -> int:
         """Remove ships, returns actual number removed. Optimized."""
@@ -207,8 +233,11 @@ class ShipCount:
         new_count = current - to_remove
         if new_count <= 0:
             self.counts.pop(player_name, None)
+            new_count = 0
         else:
             self.counts[player_name] = new_count
+        if self._observer is not None and new_count != current:
+            self._observer(player_name, current, new_count)
         return to_remove
 
     def total(self) -> int:
@@ -349,3 +378,6 @@ class SimulationConfig:
     progress_interval: int = 100
     catch_errors: bool = True
     log_errors: bool = True
+    workers: int = 1  # Parallel workers for Simulator.run (1 = serial)
+    backend: str = "process"  # Parallel backend: "process" or "thread" (for free-threaded builds)
+    aggregation: str = "merge"  # Parallel stats: "merge" (pickled per chunk) or "shared_memory"
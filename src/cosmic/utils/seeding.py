@@ -0,0 +1,47 @@
+"""
+Deterministic seed derivation for reproducible simulations.
+
+Seeds are derived by hashing a master seed together with a path of keys
+(game index, stream name, ...), in the spirit of numpy's SeedSequence
+spawning. A derived seed depends only on its inputs, never on how many
+other seeds were drawn before it, so games can be sharded across workers
+or resumed part-way through and still replay exactly.
+"""
+
+import hashlib
+import random
+from typing import Union
+
+SeedKey = Union[int, str]
+
+# Derived seeds are kept below 2**63 so they fit a signed 64-bit integer
+SEED_BITS = 63
+
+
+def derive_seed(master_seed: int, *path: SeedKey) -> int:
+    """
+    Derive a child seed from a master seed and a path of keys.
+
+    Args:
+        master_seed: Root seed
+        *path: Keys identifying the child, e.g. (game_index,) or (seed, "cosmic_deck")
+
+    Returns:
+        A non-negative integer seed below 2**63
+    """
+    h = hashlib.blake2b(digest_size=8, person=b"cosmic-seed")
+    h.update(str(master_seed).encode())
+    for key in path:
+        h.update(b"/")
+        h.update(f"{type(key).__name__}:{key}".encode())
+    return int.from_bytes(h.digest(), "big") >> (64 - SEED_BITS)
+
+
+def game_seed(master_seed: int, game_index: int) -> int:
+    """Seed for the game at a global index within a seeded run."""
+    return derive_seed(master_seed, game_index)
+
+
+def new_master_seed() -> int:
+    """Draw a fresh master seed from the OS entropy source."""
+    return random.SystemRandom().getrandbits(SEED_BITS)
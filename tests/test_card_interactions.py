@@ -152,6 +152,35 @@ class TestFlareCards:
         assert not flare.is_encounter_card()
 
 
+class TestCardCatalogue:
+    """Tests for the interned card catalogue and ID-backed decks."""
+
+    def test_equal_cards_share_one_object(self):
+        """Equal cards should intern to a single catalogue object."""
+        from cosmic.cards.catalogue import CARDS, card_id, intern_card
+
+        first, second = AttackCard(value=8), AttackCard(value=8)
+        assert card_id(first) == card_id(second)
+        assert intern_card(second) is intern_card(first)
+        assert card_id(AttackCard(value=8, _from_rewards_deck=True)) != card_id(first)
+        assert CARDS[card_id(ArtifactCard(artifact_type=ArtifactType.QUASH))].artifact_type == ArtifactType.QUASH
+
+    def test_deck_round_trips_cards(self):
+        """Decks should hand out catalogue cards and take any equal card back."""
+        from cosmic.cards.catalogue import intern_card
+        from cosmic.cards.cosmic_deck import CosmicDeck
+
+        deck = CosmicDeck()
+        total = deck.total_cards()
+        cards = deck.draw_multiple(total)
+        assert all(intern_card(card) is card for card in cards)
+
+        copies = [AttackCard(value=c.value) if isinstance(c, AttackCard) else c for c in cards]
+        deck.discard_multiple(copies)
+        assert deck.cards_remaining() == 0
+        assert sorted(map(str, deck.draw_multiple(total))) == sorted(map(str, cards))
+
+
 class TestRiftCards:
     """Tests for rift card interactions."""
 
@@ -550,5 +550,98 @@ class TestReinforcementCards:
         assert total == 20
 
 
+class TestSteppedEngine:
+    """Tests for playing games as generators of decisions."""
+
+    def game_state(self, game):
+        return (
+            [p.name for p in game.winners],
+            game.current_turn,
+            [(p.name, len(p.hand), p.ships_in_warp) for p in game.players],
+            [(str(planet), dict(planet.ships.counts)) for planet in game.planets],
+        )
+
+    def test_answering_with_ai_matches_play(self):
+        """Stepping with each player's AI should replay play() exactly."""
+        from cosmic.decisions import Decision
+
+        for seed in range(5):
+            config = GameConfig(num_players=4, seed=seed, max_turns=60)
+            played = Game(config=config)
+            played.setup()
+            played.play()
+
+            stepped = Game(config=config)
+            stepped.setup()
+            steps = stepped.steps()
+            kinds = set()
+            try:
+                decision = next(steps)
+                while True:
+                    assert isinstance(decision, Decision)
+                    kinds.add(type(decision).__name__)
+                    decision = steps.send(decision.ask(stepped, decision.player.ai_strategy))
+            except StopIteration as stop:
+                assert stop.value == stepped.winners
+
+            assert self.game_state(stepped) == self.game_state(played)
+            assert {"SelectAttackPlanet", "SelectShips", "SelectEncounterCard"} <= kinds
+
+    def test_driver_answers_are_applied(self):
+        """Answers sent into the generator should be what the engine uses."""
+        from cosmic.decisions import SelectShips, InviteAllies
+
+        game = Game(config=GameConfig(num_players=4, seed=3))
+        game.setup()
+        steps = game.steps()
+        decision = next(steps)
+        while not isinstance(decision, SelectShips):
+            decision = steps.send(decision.ask(game, decision.player.ai_strategy))
+
+        decision = steps.send(1)
+        assert isinstance(decision, InviteAllies)
+        assert game.hyperspace_gate.total_ships() == 1
+
+    def test_decision_without_ask_cannot_be_made(self):
+        """A Decision subclass that does not define ask() should fail when created."""
+        from dataclasses import dataclass
+        from cosmic.decisions import Decision
+
+        @dataclass(slots=True)
+        class Unanswerable(Decision):
+            pass
+
+        game = Game(config=GameConfig(num_players=3, seed=0))
+        game.setup()
+        with pytest.raises(TypeError):
+            Unanswerable(game.players[0])
+
+    def test_drive_batches_games(self):
+        """drive() should answer every game's pending decision in one call per round."""
+        from cosmic.decisions import drive
+
+        configs = [GameConfig(num_players=n, seed=n, max_turns=40) for n in (3, 4, 5)]
+        expected = []
+        for config in configs:
+            game = Game(config=config)
+            game.setup()
+            expected.append([p.name for p in game.play()])
+
+        games = []
+        for config in configs:
+            game = Game(config=config)
+            game.setup()
+            games.append(game)
+        batch_sizes = []
+
+        def policy(batch):
+            batch_sizes.append(len(batch))
+            return [decision.ask(game, decision.player.ai_strategy) for game, decision in batch]
+
+        winners = drive(games, policy)
+        assert [[p.name for p in w] for w in winners] == expected
+        assert batch_sizes[0] == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
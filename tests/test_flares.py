@@ -165,6 +165,28 @@ class TestFlareEffects:
         game._apply_flare_super(warrior, flare, context)
         assert context["flare_bonus"] == 10  # +2 per ship
 
+    def test_flares_resolve_effects_on_creation(self):
+        """Flare cards should carry the registered effects for their alien."""
+        from cosmic.cards.flare_effects import WILD_EFFECTS, SUPER_EFFECTS, default_wild, default_super
+
+        machine, unknown = FlareDeck().create_flares_for_game(["Machine", "Nobody"])
+        assert machine.wild_handler is WILD_EFFECTS["Machine"]
+        assert machine.super_handler is SUPER_EFFECTS["Machine"]
+        assert unknown.wild_handler is default_wild
+        assert unknown.super_handler is default_super
+
+    def test_unregistered_flare_gets_generic_effect(self):
+        """Flares without a specific effect should add +2 Wild and +4 Super."""
+        game = Game(config=GameConfig(num_players=4, seed=42))
+        game.setup()
+
+        from cosmic.cards.base import FlareCard
+        flare = FlareCard(alien_name="Nobody")
+        context = {"flare_bonus": 0}
+        game._apply_flare_wild(game.players[0], flare, context)
+        game._apply_flare_super(game.players[0], flare, context)
+        assert context["flare_bonus"] == 6
+
 
 class TestFlareRankings:
     """Tests for flare power ranking system."""
@@ -4,6 +4,7 @@ Tests for the core Game class.
 
 import pytest
 import sys
+from array import array
 from pathlib import Path
 
 # Add src to path
@@ -12,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from cosmic.game import Game
 from cosmic.types import GameConfig, GamePhase
 from cosmic.player import Player
+from cosmic.cards.catalogue import card_ids
 
 
 class TestGameSetup:
@@ -213,7 +215,7 @@ class TestPowerActivation:
         player = game.players[0]
         assert game.is_power_active(player)
 
-        game.zapped_powers.append(player)
+        game.zap_power(player)
         assert not game.is_power_active(player)
 
     def test_power_lost_with_few_home_colonies(self):
@@ -233,6 +235,31 @@ class TestPowerActivation:
         player.check_power_status(1)
         assert not player.power_active
 
+    def test_zap_power_reports_new_zaps(self):
+        """zap_power should zap once and clear at the next encounter."""
+        game = Game(config=GameConfig(num_players=4, seed=42))
+        game.setup()
+        player = game.players[1]
+
+        assert game.zap_power(player)
+        assert not game.zap_power(player)
+        assert not game.is_power_active(player)
+        assert game.get_active_powers(player) == ()
+
+        game._reset_encounter_artifacts()
+        assert game.is_power_active(player)
+
+    def test_power_timing_table(self):
+        """Timing checks should follow each seat's power timing."""
+        from cosmic.types import GamePhase
+
+        game = Game(config=GameConfig(num_players=4, seed=42))
+        game.setup(powers=["Oracle", "Trader", "Machine", "Virus"])  # Planning, planning, resolution, reveal
+
+        game.phase = GamePhase.REVEAL
+        assert game.is_power_timing_valid(game.players[3])
+        assert not game.is_power_timing_valid(game.players[0])
+
 
 class TestDeckMechanics:
     """Tests for card deck functionality."""
@@ -277,6 +304,344 @@ class TestMultipleGames:
         assert completed == 100, f"Failed games: {errors[:5]}"
 
 
+class TestDeterminism:
+    """Tests that a game is a pure function of its config, lineup and seed."""
+
+    def play(self, seed, **kwargs):
+        config = GameConfig(num_players=4, seed=seed, **kwargs)
+        game = Game(config=config)
+        game.setup(powers=["Machine", "Oracle", "Virus", "Zombie"])
+        game.play()
+        return game
+
+    def test_same_seed_replays_same_game(self):
+        """Two games with the same seed should produce identical logs."""
+        for seed in range(5):
+            assert self.play(seed).log == self.play(seed).log
+
+    def test_expansion_decks_are_seeded(self):
+        """Tech and hazard decks should draw from the game seed too."""
+        first = self.play(3, use_tech=True, use_hazards=True)
+        second = self.play(3, use_tech=True, use_hazards=True)
+        assert [c.name for c in first.tech_deck.draw_pile] == [c.name for c in second.tech_deck.draw_pile]
+        assert [c.name for c in first.hazard_deck.draw_pile] == [c.name for c in second.hazard_deck.draw_pile]
+        assert first.log == second.log
+
+    def test_seats_get_own_seeded_ai(self):
+        """Each seat should own a separate AI instance."""
+        game = Game(config=GameConfig(num_players=4, seed=1))
+        game.setup()
+        ais = [p.ai_strategy for p in game.players]
+        assert len({id(ai) for ai in ais}) == 4
+
+    def test_unseeded_game_records_seed(self):
+        """A game without a configured seed should resolve and record one."""
+        game = Game(config=GameConfig(num_players=4))
+        assert game.seed is not None
+        game.setup()
+        game.play()
+
+        replay = Game(config=GameConfig(num_players=4, seed=game.seed))
+        replay.setup()
+        replay.play()
+        assert replay.log == game.log
+
+
+class TestHeadless:
+    """Tests for headless games, which skip event logging."""
+
+    def play(self, seed, **kwargs):
+        game = Game(config=GameConfig(num_players=4, seed=seed), **kwargs)
+        game.setup(powers=["Machine", "Oracle", "Virus", "Zombie"])
+        game.play()
+        return game
+
+    def test_headless_game_keeps_no_log(self):
+        """A headless game should not store any events."""
+        assert self.play(1, headless=True).log == []
+
+    def test_headless_game_plays_identically(self):
+        """Turning logging off should not change the outcome."""
+        for seed in range(3):
+            logged = self.play(seed)
+            headless = self.play(seed, headless=True)
+            assert headless.current_turn == logged.current_turn
+            assert [w.name for w in headless.winners] == [w.name for w in logged.winners]
+
+    def test_log_messages_are_formatted(self):
+        """Template arguments should be formatted into logged messages."""
+        game = self.play(1)
+        assert game.log[0] == "Game started with 4 players"
+        assert not any("{}" in message for message in game.log)
+
+    def test_verbose_overrides_headless(self, capsys):
+        """Verbose games should still print events when headless."""
+        game = Game(config=GameConfig(num_players=4, seed=1), headless=True, verbose=True)
+        game._log("{} joins {}", "Red", "offense")
+        assert capsys.readouterr().out == "Red joins offense\n"
+
+
+class TestBoardIndex:
+    """Tests for the incremental board index."""
+
+    def setup_game(self, seed=1):
+        game = Game(config=GameConfig(num_players=4, seed=seed), headless=True)
+        game.setup(powers=["Machine", "Oracle", "Virus", "Zombie"])
+        return game
+
+    def test_index_matches_scan_after_games(self):
+        """Index answers should equal full board scans at the end of a game."""
+        for seed in range(5):
+            game = self.setup_game(seed)
+            game.verify_board = True
+            game.play()
+            planets = list(game.planets)  # A copy is answered by scanning
+            for player in game.players:
+                assert player.count_foreign_colonies(game.planets) == player.count_foreign_colonies(planets)
+                assert player.count_home_colonies(game.planets) == player.count_home_colonies(planets)
+                assert player.total_ships_in_play(game.planets) == player.total_ships_in_play(planets)
+                assert player.get_colonies(game.planets) == player.get_colonies(planets)
+
+    def test_index_follows_ship_moves(self):
+        """Adding and removing ships should update counts and locations."""
+        game = self.setup_game()
+        red, blue = game.players[0], game.players[1]
+        target = blue.home_planets[0]
+
+        target.add_ships(red.name, 2)
+        assert red.count_foreign_colonies(game.planets) == 1
+        assert target in red.get_foreign_colonies(game.planets)
+        assert red.total_ships_in_play(game.planets) == 22
+
+        target.remove_ships(red.name, 5)
+        assert red.count_foreign_colonies(game.planets) == 0
+        target.set_ships(blue.name, 0)
+        assert blue.count_home_colonies(game.planets) == 4
+        game.board.verify()
+
+    def test_verify_detects_untracked_changes(self):
+        """Changes that bypass ShipCount should fail verification."""
+        game = self.setup_game()
+        game.planets[0].ships.counts[game.players[1].name] = 3
+        with pytest.raises(RuntimeError):
+            game.board.verify()
+
+
+class TestShipMatrix:
+    """Tests for the compact array-backed board."""
+
+    def play(self, seed, compact_board):
+        game = Game(config=GameConfig(num_players=4, seed=seed), headless=True, compact_board=compact_board)
+        game.setup(powers=["Machine", "Oracle", "Virus", "Zombie"])
+        game.verify_board = True
+        game.play()
+        return game
+
+    def test_compact_board_plays_identically(self):
+        """A matrix-backed board should not change the outcome."""
+        for seed in range(3):
+            plain = self.play(seed, compact_board=False)
+            compact = self.play(seed, compact_board=True)
+            assert compact.current_turn == plain.current_turn
+            assert [w.name for w in compact.winners] == [w.name for w in plain.winners]
+            assert [p.ships.counts for p in compact.planets] == [p.ships.counts for p in plain.planets]
+
+    def test_counts_keep_arrival_order(self):
+        """Matrix-backed planets should list players in the order they arrived, as dicts do."""
+        game = Game(config=GameConfig(num_players=4, seed=1), compact_board=True)
+        game.setup(powers=["Machine", "Oracle", "Virus", "Zombie"])
+        planet = game.players[0].home_planets[0]
+        names = [p.name for p in game.players]
+        planet.ships.add(names[3], 2)
+        planet.ships.add(names[1], 1)
+        planet.ships.remove(names[0], 99)
+        planet.ships.set(names[0], 3)
+        assert list(planet.ships.counts) == [names[3], names[1], names[0]]
+        assert planet.ships.players_present() == [names[3], names[1], names[0]]
+
+        for seed in range(4):
+            logs = []
+            for compact_board in (False, True):
+                game = Game(config=GameConfig(num_players=5, seed=seed), compact_board=compact_board)
+                game.setup()
+                game.play()
+                logs.append(game.log)
+            assert logs[0] == logs[1]
+
+    def test_snapshot_restore(self):
+        """Restoring a snapshot should put back ships and warp counts."""
+        game = Game(config=GameConfig(num_players=4, seed=1), compact_board=True)
+        game.setup(powers=["Machine", "Oracle", "Virus", "Zombie"])
+        red = game.players[0]
+        saved = game.ship_matrix.snapshot(game.players)
+        before = [p.ships.counts for p in game.planets]
+
+        red.home_planets[0].remove_ships(red.name, 4)
+        red.send_ships_to_warp(4)
+        game.ship_matrix.restore(saved, game.players)
+
+        assert [p.ships.counts for p in game.planets] == before
+        assert red.ships_in_warp == 0
+
+
+class TestHandIndex:
+    """Tests for the per-type index kept by a player's Hand."""
+
+    def check(self, hand):
+        """The index should answer as a scan of the hand would."""
+        from cosmic.cards.base import AttackCard, NegotiateCard
+
+        attacks = [c for c in hand if isinstance(c, AttackCard)]
+        ranked = sorted(attacks, key=lambda c: c.value, reverse=True)
+        assert hand.of_type(AttackCard) == attacks
+        assert hand.of_type(NegotiateCard) == [c for c in hand if isinstance(c, NegotiateCard)]
+        assert hand.encounter_count() == sum(c.is_encounter_card() for c in hand)
+        assert hand.attack_total == sum(c.value for c in attacks)
+        for n in range(1, 5):
+            expected = ranked[min(n, len(ranked)) - 1] if ranked else None
+            assert hand.nth_highest_attack(n) is expected
+        assert hand.lowest_attack() is (min(attacks, key=lambda c: c.value) if attacks else None)
+
+    def test_index_follows_list_operations(self):
+        """Every list mutation should keep the index in step."""
+        import random
+        from cosmic.cards.cosmic_deck import CosmicDeck
+        from cosmic.hand import Hand
+
+        rng = random.Random(7)
+        deck = CosmicDeck(_rng=random.Random(7))
+        hand = Hand(deck.draw_multiple(5))
+        for _ in range(300):
+            op = rng.randrange(6)
+            if op == 0 or not hand:
+                hand.append(deck.draw())
+            elif op == 1:
+                deck.discard(hand.pop())
+            elif op == 2:
+                hand.remove(rng.choice(hand))
+            elif op == 3:
+                hand.insert(rng.randrange(len(hand)), deck.draw())
+            elif op == 4:
+                del hand[rng.randrange(len(hand))]
+            else:
+                hand += deck.draw_multiple(2)
+            self.check(hand)
+
+    def test_assigned_and_copied_hands_are_indexed(self):
+        """Plain lists assigned to a player, and copies of a hand, should be indexed."""
+        import copy
+        import pickle
+        from cosmic.cards.base import AttackCard, NegotiateCard
+        from cosmic.hand import Hand
+        from cosmic.types import Color
+
+        player = Player(name="P", color=Color.RED)
+        assert type(player.hand) is Hand
+        player.hand = [AttackCard(value=4), NegotiateCard(), AttackCard(value=12)]
+        assert player.select_highest_attack() == AttackCard(value=12)
+        assert player.has_encounter_card()
+
+        for clone in (copy.deepcopy(player.hand), pickle.loads(pickle.dumps(player.hand))):
+            assert type(clone) is Hand
+            self.check(clone)
+
+
+class TestGameSnapshot:
+    """Tests for Game.snapshot, restore and fork."""
+
+    VARIANTS = [
+        ({}, False),
+        ({}, True),
+        ({"use_tech": True, "use_hazards": True}, False),
+    ]
+
+    def start(self, seed, config, compact_board):
+        """A game a few encounters in."""
+        game = Game(config=GameConfig(num_players=4, seed=seed, **config), compact_board=compact_board)
+        game.setup(powers=["Machine", "Oracle", "Virus", "Zombie"])
+        game.verify_board = True
+        for _ in range(6):
+            game.play_encounter()
+        assert not game.is_over
+        return game
+
+    def finish(self, game):
+        """Play the game on from where it is; its log and winners."""
+        while not game.is_over and game.current_turn < game.config.max_turns:
+            game.play_encounter()
+        return list(game.log), [w.name for w in game.winners]
+
+    def test_restore_replays_rest_of_game(self):
+        """Restoring a snapshot should rewind the game to replay identically."""
+        for seed, (config, compact_board) in enumerate(self.VARIANTS):
+            game = self.start(seed, config, compact_board)
+            snapshot = game.snapshot()
+            hands = [list(p.hand) for p in game.players]
+            first = self.finish(game)
+
+            game.restore(snapshot)
+            game.board.verify()
+            assert [list(p.hand) for p in game.players] == hands
+            assert self.finish(game) == first
+
+            game.restore(snapshot)
+            assert self.finish(game) == first
+
+    def test_fork_plays_on_independently(self):
+        """A fork should play as the original would, without touching it."""
+        for seed, (config, compact_board) in enumerate(self.VARIANTS):
+            game = self.start(seed, config, compact_board)
+            log = list(game.log)
+            ships = [dict(p.ships.counts) for p in game.planets]
+
+            fork = game.fork()
+            assert fork.players[0] is not game.players[0]
+            assert fork.players[0].hand is not game.players[0].hand
+            assert fork.planets[0].owner is fork.players[0]
+            forked = self.finish(fork)
+
+            assert game.log == log
+            assert [dict(p.ships.counts) for p in game.planets] == ships
+            game.board.verify()
+            assert self.finish(game) == forked
+
+    def test_snapshot_is_packed(self):
+        """The board, decks and hands should be captured as flat arrays."""
+        for compact_board in (False, True):
+            game = self.start(0, {}, compact_board)
+            snapshot = game.snapshot()
+            board = snapshot.board[0] if compact_board else snapshot.board
+            assert isinstance(board, array)
+            assert snapshot.cosmic[0] == game.cosmic_deck.draw_ids
+            assert snapshot.cosmic[0] is not game.cosmic_deck.draw_ids
+            assert [packed[1] for packed in snapshot.players] == [card_ids(p.hand) for p in game.players]
+
+    def test_restore_resets_attributes_powers_attach(self):
+        """Attributes set on players and planets at runtime should be copied back or dropped."""
+        game = self.start(0, {}, False)
+        player, planet = game.players[0], game.planets[0]
+        player.hate_ships_lost = {"Player 2": 1}
+        snapshot = game.snapshot()
+        player.hate_ships_lost["Player 2"] = 3
+        player.fury_rage = 2
+        planet.prisoners = {}
+
+        game.restore(snapshot)
+        assert player.hate_ships_lost == {"Player 2": 1}
+        assert not hasattr(player, "fury_rage")
+        assert not hasattr(planet, "prisoners")
+        assert game.fork(snapshot).players[0].hate_ships_lost == {"Player 2": 1}
+
+    def test_snapshot_belongs_to_its_game(self):
+        """Restoring or forking another game's snapshot should raise."""
+        game = self.start(0, {}, False)
+        other = self.start(1, {}, False)
+        with pytest.raises(ValueError):
+            game.restore(other.snapshot())
+        with pytest.raises(ValueError):
+            game.fork(other.snapshot())
+
+
 class TestTwoPlayerVariant:
     """Tests for 2-player variant support."""
 
@@ -21,6 +21,7 @@ from cosmic.aliens.official_aliens import (
     get_official_alien_count_by_expansion,
     get_alien_description,
     get_missing_official_aliens,
+    get_alien_expansion_enum,
 )
 from cosmic.aliens.registry import AlienRegistry
 
@@ -250,6 +251,19 @@ class TestIntegrationWithRegistry:
         # We should have close to the official count (minor variations in naming)
         assert registered_count >= official_count - 5  # Allow small variance
 
+    def test_lineup_pool_matches_expansion_filter(self):
+        """Lineup pools should hold exactly the aliens of the selected expansions."""
+        from cosmic.types import Expansion
+
+        for selection in ([Expansion.BASE], [Expansion.BASE, Expansion.COSMIC_STORM, Expansion.HOMEBREW]):
+            expected = [
+                alien for alien in AlienRegistry.get_all()
+                if get_alien_expansion_enum(alien.name) in selection
+            ]
+            pool = AlienRegistry.lineup_pool(selection)
+            assert list(pool) == expected
+            assert AlienRegistry.lineup_pool(reversed(selection)) is pool
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
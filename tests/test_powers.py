@@ -39,6 +39,169 @@ class TestPowerRegistry:
         duplicates = [n for n in names if names.count(n) > 1]
         assert len(duplicates) == 0, f"Duplicate power names: {set(duplicates)}"
 
+    def test_alien_ids_are_interned(self):
+        """Registered aliens should have dense IDs that map back to their names."""
+        from cosmic.aliens import alien_id, alien_name
+
+        ids = [AlienRegistry.id_of(name) for name in AlienRegistry.get_names()]
+        assert len(set(ids)) == len(ids)
+        assert AlienRegistry.id_of("virus") == AlienRegistry.id_of("Virus") == alien_id("Virus")
+        assert alien_name(alien_id("Virus")) == "Virus"
+        assert AlienRegistry.get_by_id(alien_id("Virus")) is AlienRegistry.get("Virus")
+        assert AlienRegistry.id_of("Nobody") is None
+
+        retired = alien_id("Retired Alien")
+        assert alien_id("Retired Alien") == retired
+        assert AlienRegistry.get_by_id(retired) is None
+
+
+class TestHookDispatch:
+    """Tests for dispatching alien hooks only to powers that override them."""
+
+    def test_registry_records_overridden_hooks(self):
+        """Registered powers should list exactly the hooks their class defines."""
+        assert AlienRegistry.get_hooks(AlienRegistry.get("Virus")) == {"modify_ship_count", "modify_total"}
+        assert AlienRegistry.get_hooks(AlienRegistry.get("Ghoul")) == {"on_encounter_end"}
+        assert "on_turn_start" not in AlienRegistry.get_hooks(AlienRegistry.get("Machine"))
+
+    def test_unregistered_power_hooks(self):
+        """Powers that were never registered should still be inspected."""
+        from cosmic.aliens.base import AlienPower
+        from cosmic.types import PowerTiming
+
+        class Probe(AlienPower):
+            def on_regroup(self, game, player, role):
+                pass
+
+        power = Probe(name="Probe", description="", timing=PowerTiming.REGROUP)
+        assert AlienRegistry.get_hooks(power) == {"on_regroup"}
+
+    def test_game_subscribes_lineup(self):
+        """Setup should subscribe each player only to their power's hooks."""
+        game = Game(config=GameConfig(num_players=4, seed=1))
+        game.setup(powers=["Ghoul", "Virus", "Machine", "Oracle"])
+        ghoul = game.players[0]
+        virus = game.players[1]
+
+        assert game._hook_subscribers["on_encounter_end"] == [ghoul]
+        assert game._hook_subscribers["modify_total"] == [virus]
+        assert game._hook_subscribers["on_turn_start"] == []
+
+
+class TestPowerCapabilities:
+    """Tests for rule capabilities declared by alien powers."""
+
+    def test_powers_declare_capabilities(self):
+        """Rule-changing powers should declare their capability flags."""
+        from cosmic.types import PowerCapability
+
+        assert AlienRegistry.get("Loser").capabilities == PowerCapability.REVERSES_OUTCOME
+        assert AlienRegistry.get("Antimatter").capabilities == PowerCapability.REVERSES_OUTCOME
+        assert AlienRegistry.get("Machine").capabilities == PowerCapability.EXTRA_ENCOUNTERS
+        assert AlienRegistry.get("Oracle").capabilities == PowerCapability.NONE
+
+    def test_setup_compiles_player_capabilities(self):
+        """Setup should compile each player's flags for bit tests."""
+        from cosmic.types import PowerCapability
+
+        game = Game(config=GameConfig(num_players=4, seed=1))
+        game.setup(powers=["Symbiote", "Parasite", "Oracle", "Virus"])
+        symbiote, parasite, oracle = game.players[:3]
+
+        assert game.has_capability(symbiote, PowerCapability.DOUBLE_STARTING_SHIPS)
+        assert game.has_capability(parasite, PowerCapability.JOINS_UNINVITED)
+        assert not game.has_capability(oracle, PowerCapability.JOINS_UNINVITED)
+        assert not game.has_capability(None, PowerCapability.JOINS_UNINVITED)
+        assert symbiote.home_planets[0].get_ships(symbiote.name) == 8
+
+
+class TestSharedPowers:
+    """Tests for sharing stateless power instances between games."""
+
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        """The alien registry, put back as it was once the test ends."""
+        for name in ("_aliens", "_by_name", "_hooks", "_expansion_aliens", "_lineup_pools"):
+            monkeypatch.setattr(AlienRegistry, name, getattr(AlienRegistry, name))
+        return AlienRegistry
+
+    @staticmethod
+    def counter_power():
+        """A power that counts turn starts on itself, declared stateful."""
+        from dataclasses import dataclass, field
+        from cosmic.aliens.base import AlienPower
+        from cosmic.types import PowerTiming
+
+        @dataclass
+        class Counter(AlienPower):
+            stateful = True
+            name: str = field(default="Counter", init=False)
+            description: str = field(default="", init=False)
+            timing: PowerTiming = field(default=PowerTiming.REGROUP, init=False)
+            turns: int = 0
+
+            def on_turn_start(self, game, player):
+                self.turns += 1
+
+        return Counter()
+
+    def test_stateless_powers_are_shared(self):
+        """Games should seat the registered instance of a stateless power."""
+        games = []
+        for seed in (1, 2):
+            game = Game(config=GameConfig(num_players=3, seed=seed, dual_powers=True))
+            game.setup(powers=["Virus", "Oracle", "Machine", "Ghoul", "Clone", "Zombie"])
+            games.append(game)
+
+        for game in games:
+            assert game.players[0].alien is AlienRegistry.get("Virus")
+            assert game.players[0].secondary_alien is AlienRegistry.get("Ghoul")
+
+    def test_stateful_powers_are_copied(self, registry):
+        """A stateful power should get its own copy in each game, kept in snapshots."""
+        prototype = self.counter_power()
+        registry.register(prototype)
+
+        game = Game(config=GameConfig(num_players=3, seed=1))
+        game.setup(powers=["Counter", "Oracle", "Machine"])
+        counter = game.players[0].alien
+        assert counter is not prototype
+        for _ in range(4):
+            game.play_encounter()
+        assert counter.turns > 0
+        assert prototype.turns == 0
+
+        snapshot = game.snapshot()
+        turns = counter.turns
+        game.play_encounter()
+        game.restore(snapshot)
+        assert counter.turns == turns
+
+        fork = game.fork(snapshot)
+        assert fork.players[0].alien is not counter
+        assert fork.players[0].alien.turns == turns
+
+    def test_audit_flags_powers_that_mutate_themselves(self, registry):
+        """The audit should pass the registry and catch a power writing to itself."""
+        from dataclasses import dataclass, field
+        from cosmic.aliens.base import AlienPower
+        from cosmic.types import PowerTiming
+
+        @dataclass
+        class Leaky(AlienPower):
+            name: str = field(default="Leaky", init=False)
+            description: str = field(default="", init=False)
+            timing: PowerTiming = field(default=PowerTiming.REGROUP, init=False)
+
+            def on_turn_start(self, game, player):
+                self.turns_seen = getattr(self, "turns_seen", 0) + 1
+
+        assert registry.audit_state() == []
+
+        registry.register(Leaky())
+        registry.register(self.counter_power())
+        assert registry.audit_state() == ["Leaky"]
+
 
 class TestKeyPowers:
     """Tests for specific important powers."""
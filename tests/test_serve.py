@@ -0,0 +1,131 @@
+"""
+Tests for the simulation daemon.
+"""
+
+import io
+import json
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cosmic.serve import SimulationServer, config_from_dict, serve_stream
+from cosmic.simulation.checkpoint import SimulationCheckpoint
+from cosmic.simulation.runner import Simulator
+from cosmic.types import Expansion, GameConfig, SimulationConfig
+
+
+def run_requests(server: SimulationServer, *requests) -> list:
+    """Feed requests to the server as JSON lines and return the reply events."""
+    infile = io.StringIO("".join(json.dumps(r) + "\n" for r in requests))
+    out = io.StringIO()
+    serve_stream(server, infile, out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+class TestConfigFromDict:
+    """Tests for parsing job configs."""
+
+    def test_builds_nested_game_config(self):
+        """Game config fields and expansions should be parsed."""
+        config = config_from_dict({
+            "num_games": 5,
+            "game_config": {"num_players": 3, "seed": 9, "expansions": ["cosmic_incursion"]},
+        })
+
+        assert config.num_games == 5
+        assert config.game_config.num_players == 3
+        assert config.game_config.expansions == [Expansion.COSMIC_INCURSION]
+        assert config.show_progress is False
+
+    def test_rejects_unknown_fields(self):
+        """Typos should be reported rather than silently ignored."""
+        with pytest.raises(ValueError):
+            config_from_dict({"num_gmes": 5})
+        with pytest.raises(ValueError):
+            config_from_dict({"game_config": {"players": 3}})
+
+
+class TestSimulationServer:
+    """Tests for running jobs through the daemon."""
+
+    def test_run_streams_progress_and_result(self):
+        """A job should be accepted, report progress and match a direct run."""
+        server = SimulationServer(workers=1)
+        events = run_requests(server, {
+            "op": "run",
+            "id": "a",
+            "config": {"num_games": 6, "progress_interval": 2, "game_config": {"num_players": 4, "seed": 3}},
+        })
+
+        assert [e["event"] for e in events] == ["accepted", "progress", "progress", "progress", "result"]
+        result = events[-1]
+        assert result["id"] == "a"
+        assert result["games_completed"] == 6
+
+        expected = Simulator(config=SimulationConfig(
+            num_games=6, game_config=GameConfig(num_players=4, seed=3), show_progress=False
+        )).run()
+        served = SimulationCheckpoint._deserialize_statistics(result["statistics"])
+        assert served.turn_counts == expected.statistics.turn_counts
+        assert {n: s.games_won for n, s in served.alien_stats.items()} == \
+            {n: s.games_won for n, s in expected.statistics.alien_stats.items()}
+
+    def test_process_pool_matches_serial(self):
+        """Jobs on the warm process pool should give the same statistics."""
+        request = {"op": "run", "id": "p", "config": {"num_games": 8, "game_config": {"num_players": 4, "seed": 11}}}
+        pooled = SimulationServer(workers=2)
+        try:
+            pooled_events = run_requests(pooled, request)
+        finally:
+            pooled.close()
+        serial_events = run_requests(SimulationServer(workers=1), request)
+
+        assert pooled_events[-1]["event"] == "result"
+        assert pooled_events[-1]["statistics"] == serial_events[-1]["statistics"]
+
+    def test_cancel_stops_job(self):
+        """A cancelled job should stop early and report partial statistics."""
+        server = SimulationServer(workers=1)
+        events = []
+        lock = threading.Lock()
+
+        def emit(event):
+            with lock:
+                events.append(event)
+
+        started = threading.Event()
+        config = {"num_games": 100000, "progress_interval": 1, "game_config": {"num_players": 3, "seed": 5}}
+        server.submit("big", config, lambda e: (emit(e), started.set()))
+        started.wait(5)
+        server.handle({"op": "cancel", "id": "big"}, emit)
+        server.join(30)
+
+        final = events[-1]
+        assert final["event"] == "cancelled"
+        assert final["games_completed"] < 100000
+        assert final["statistics"]["total_games"] == final["games_completed"]
+
+    def test_errors_and_ping(self):
+        """Bad requests should get error events without stopping the server."""
+        server = SimulationServer(workers=1)
+        events = run_requests(
+            server,
+            {"op": "bogus"},
+            {"op": "run", "id": "x", "config": {"nope": 1}},
+            {"op": "cancel", "id": "missing"},
+            {"op": "ping"},
+        )
+
+        assert [e["event"] for e in events] == ["error", "error", "error", "pong"]
+
+    def test_shutdown_stops_reading(self):
+        """Requests after a shutdown should not be handled."""
+        server = SimulationServer(workers=1)
+        events = run_requests(server, {"op": "shutdown"}, {"op": "ping"})
+
+        assert events == []
+        assert server.shutdown_event.is_set()
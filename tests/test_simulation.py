@@ -0,0 +1,736 @@
+"""
+Tests for the simulation runner.
+"""
+
+import asyncio
+import pytest
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cosmic.simulation.runner import GamePool, Simulator, _OrderedMerger, play_game
+from cosmic.simulation.result_cache import GameResultCache, cache_key
+from cosmic.simulation.stats import Statistics
+from cosmic.simulation.cumulative_stats import CumulativeStats
+from cosmic.simulation.fingerprints import power_fingerprint, engine_fingerprint
+from cosmic.simulation.ledger import GameLedger
+from cosmic.simulation.async_api import AsyncSimulationService
+from cosmic.simulation.shared_stats import SharedStatistics
+from cosmic.simulation.work_queue import WorkQueue, play_unit, run_worker
+from cosmic.aliens import AlienRegistry
+from cosmic.game import Game
+from cosmic.types import Expansion, GameConfig, SimulationConfig
+from cosmic.utils.seeding import derive_seed, game_seed
+
+
+def make_config(num_games: int = 20, seed: int = 42, **kwargs) -> SimulationConfig:
+    """Build a quiet simulation config for tests."""
+    return SimulationConfig(
+        num_games=num_games,
+        game_config=GameConfig(num_players=4, seed=seed),
+        show_progress=False,
+        catch_errors=False,
+        **kwargs,
+    )
+
+
+class TestParallelRun:
+    """Tests for the process-pool execution mode."""
+
+    def test_parallel_run_completes_all_games(self):
+        """All games should be played and merged from the worker processes."""
+        sim = Simulator(config=make_config(num_games=24, workers=2))
+        result = sim.run()
+
+        assert result.games_completed == 24
+        assert result.statistics.total_games == 24
+        assert sum(s.games_played for s in result.statistics.alien_stats.values()) == 24 * 4
+
+    def test_parallel_progress_callback(self):
+        """Progress callback should be called as chunks finish, ending at the total."""
+        calls = []
+        sim = Simulator(config=make_config(num_games=12, progress_interval=5))
+        sim.run(progress_callback=lambda done, total: calls.append((done, total)), workers=2)
+
+        assert calls
+        assert calls[-1] == (12, 12)
+        assert [done for done, _ in calls] == sorted(done for done, _ in calls)
+
+    def test_chunk_size_respects_progress_interval(self):
+        """Chunks should never be larger than the progress interval."""
+        sim = Simulator(config=make_config(num_games=1000, progress_interval=50))
+        assert sim._chunk_size(2) == 50
+        assert sim._chunk_size(64) == 4
+
+    def test_shared_executor_is_left_running(self):
+        """Runs on a caller's executor should not shut it down."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = Simulator(config=make_config(num_games=6)).run(workers=2, executor=executor)
+            second = Simulator(config=make_config(num_games=6)).run(workers=2, executor=executor)
+
+        assert first.games_completed == second.games_completed == 6
+        assert first.statistics.turn_counts == second.statistics.turn_counts
+
+    def test_cancel_event_stops_run(self):
+        """A set cancel event should stop serial and parallel runs early."""
+        cancel = threading.Event()
+        cancel.set()
+        for workers in (1, 2):
+            result = Simulator(config=make_config(num_games=50)).run(workers=workers, cancel_event=cancel)
+            assert result.cancelled
+            assert result.games_completed == result.statistics.total_games < 50
+
+    def test_failed_games_counted_in_every_mode(self, monkeypatch):
+        """Parallel runs should report as many failed games as a serial run."""
+        play = Simulator._play_single_game
+
+        def flaky(self, game_index=None):
+            if game_index % 3 == 0:
+                raise RuntimeError("boom")
+            return play(self, game_index)
+
+        monkeypatch.setattr(Simulator, "_play_single_game", flaky)
+        config = make_config(num_games=12, progress_interval=2, backend="thread", log_errors=False)
+        config.catch_errors = True
+        for workers, aggregation in ((1, "merge"), (3, "merge"), (3, "shared_memory")):
+            config.aggregation = aggregation
+            result = Simulator(config=config).run(workers=workers)
+            assert result.errors == 4
+            assert result.games_completed == 8
+
+
+POWERS = ["Machine", "Oracle", "Virus", "Zombie", "Clone", "Healer", "Trader", "Warrior"]
+
+
+def lineup_counts(stats: Statistics):
+    """Alien game counts in insertion order; depends only on per-game lineups."""
+    return [(name, s.games_played) for name, s in stats.alien_stats.items()]
+
+
+class TestSeeding:
+    """Tests for per-game seed derivation and ordered reduction."""
+
+    def test_derive_seed_is_pure(self):
+        """Derived seeds depend only on their inputs."""
+        assert derive_seed(7, 3) == derive_seed(7, 3)
+        assert derive_seed(7, 3) != derive_seed(7, 4)
+        assert derive_seed(7, 3) != derive_seed(8, 3)
+        assert derive_seed(7, 3, "lineup") != derive_seed(7, 3)
+        assert derive_seed(7, 3) != derive_seed(7, "3")
+        assert game_seed(7, 3) == derive_seed(7, 3)
+        assert 0 <= derive_seed(2**70, 1) < 2**63
+
+    def test_master_seed_defaults_to_game_seed(self):
+        """The master seed comes from the game config, or is generated."""
+        assert Simulator(config=make_config(seed=99)).master_seed == 99
+        assert Simulator(config=make_config(seed=None)).master_seed is not None
+
+    def test_ordered_merger_ignores_completion_order(self):
+        """Chunks merged out of order produce the same tables as in order."""
+        chunks = []
+        for first, winner in [(0, "Oracle"), (2, "Virus"), (5, "Zombie")]:
+            stats = Statistics()
+            stats.record_game(
+                num_players=2,
+                winners=["P1"],
+                alien_map={"P1": winner, "P2": "Machine"},
+                turn_count=first + 3,
+                final_colonies={"P1": 5, "P2": 1},
+            )
+            chunks.append((first, {0: 2, 2: 3, 5: 1}[first], stats))
+
+        in_order = Statistics()
+        merger = _OrderedMerger(in_order)
+        for chunk in chunks:
+            merger.add(*chunk)
+
+        shuffled = Statistics()
+        merger = _OrderedMerger(shuffled)
+        for chunk in reversed(chunks):
+            merger.add(*chunk)
+
+        assert merger.next_index == 6
+        assert shuffled.turn_counts == in_order.turn_counts == [3, 5, 8]
+        assert lineup_counts(shuffled) == lineup_counts(in_order)
+
+    def test_lineups_independent_of_workers(self):
+        """Per-game lineups depend on the game index, not the worker count."""
+        serial = Simulator(config=make_config(num_games=12, powers_to_test=POWERS)).run()
+        parallel = Simulator(
+            config=make_config(num_games=12, powers_to_test=POWERS, progress_interval=2)
+        ).run(workers=3)
+
+        assert lineup_counts(parallel.statistics) == lineup_counts(serial.statistics)
+
+    def test_resumed_run_continues_sequence(self):
+        """A run resumed at start_index plays the same games as an uninterrupted one."""
+        full = Simulator(config=make_config(num_games=10, powers_to_test=POWERS)).run()
+
+        first_half = Simulator(config=make_config(num_games=4, powers_to_test=POWERS))
+        first_half.run()
+        resumed = Simulator(
+            config=make_config(num_games=10, powers_to_test=POWERS),
+            statistics=first_half.statistics,
+        ).run(start_index=4)
+
+        assert resumed.games_completed == 6
+        assert resumed.statistics.total_games == 10
+        assert lineup_counts(resumed.statistics) == lineup_counts(full.statistics)
+
+    def test_statistics_identical_across_workers(self):
+        """1, 2 or 3 workers should produce exactly the same tables."""
+        serial = Simulator(config=make_config(num_games=12)).run().statistics
+        for workers in (2, 3):
+            parallel = Simulator(config=make_config(num_games=12, progress_interval=2)).run(workers=workers)
+            assert parallel.statistics == serial
+            assert list(parallel.statistics.alien_stats) == list(serial.alien_stats)
+
+    def test_resumed_statistics_identical(self):
+        """Resuming halfway should reproduce the uninterrupted run exactly."""
+        full = Simulator(config=make_config(num_games=10)).run().statistics
+
+        first_half = Simulator(config=make_config(num_games=5))
+        first_half.run()
+        resumed = Simulator(config=make_config(num_games=10), statistics=first_half.statistics)
+        resumed.run(start_index=5, workers=2)
+
+        assert resumed.statistics == full
+
+
+def game_state(game: Game):
+    """Everything observable about a finished game, for comparing two games."""
+    return (
+        game.seed,
+        game.current_turn,
+        [w.name for w in game.winners],
+        [(p.name, p.alien_name, [str(c) for c in p.hand], p.ships_in_warp) for p in game.players],
+        [(planet.owner.name, dict(planet.ships.counts)) for planet in game.planets],
+        [str(c) for c in game.cosmic_deck.draw_pile],
+        dict(game.power_activations),
+        list(game.log),
+    )
+
+
+class TestGamePool:
+    """Tests for reusing games with Game.reset."""
+
+    def test_reset_matches_fresh_construction(self):
+        """A pooled game should play exactly like a newly constructed one."""
+        jobs = [
+            (GameConfig(num_players=5, seed=1), None),
+            (GameConfig(num_players=3, seed=2, use_hazards=True), POWERS[:3]),
+            (GameConfig(num_players=6, seed=3, use_tech=True, use_space_stations=True), None),
+            (GameConfig(num_players=2, seed=4), POWERS[:4]),
+            (GameConfig(num_players=4, seed=5, use_hazards=True), POWERS[4:]),
+        ]
+        pool = GamePool(headless=False)
+        for config, powers in jobs * 2:
+            fresh = Game(config=config)
+            fresh.setup(powers=powers)
+            fresh.play()
+            pooled = pool.acquire(config, powers)
+            pooled.play()
+            assert game_state(pooled) == game_state(fresh)
+
+    def test_reset_reuses_structures(self):
+        """Reset should keep the game's decks, players and planets."""
+        pool = GamePool()
+        game = pool.acquire(GameConfig(num_players=4, seed=1), POWERS[:4])
+        game.play()
+        deck = game.cosmic_deck
+        buffers = {id(deck.draw_ids), id(deck.discard_ids)}
+        players = [id(player) for player in game.players]
+        planets = {id(planet) for planet in game.planets}
+        game.players[0].fury_rage = 3  # State a power attached at runtime
+
+        assert pool.acquire(GameConfig(num_players=4, seed=2), POWERS[4:]) is game
+        assert game.cosmic_deck is deck
+        assert {id(deck.draw_ids), id(deck.discard_ids)} == buffers
+        assert [id(player) for player in game.players] == players
+        assert {id(planet) for planet in game.planets} == planets
+        assert not hasattr(game.players[0], "fury_rage")
+        assert [p.alien_name for p in game.players] == POWERS[4:]
+
+
+class TestResultCache:
+    """Tests for the on-disk game result cache."""
+
+    def test_key_covers_config_lineup_and_seed(self):
+        """Keys should be stable and change with any input."""
+        config = GameConfig(num_players=4, seed=5)
+        key = cache_key(config, ["Machine", "Oracle"])
+
+        assert key == cache_key(GameConfig(num_players=4, seed=5), ["Machine", "Oracle"])
+        assert key != cache_key(GameConfig(num_players=4, seed=6), ["Machine", "Oracle"])
+        assert key != cache_key(GameConfig(num_players=5, seed=5), ["Machine", "Oracle"])
+        assert key != cache_key(config, ["Oracle", "Machine"])
+        assert key != cache_key(config, None)
+
+    def test_round_trip(self, tmp_path):
+        """A stored record should come back unchanged."""
+        cache = GameResultCache(str(tmp_path))
+        config = GameConfig(num_players=4, seed=11)
+        record = play_game(config, POWERS[:4])
+        key = cache_key(config, POWERS[:4])
+
+        assert cache.get(key) is None
+        cache.put(key, record)
+        assert cache.get(key) == record
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_rerun_reads_from_cache(self, tmp_path):
+        """A repeated seeded run should hit the cache and give the same tables."""
+        first = Simulator(config=make_config(num_games=8), cache=GameResultCache(str(tmp_path)))
+        first_result = first.run()
+        second = Simulator(config=make_config(num_games=8), cache=GameResultCache(str(tmp_path)))
+        second_result = second.run()
+
+        assert first_result.cache_counters == {"hits": 0, "misses": 8, "evictions": 0}
+        assert second_result.cache_counters == {"hits": 8, "misses": 0, "evictions": 0}
+        assert second_result.statistics == first_result.statistics
+
+    def test_parallel_counters_aggregate(self, tmp_path):
+        """Hit/miss counts from worker processes should reach the parent."""
+        cache = GameResultCache(str(tmp_path))
+        Simulator(config=make_config(num_games=6), cache=cache).run()
+        result = Simulator(
+            config=make_config(num_games=10, progress_interval=2), cache=cache
+        ).run(workers=2)
+
+        assert cache.hits == 6
+        assert cache.misses == 10
+        assert result.statistics.total_games == 10
+
+    def test_size_bound_evicts_oldest(self, tmp_path):
+        """Writing past max_bytes should evict least recently used entries."""
+        cache = GameResultCache(str(tmp_path), max_bytes=2000)
+        record = play_game(GameConfig(num_players=4, seed=1), POWERS[:4])
+        for seed in range(30):
+            cache.put(cache_key(GameConfig(num_players=4, seed=seed)), record)
+
+        assert cache.evictions > 0
+        assert cache.size_bytes() <= 2000
+        assert cache.get(cache_key(GameConfig(num_players=4, seed=29))) is not None
+
+    def test_size_tracks_overwrites(self, tmp_path):
+        """Rewriting an entry should not grow the tracked size."""
+        cache = GameResultCache(str(tmp_path))
+        record = play_game(GameConfig(num_players=4, seed=1), POWERS[:4])
+        key = cache_key(GameConfig(num_players=4, seed=1))
+        for _ in range(5):
+            cache.put(key, record)
+
+        on_disk = sum(size for _, _, size in cache._scan())
+        assert cache.size_bytes() == on_disk
+
+
+def build_ledger(num_games: int = 12, num_players: int = 4):
+    """Play seeded games into a ledger and directly into CumulativeStats."""
+    ledger = GameLedger()
+    direct = CumulativeStats()
+    for i in range(num_games):
+        powers = POWERS[i % 4:i % 4 + num_players]
+        record = play_game(GameConfig(num_players=num_players, seed=i), powers)
+        ledger.add(num_players, i, powers, record)
+        direct.record_game(
+            alien_map=record.alien_map,
+            winner_names=record.winners,
+            final_colonies=record.final_colonies,
+            turn_count=record.turn_count,
+            num_players=num_players,
+            timed_out=record.timed_out,
+        )
+    return ledger, direct
+
+
+def stats_dict(stats: CumulativeStats):
+    data = stats.to_dict()
+    data.pop("last_updated")
+    return data
+
+
+class TestLedger:
+    """Tests for fingerprint-tagged game ledgers and incremental refresh."""
+
+    def test_fingerprints_are_per_class(self):
+        """Each power should have its own stable fingerprint."""
+        assert power_fingerprint("Machine") == power_fingerprint("machine")
+        assert power_fingerprint("Machine") != power_fingerprint("Oracle")
+        assert power_fingerprint("NoSuchAlien") is None
+        assert len(engine_fingerprint()) == 16
+
+    def test_engine_fingerprint_covers_loaded_modules(self):
+        """Every engine module a game loads should be part of the engine fingerprint."""
+        import cosmic.game
+        from cosmic.simulation import fingerprints
+
+        root = Path(cosmic.game.__file__).resolve().parent
+        loaded = [
+            Path(module.__file__).resolve().relative_to(root).as_posix()
+            for name, module in list(sys.modules.items())
+            if name.split(".")[0] == "cosmic" and getattr(module, "__file__", None)
+        ]
+        engine = [path for path in loaded if not path.startswith(fingerprints._NON_ENGINE)]
+        assert {"game.py", "board_index.py", "ship_matrix.py", "hand.py", "decisions.py", "snapshot.py"} <= set(engine)
+        assert set(engine) <= set(fingerprints.ENGINE_MODULES)
+
+    def test_rebuild_matches_direct_recording(self):
+        """Stats rebuilt from the ledger should equal stats recorded as games ran."""
+        ledger, direct = build_ledger()
+        assert stats_dict(ledger.to_cumulative_stats()) == stats_dict(direct)
+
+    def test_only_games_with_changed_alien_are_stale(self):
+        """Changing one alien's fingerprint should only invalidate its games."""
+        ledger, _ = build_ledger()
+        assert ledger.stale_indices() == []
+
+        for entry in ledger.entries:
+            if "Healer" in entry.fingerprints:
+                entry.fingerprints["Healer"] = "old-healer-code"
+
+        expected = [i for i, e in enumerate(ledger.entries) if "Healer" in e.powers]
+        assert expected and len(expected) < len(ledger)
+        assert ledger.stale_indices() == expected
+
+    def test_refresh_replays_stale_games(self, tmp_path):
+        """Refreshing should replay stale games only and clear their staleness."""
+        ledger, direct = build_ledger()
+        path = str(tmp_path / "ledger.jsonl")
+        ledger.save(path)
+        ledger = GameLedger.load(path)
+        ledger.entries[3].engine = "old-engine"
+
+        played = []
+
+        def play(config, powers):
+            played.append(config.seed)
+            return play_game(config, powers)
+
+        assert ledger.refresh(play=play) == [3]
+        assert played == [3]
+        assert ledger.stale_indices() == []
+        assert stats_dict(ledger.to_cumulative_stats()) == stats_dict(direct)
+
+    def test_refresh_keeps_games_missing_from_ledger(self):
+        """Refreshing stats that hold games the ledger lacks should refuse, not drop them."""
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from simulate_and_update import refresh_from_ledger
+
+        ledger, direct = build_ledger()
+        assert refresh_from_ledger(direct, ledger, show_progress=False) is direct
+
+        record = play_game(GameConfig(num_players=4, seed=99), POWERS[:4])
+        direct.record_game(
+            alien_map=record.alien_map,
+            winner_names=record.winners,
+            final_colonies=record.final_colonies,
+            turn_count=record.turn_count,
+            num_players=4,
+            timed_out=record.timed_out,
+        )
+        ledger.entries[3].engine = "old-engine"
+        with pytest.raises(ValueError):
+            refresh_from_ledger(direct, ledger, show_progress=False)
+        assert direct.total_games == len(ledger) + 1
+        assert ledger.stale_indices() == [3]
+
+
+class TestThreadSafety:
+    """Stress tests for running games on threads in one process."""
+
+    def test_threaded_games_match_serial(self):
+        """Games played concurrently on threads should match serial replays exactly."""
+        jobs = [
+            (GameConfig(num_players=3 + i % 4, seed=i), None if i % 2 else POWERS[:3 + i % 4])
+            for i in range(48)
+        ]
+        serial = [play_game(config, powers) for config, powers in jobs]
+
+        barrier = threading.Barrier(8)
+
+        def play(job):
+            try:
+                barrier.wait(timeout=5)  # Start the first games together
+            except threading.BrokenBarrierError:
+                pass
+            return play_game(*job)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            threaded = list(executor.map(play, jobs))
+
+        assert threaded == serial
+
+    def test_thread_backend_matches_serial(self):
+        """The thread backend should produce the same tables as a serial run."""
+        serial = Simulator(config=make_config(num_games=16)).run().statistics
+        threaded = Simulator(
+            config=make_config(num_games=16, progress_interval=2, backend="thread")
+        ).run(workers=4)
+
+        assert threaded.statistics == serial
+
+    def test_unknown_backend_rejected(self):
+        """An unknown backend name should raise."""
+        sim = Simulator(config=make_config(num_games=4, backend="fibers"))
+        with pytest.raises(ValueError):
+            sim.run(workers=2)
+
+    def test_game_does_not_mutate_shared_config(self):
+        """Setup flags should land on the game's copy, not the caller's config."""
+        config = GameConfig(num_players=2, seed=1)
+        Game(config=config).setup()
+        assert config.two_player_mode is False
+        assert config.dual_powers is False
+
+    def test_registry_snapshots_are_immutable(self):
+        """Registry state should be swapped wholesale, never mutated in place."""
+        snapshot = AlienRegistry._aliens
+        with pytest.raises(TypeError):
+            snapshot["new"] = None
+
+        enabled = AlienRegistry._enabled_expansions
+        AlienRegistry.enable_base_game_only()
+        try:
+            assert len(enabled) > 1
+            assert AlienRegistry.get_enabled_expansions() == {Expansion.BASE}
+        finally:
+            AlienRegistry.enable_all_expansions()
+
+
+class TestAsyncApi:
+    """Tests for the asyncio job API."""
+
+    def test_job_streams_progress_and_matches_serial(self):
+        """Progress should arrive in order and the result should match a serial run."""
+        async def main():
+            async with AsyncSimulationService(workers=2, backend="thread") as service:
+                job = await service.submit(make_config(num_games=12, progress_interval=4))
+                updates = [progress async for progress in job]
+                return updates, await job.result()
+
+        updates, result = asyncio.run(main())
+        serial = Simulator(config=make_config(num_games=12)).run()
+
+        assert [u.completed for u in updates] == sorted(u.completed for u in updates)
+        assert updates[-1].completed == 12
+        assert updates[-1].statistics.total_games == 12
+        assert result.statistics.turn_counts == serial.statistics.turn_counts
+
+    def test_process_pool_jobs_run_concurrently(self):
+        """Concurrent jobs on a process pool should each complete."""
+        async def main():
+            async with AsyncSimulationService(workers=2, max_concurrent_jobs=2) as service:
+                jobs = [
+                    await service.submit(make_config(num_games=6, seed=seed))
+                    for seed in (1, 2, 3)
+                ]
+                return await asyncio.gather(*(job.result() for job in jobs))
+
+        results = asyncio.run(main())
+        assert [r.games_completed for r in results] == [6, 6, 6]
+
+    def test_cancel_returns_partial_result(self):
+        """A cancelled job should finish early with cancelled=True."""
+        async def main():
+            async with AsyncSimulationService(workers=1, backend="thread") as service:
+                job = await service.submit(make_config(num_games=100000, progress_interval=1))
+                async for progress in job:
+                    job.cancel()
+                return await job.result()
+
+        result = asyncio.run(main())
+        assert result.cancelled
+        assert result.games_completed < 100000
+        assert result.statistics.total_games == result.games_completed
+
+    def test_event_loop_stays_responsive(self):
+        """The loop should keep running other tasks while games play."""
+        async def main():
+            ticks = 0
+            async with AsyncSimulationService(workers=1, backend="thread") as service:
+                job = await service.submit(make_config(num_games=20))
+                while not job.done():
+                    ticks += 1
+                    await asyncio.sleep(0.001)
+                await job.result()
+            return ticks
+
+        assert asyncio.run(main()) > 1
+
+    def test_failed_submit_frees_its_slot(self):
+        """A job that fails to start should not hold a concurrency slot."""
+        async def main():
+            async with AsyncSimulationService(workers=1, max_concurrent_jobs=1, backend="thread") as service:
+                bad = make_config(num_games=4)
+                bad.game_config = None
+                for _ in range(3):
+                    with pytest.raises(AttributeError):
+                        await asyncio.wait_for(service.submit(bad), timeout=5)
+                job = await asyncio.wait_for(service.submit(make_config(num_games=4)), timeout=5)
+                return await job.result()
+
+        assert asyncio.run(main()).games_completed == 4
+
+
+class TestWorkQueue:
+    """Tests for the file-backed distributed work queue."""
+
+    def make_queue(self, tmp_path, **kwargs) -> WorkQueue:
+        tmp_path.mkdir(exist_ok=True)
+        return WorkQueue.create(
+            str(tmp_path / "queue.db"),
+            num_games=10,
+            master_seed=21,
+            powers=POWERS,
+            unit_size=3,
+            **kwargs,
+        )
+
+    def test_create_splits_into_units(self, tmp_path):
+        """Units should cover every game index exactly once."""
+        queue = self.make_queue(tmp_path)
+
+        assert queue.progress()["total"] == 4
+        units = [queue.claim("w") for _ in range(4)]
+        assert [(u.first_index, u.num_games) for u in units] == [(0, 3), (3, 3), (6, 3), (9, 1)]
+        assert queue.claim("w") is None
+        with pytest.raises(ValueError):
+            self.make_queue(tmp_path)
+
+    def test_expired_lease_is_reissued(self, tmp_path):
+        """A unit whose worker stops renewing should go to the next worker."""
+        queue = self.make_queue(tmp_path, lease_seconds=0.05)
+        abandoned = queue.claim("dead")
+        time.sleep(0.1)
+
+        assert queue.progress()["expired"] == 1
+        reissued = queue.claim("alive")
+        assert reissued.id == abandoned.id
+        assert not queue.renew(abandoned)
+        assert queue.renew(reissued)
+
+    def test_reduce_independent_of_workers(self, tmp_path):
+        """Interleaved workers should reduce to the same stats as one worker."""
+        single = self.make_queue(tmp_path / "single")
+        run_worker(single.path, worker="only", poll_seconds=0)
+
+        shared = self.make_queue(tmp_path / "shared")
+        second = WorkQueue(shared.path)
+        # Two workers finish their units in reverse order
+        first_unit, second_unit = shared.claim("a"), second.claim("b")
+        second.complete(second_unit, play_unit(second, second_unit))
+        shared.complete(first_unit, play_unit(shared, first_unit))
+        run_worker(shared.path, worker="c", poll_seconds=0)
+
+        single_stats, shared_stats = CumulativeStats(), CumulativeStats()
+        assert single.reduce(single_stats) == shared.reduce(shared_stats)
+        assert single_stats.total_games == 10
+        assert stats_dict(single_stats) == stats_dict(shared_stats)
+
+    def test_games_match_seed_derivation(self, tmp_path):
+        """Queue games should replay exactly from their stored inputs."""
+        queue = self.make_queue(tmp_path)
+        run_worker(queue.path, poll_seconds=0)
+
+        entries = queue.results().entries
+        assert len(entries) == 10
+        assert entries[4].seed == game_seed(21, 4)
+        assert play_game(entries[4].game_config(), entries[4].powers) == entries[4].record
+
+    def test_reduce_refuses_unfinished_queue(self, tmp_path):
+        """Reducing before every unit is done should fail."""
+        queue = self.make_queue(tmp_path)
+        run_worker(queue.path, poll_seconds=0, max_units=1)
+
+        assert not queue.is_done()
+        with pytest.raises(ValueError):
+            queue.reduce(CumulativeStats())
+        assert not queue.is_reduced()
+
+    def test_reduce_records_games_once(self, tmp_path):
+        """A second reduce, from any process, should raise rather than count games twice."""
+        queue = self.make_queue(tmp_path)
+        run_worker(queue.path, poll_seconds=0)
+
+        stats, ledger = CumulativeStats(), GameLedger()
+        assert queue.reduce(stats, ledger) == 10
+        assert len(ledger) == 10
+        assert queue.is_reduced()
+        for reducer in (queue, WorkQueue(queue.path)):
+            with pytest.raises(ValueError):
+                reducer.reduce(stats, ledger)
+        assert stats.total_games == 10
+        assert len(ledger) == 10
+        assert queue.game_inputs(4) == WorkQueue(queue.path).game_inputs(4)
+
+
+class TestSharedStatistics:
+    """Tests for shared-memory statistics aggregation."""
+
+    def test_matches_record_games_batch(self):
+        """Recording into slots should materialize the same Statistics."""
+        records = [
+            play_game(GameConfig(num_players=4, seed=seed), POWERS[seed % 4:seed % 4 + 4])
+            for seed in range(6)
+        ]
+        expected = Statistics()
+        expected.record_games_batch(records)
+
+        with SharedStatistics(POWERS, num_games=6, slots=3, max_players=4) as shared:
+            # Slots filled out of game order
+            for position in (5, 2, 0, 4, 1, 3):
+                shared.record(position % 3, position, records[position])
+            materialized = shared.to_statistics()
+
+        assert materialized == expected
+        assert list(materialized.alien_stats) == list(expected.alien_stats)
+
+    def test_pickled_copy_shares_memory(self):
+        """A pickled copy should write into the same block."""
+        import pickle
+        record = play_game(GameConfig(num_players=4, seed=1), POWERS[:4])
+        with SharedStatistics(POWERS, num_games=2, slots=2, max_players=4) as shared:
+            attached = pickle.loads(pickle.dumps(shared))
+            attached.record(1, 1, record)
+            attached.close()
+
+            assert not attached.owner
+            assert shared.total_games == 1
+            assert shared.to_statistics().turn_counts == [record.turn_count]
+
+    def test_rejects_unknown_alien(self):
+        """Aliens outside the layout should be refused before any write."""
+        record = play_game(GameConfig(num_players=4, seed=1), POWERS[:4])
+        with SharedStatistics(POWERS[:2], num_games=1, slots=1, max_players=4) as shared:
+            with pytest.raises(ValueError):
+                shared.record(0, 0, record)
+            assert shared.total_games == 0
+
+    def test_parallel_run_identical_to_merge(self):
+        """Shared-memory runs should equal merged runs, on both backends."""
+        serial = Simulator(config=make_config(num_games=12)).run().statistics
+        for backend in ("process", "thread"):
+            shared = Simulator(
+                config=make_config(num_games=12, progress_interval=2, aggregation="shared_memory", backend=backend)
+            ).run(workers=2)
+            assert shared.games_completed == 12
+            assert shared.statistics == serial
+            assert list(shared.statistics.alien_stats) == list(serial.alien_stats)
+
+    def test_live_statistics_during_run(self):
+        """Progress callbacks should see games recorded so far."""
+        seen = []
+        sim = Simulator(config=make_config(num_games=8, progress_interval=2, aggregation="shared_memory"))
+        sim.run(
+            progress_callback=lambda done, total: seen.append(sim.live_statistics().total_games),
+            workers=2,
+        )
+
+        assert seen == sorted(seen)
+        assert seen[-1] == 8
+        assert sim._shared is None
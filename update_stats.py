@@ -4,6 +4,7 @@ Runs Cosmic Encounter simulations and updates the README with a sortable stats t
 
 Usage:
     python update_stats.py [--games N] [--sort COLUMN] [--order asc|desc]
+                           [--seed N] [--cache-dir DIR]
 
 Examples:
     python update_stats.py --games 1000
@@ -21,7 +22,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from cosmic.simulation.runner import Simulator
+from cosmic.simulation.result_cache import GameResultCache
 from cosmic.types import SimulationConfig, GameConfig
+from cosmic.utils.seeding import derive_seed
 from cosmic.aliens.official_aliens import get_alien_expansion
 
 STATS_FILE = Path(__file__).parent / "stats.json"
@@ -49,7 +52,11 @@ def save_stats(stats: dict) -> None:
         json.dump(stats, f, indent=2)
 
 
-def run_simulations(games_per_player_count: int = 500) -> dict:
+def run_simulations(
+    games_per_player_count: int = 500,
+    seed: int = None,
+    cache: GameResultCache = None
+) -> dict:
     """Run simulations for each player count and return results."""
     results = {}
 
@@ -58,13 +65,16 @@ def run_simulations(games_per_player_count: int = 500) -> dict:
 
         config = SimulationConfig(
             num_games=games_per_player_count,
-            game_config=GameConfig(num_players=num_players),
+            game_config=GameConfig(
+                num_players=num_players,
+                seed=None if seed is None else derive_seed(seed, num_players),
+            ),
             show_progress=True,
             progress_interval=max(1, games_per_player_count // 10),
             catch_errors=True,
         )
 
-        simulator = Simulator(config=config)
+        simulator = Simulator(config=config, cache=cache)
         result = simulator.run()
 
         # Extract stats
@@ -362,6 +372,10 @@ def main():
     parser.add_argument("--order", type=str, default="desc",
                         choices=["asc", "desc"],
                         help="Sort order")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed for reproducibility")
+    parser.add_argument("--cache-dir", type=str, default=None,
+                        help="Directory for the game result cache (reused across runs with the same --seed)")
 
     args = parser.parse_args()
 
@@ -372,7 +386,10 @@ def main():
     # Run new simulations if requested
     if args.games > 0:
         print(f"\nRunning {args.games} games per player count...")
-        results = run_simulations(args.games)
+        cache = GameResultCache(args.cache_dir) if args.cache_dir else None
+        results = run_simulations(args.games, seed=args.seed, cache=cache)
+        if cache is not None:
+            print(cache.summary())
         stats = update_stats(stats, results)
         save_stats(stats)
         print(f"\nTotal games now: {stats['total_games']:,}")